@@ -4,6 +4,7 @@ JPEG metadata adapter for handling EXIF, IPTC, and XMP data.
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 import io
+import struct
 
 from PIL import Image
 from PIL.ExifTags import TAGS
@@ -15,10 +16,31 @@ from ..core.exceptions import MetadataError, UnsupportedFormatError, PixelDataCo
 from ..core.file_safety import FileSafetyManager
 from ..core.logger import logger
 
+# Byte signatures shared by the full read and the header-only probe
+_IPTC_MARKER = b'Photoshop 3.0\x008BIM'
+_XMP_NAMESPACE = b'http://ns.adobe.com/xap/1.0/\x00'
+_XMP_BEGIN = b'<?xpacket begin='
+_XMP_END = b'<?xpacket end='
+
+# JPEG markers: start of image, start of scan, end of image, APP1, APP13
+_SOI = b'\xff\xd8'
+_SOS = 0xDA
+_EOI = 0xD9
+_APP1 = 0xE1
+_APP13 = 0xED
+
+# Big-endian segment length, with the format parsed once
+_U16BE = struct.Struct('>H')
+
+# PIL tag id of the Exif sub-IFD pointer
+_EXIF_IFD_POINTER = 0x8769
+
 
 class JPEGAdapter(BaseMetadataAdapter):
     """Adapter for JPEG image metadata operations."""
 
+    SUPPORTS_BYTES_STRIP = True
+
     def __init__(self, safety_manager: Optional[FileSafetyManager] = None):
         """
         Initialize JPEG adapter.
@@ -140,8 +162,7 @@ class JPEGAdapter(BaseMetadataAdapter):
                 data = f.read()
 
             # Look for IPTC marker (Photoshop 3.0 8BIM)
-            iptc_marker = b'Photoshop 3.0\x008BIM'
-            if iptc_marker in data:
+            if _IPTC_MARKER in data:
                 logger.debug(f"IPTC data detected in {file_path}")
                 metadata.iptc.set("IPTC_Present", True)
                 # TODO: Implement full IPTC parsing if needed
@@ -156,15 +177,12 @@ class JPEGAdapter(BaseMetadataAdapter):
                 data = f.read()
 
             # Look for XMP packet
-            xmp_start = b'http://ns.adobe.com/xap/1.0/\x00'
-            xmp_begin = b'<?xpacket begin='
-
-            start_pos = data.find(xmp_start)
+            start_pos = data.find(_XMP_NAMESPACE)
             if start_pos != -1:
                 # Find the actual XMP data
-                xmp_data_start = data.find(xmp_begin, start_pos)
+                xmp_data_start = data.find(_XMP_BEGIN, start_pos)
                 if xmp_data_start != -1:
-                    xmp_end = data.find(b'<?xpacket end=', xmp_data_start)
+                    xmp_end = data.find(_XMP_END, xmp_data_start)
                     if xmp_end != -1:
                         xmp_content = data[xmp_data_start:xmp_end].decode('utf-8', errors='ignore')
                         metadata.xmp.set("XMP_Raw", xmp_content)
@@ -174,6 +192,58 @@ class JPEGAdapter(BaseMetadataAdapter):
         except Exception as e:
             logger.debug(f"Could not read XMP data: {e}")
 
+    def probe(self, file_path: Path) -> int:
+        """
+        Check for metadata and GPS data by scanning only the JPEG header segments.
+
+        Reads the APP1 (EXIF/XMP) and APP13 (IPTC) segments up to the start
+        of the compressed image data, without decoding pixels.
+
+        Args:
+            file_path: Path to JPEG file
+
+        Returns:
+            Bitwise OR of HAS_META and HAS_GPS
+        """
+        self.validate_file(file_path)
+
+        metadata = ImageMetadata(file_path=file_path, format="JPEG")
+        with open(file_path, 'rb') as f:
+            if f.read(2) != _SOI:
+                raise MetadataError(f"File is not a valid JPEG: {file_path}")
+
+            while True:
+                header = f.read(4)
+                if len(header) < 4 or header[0] != 0xFF or header[1] in (_SOS, _EOI):
+                    break
+
+                length = _U16BE.unpack_from(header, 2)[0]
+                if header[1] in (_APP1, _APP13):
+                    self._probe_segment(f.read(length - 2), metadata)
+                else:
+                    f.seek(length - 2, io.SEEK_CUR)
+
+        return self._probe_flags(metadata)
+
+    def _probe_segment(self, segment: bytes, metadata: ImageMetadata) -> None:
+        """Record the metadata keys read_metadata would set for one APPn segment."""
+        if segment.startswith(b'Exif\x00\x00'):
+            if metadata.exif.is_empty():
+                try:
+                    exif = Image.Exif()
+                    exif.load(segment)
+                    # Same tag names as the PIL pass in _read_exif_data
+                    for tag_id in (*exif, *exif.get_ifd(_EXIF_IFD_POINTER)):
+                        metadata.exif.set(f"PIL:{TAGS.get(tag_id, f'Tag_{tag_id}')}", True)
+                except Exception as e:
+                    logger.debug(f"Could not probe EXIF data: {e}")
+        elif segment.startswith(_XMP_NAMESPACE):
+            xmp_data_start = segment.find(_XMP_BEGIN)
+            if xmp_data_start != -1 and segment.find(_XMP_END, xmp_data_start) != -1:
+                metadata.xmp.set("XMP_Present", True)
+        elif _IPTC_MARKER in segment:
+            metadata.iptc.set("IPTC_Present", True)
+
     def write_metadata(self, metadata: ImageMetadata, output_path: Optional[Path] = None) -> Path:
         """
         Write metadata to JPEG file.
@@ -300,6 +370,36 @@ class JPEGAdapter(BaseMetadataAdapter):
             self.log_operation("STRIP", output_path, success=False)
             raise MetadataError(f"Failed to strip JPEG metadata: {e}")
 
+    def strip_metadata_bytes(self, data: bytes) -> bytes:
+        """
+        Remove all metadata from in-memory JPEG data.
+
+        Args:
+            data: Encoded JPEG bytes
+
+        Returns:
+            Encoded JPEG bytes without metadata
+        """
+        try:
+            with Image.open(io.BytesIO(data)) as img:
+                if img.format != 'JPEG':
+                    raise MetadataError("Data is not a valid JPEG")
+
+                # Remove all metadata by not passing exif, icc_profile, etc.
+                output = io.BytesIO()
+                img.save(output, format="JPEG", quality="keep")
+
+            stripped = output.getvalue()
+
+            # Verify JPEG integrity (more lenient for JPEG compression)
+            if not self.verify_jpeg_integrity(io.BytesIO(data), io.BytesIO(stripped)):
+                raise PixelDataCorruptionError("JPEG integrity check failed - image may be corrupted")
+
+            return stripped
+
+        except Exception as e:
+            raise MetadataError(f"Failed to strip JPEG metadata: {e}")
+
     def verify_jpeg_integrity(self, original_path: Path, modified_path: Path) -> bool:
         """
         Verify JPEG integrity using methods appropriate for lossy compression.
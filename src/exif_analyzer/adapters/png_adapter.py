@@ -3,6 +3,9 @@ PNG metadata adapter for handling tEXt, iTXt, zTXt chunks and XMP data.
 """
 from pathlib import Path
 from typing import Optional, List, Dict, Any
+import hashlib
+import io
+import mmap
 import struct
 import zlib
 
@@ -15,10 +18,19 @@ from ..core.exceptions import MetadataError, UnsupportedFormatError, PixelDataCo
 from ..core.file_safety import FileSafetyManager
 from ..core.logger import logger
 
+# Big-endian chunk length, with the format parsed once
+_U32BE = struct.Struct('>I')
+
+# Chunks that determine the decoded pixels; text, time and colour-profile
+# chunks only carry metadata
+_PIXEL_CHUNKS = frozenset((b'IHDR', b'PLTE', b'tRNS', b'IDAT'))
+
 
 class PNGAdapter(BaseMetadataAdapter):
     """Adapter for PNG image metadata operations."""
 
+    SUPPORTS_BYTES_STRIP = True
+
     def __init__(self, safety_manager: Optional[FileSafetyManager] = None):
         """
         Initialize PNG adapter.
@@ -89,9 +101,17 @@ class PNGAdapter(BaseMetadataAdapter):
                     if len(chunk_header) < 8:
                         break
 
-                    length = struct.unpack('>I', chunk_header[:4])[0]
+                    length = _U32BE.unpack_from(chunk_header)[0]
                     chunk_type = chunk_header[4:8].decode('ascii', errors='ignore')
 
+                    if chunk_type == 'IEND':
+                        break
+
+                    # Skip image data and other non-text chunks (plus CRC) without reading them
+                    if chunk_type not in ('tEXt', 'iTXt', 'zTXt'):
+                        f.seek(length + 4, io.SEEK_CUR)
+                        continue
+
                     # Read chunk data
                     chunk_data = f.read(length)
                     crc = f.read(4)  # CRC (not used for metadata)
@@ -101,14 +121,31 @@ class PNGAdapter(BaseMetadataAdapter):
                         self._process_text_chunk(chunk_data, metadata, 'tEXt')
                     elif chunk_type == 'iTXt':
                         self._process_itext_chunk(chunk_data, metadata)
-                    elif chunk_type == 'zTXt':
+                    else:
                         self._process_ztext_chunk(chunk_data, metadata)
-                    elif chunk_type == 'IEND':
-                        break
 
         except Exception as e:
             logger.debug(f"Error reading PNG chunks: {e}")
 
+    def probe(self, file_path: Path) -> int:
+        """
+        Check for metadata and GPS data by reading only the PNG text chunks.
+
+        Image data chunks are skipped with seeks, so pixels are never
+        read or decoded.
+
+        Args:
+            file_path: Path to PNG file
+
+        Returns:
+            Bitwise OR of HAS_META and HAS_GPS
+        """
+        self.validate_file(file_path)
+
+        metadata = ImageMetadata(file_path=file_path, format="PNG")
+        self._read_png_chunks(file_path, metadata)
+        return self._probe_flags(metadata)
+
     def _process_text_chunk(self, data: bytes, metadata: ImageMetadata, chunk_type: str) -> None:
         """Process tEXt chunk."""
         try:
@@ -210,6 +247,52 @@ class PNGAdapter(BaseMetadataAdapter):
         except Exception as e:
             logger.debug(f"Error reading PIL PNG metadata: {e}")
 
+    def get_structural_hash(self, file_path: Path) -> Optional[str]:
+        """
+        Hash the IHDR, PLTE, tRNS and IDAT chunks of a PNG file.
+
+        These chunks fully determine the pixels, so two files with equal
+        hashes decode to the same image whatever metadata chunks they
+        carry. Nothing is decompressed; the file is memory-mapped and other
+        chunks are never touched.
+
+        Args:
+            file_path: Path to PNG file
+
+        Returns:
+            SHA-256 hex string, or None for invalid or animated PNGs
+        """
+        hasher = hashlib.sha256()
+        try:
+            with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if data[:8] != b'\x89PNG\r\n\x1a\n':
+                    return None
+
+                # Slices of the view feed the hasher straight from the mapping
+                with memoryview(data) as view:
+                    offset = 8
+                    while offset + 8 <= len(data):
+                        length = _U32BE.unpack_from(data, offset)[0]
+                        chunk_type = data[offset + 4:offset + 8]
+
+                        if chunk_type == b'IEND':
+                            return hasher.hexdigest()
+                        if chunk_type == b'acTL':
+                            # APNG frames live in fcTL/fdAT chunks as well
+                            return None
+
+                        end = offset + 8 + length
+                        if end > len(data):
+                            return None
+                        if chunk_type in _PIXEL_CHUNKS:
+                            # Length and type are hashed too, so chunk boundaries count
+                            hasher.update(view[offset:end])
+                        offset = end + 4  # CRC
+                    return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not calculate structural hash for {file_path}: {e}")
+            return None
+
     def write_metadata(self, metadata: ImageMetadata, output_path: Optional[Path] = None) -> Path:
         """
         Write metadata to PNG file.
@@ -301,4 +384,34 @@ class PNGAdapter(BaseMetadataAdapter):
 
         except Exception as e:
             self.log_operation("STRIP", output_path, success=False)
+            raise MetadataError(f"Failed to strip PNG metadata: {e}")
+
+    def strip_metadata_bytes(self, data: bytes) -> bytes:
+        """
+        Remove all metadata from in-memory PNG data.
+
+        Args:
+            data: Encoded PNG bytes
+
+        Returns:
+            Encoded PNG bytes without metadata
+        """
+        try:
+            with Image.open(io.BytesIO(data)) as img:
+                if img.format != 'PNG':
+                    raise MetadataError("Data is not a valid PNG")
+
+                # Save without pnginfo to remove text chunks
+                output = io.BytesIO()
+                img.save(output, format="PNG")
+
+            stripped = output.getvalue()
+
+            # Verify pixel integrity
+            if not self.verify_pixel_integrity(io.BytesIO(data), io.BytesIO(stripped)):
+                raise PixelDataCorruptionError("Pixel data corrupted during metadata stripping")
+
+            return stripped
+
+        except Exception as e:
             raise MetadataError(f"Failed to strip PNG metadata: {e}")
\ No newline at end of file
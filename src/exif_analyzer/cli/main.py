@@ -7,11 +7,15 @@ from typing import Optional, List
 import sys
 import json
 
-from ..core.engine import MetadataEngine
+from ..core.engine import default_engine
 from ..core.exceptions import ExifAnalyzerError
 from ..core.logger import setup_logger
 from ..core.config import config
-from .progress import BatchProcessor, ProgressReporter, confirm_operation, StyleFormatter, validate_output_path
+from ..core.metadata import compile_key_patterns
+from .progress import (
+    BatchProcessor, ProgressReporter, confirm_operation, StyleFormatter,
+    validate_output_path, scan_directory
+)
 from .strip_handler import StripOperationHandler
 
 
@@ -60,7 +64,7 @@ def cli(ctx, verbose, quiet, config_file, no_backup, force):
 
     # Store context
     ctx.obj['logger'] = logger
-    ctx.obj['engine'] = MetadataEngine()
+    ctx.obj['engine'] = default_engine()
     ctx.obj['force'] = force
     ctx.obj['show_progress'] = config.get('batch.show_progress', True) and not quiet
 
@@ -135,6 +139,7 @@ def view(ctx, file_path: Path, output_json: bool, show_all: bool, privacy_check:
                 # Show detailed metadata if requested
                 if show_all:
                     click.echo(f"\\n{StyleFormatter.highlight('Detailed Metadata:')}")
+                    privacy_re = compile_key_patterns(tuple(pattern.lower() for pattern in config.get_privacy_patterns()))
                     for block_name, block in metadata.iter_named_blocks():
                         if not block.is_empty():
                             click.echo(f"\\n   {StyleFormatter.highlight(block_name)}:")
@@ -146,7 +151,7 @@ def view(ctx, file_path: Path, output_json: bool, show_all: bool, privacy_check:
                                     value = value[:max_len - suffix_len] + "..."
 
                                 # Highlight sensitive keys
-                                if privacy_check and any(pattern in key.lower() for pattern in config.get_privacy_patterns()):
+                                if privacy_check and privacy_re.search(key.lower()):
                                     key_display = StyleFormatter.warning(key)
                                 else:
                                     key_display = key
@@ -296,10 +301,7 @@ def strip(ctx, directory: Path, recursive: bool, pattern: str, output_dir: Optio
 
         # Find files
         click.echo(f"Scanning {directory}{'/' + pattern if pattern != '*' else ''}")
-        if recursive:
-            files = list(directory.rglob(pattern))
-        else:
-            files = list(directory.glob(pattern))
+        files = scan_directory(directory, pattern, recursive)
 
         # Filter for supported formats
         supported_formats = engine.get_supported_formats()
@@ -307,12 +309,11 @@ def strip(ctx, directory: Path, recursive: bool, pattern: str, output_dir: Optio
         skipped_files = []
 
         for file_path in files:
-            if file_path.is_file():
-                ext = file_path.suffix.lower().lstrip('.')
-                if ext in supported_formats:
-                    image_files.append(file_path)
-                elif file_path.suffix:  # Has extension but not supported
-                    skipped_files.append(file_path)
+            ext = file_path.suffix.lower().lstrip('.')
+            if ext in supported_formats:
+                image_files.append(file_path)
+            elif file_path.suffix:  # Has extension but not supported
+                skipped_files.append(file_path)
 
         if not image_files:
             click.echo(StyleFormatter.warning("No supported image files found."))
@@ -376,10 +377,11 @@ def strip(ctx, directory: Path, recursive: bool, pattern: str, output_dir: Optio
                 elif keep:
                     # Handle selective stripping
                     metadata = engine.read_metadata(file_path)
+                    keep_re = compile_key_patterns(tuple(pattern.lower() for pattern in keep))
                     for block in metadata.iter_blocks():
                         keys_to_remove = []
                         for key in block.keys():
-                            if not any(pattern.lower() in key.lower() for pattern in keep):
+                            if not keep_re.search(key.lower()):
                                 keys_to_remove.append(key)
                         for key in keys_to_remove:
                             block.remove(key)
@@ -425,7 +427,7 @@ def strip(ctx, directory: Path, recursive: bool, pattern: str, output_dir: Optio
             click.echo(f"\\n{StyleFormatter.error('Failed Files:')}")
             for file_path, result in results.items():
                 if isinstance(result, Exception):
-                    rel_path = Path(file_path).name
+                    rel_path = file_path.name
                     click.echo(f"   {rel_path}: {StyleFormatter.error(str(result))}")
 
         # Exit with error code if any failures and not continuing on error
@@ -1,9 +1,12 @@
 """
 Progress reporting utilities for CLI operations.
 """
+import fnmatch
+import os
+import sys
 import time
 from pathlib import Path
-from typing import Optional, Iterator, List, Any, Dict, Callable
+from typing import Optional, Iterator, List, Any, Dict, Callable, Union
 import click
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import Lock
@@ -24,6 +27,8 @@ class ProgressReporter:
         self._completed: int = 0
         self._total: int = 0
         self._errors: int = 0
+        self._line_format: str = ""
+        self._line_format_no_name: str = ""
 
     def start(self, total: int, operation: str = "Processing") -> None:
         """Start progress tracking."""
@@ -32,27 +37,40 @@ class ProgressReporter:
         self._total = total
         self._errors = 0
 
+        # Pre-assemble per-file line templates; only the counters change per update
+        prefix = "  [{:3d}/" + str(total) + "] {:5.1f}% - "
+        self._line_format = prefix + "{:5s} - {}\n"
+        self._line_format_no_name = prefix + "{}\n"
+
         if self.show_progress and total > 1:
             click.echo(f"{operation} {total} files...")
 
-    def update(self, filename: Optional[str] = None, error: bool = False) -> None:
-        """Update progress."""
+    def update(self, filename: Optional[Union[str, Path]] = None, error: bool = False) -> None:
+        """Update progress (thread-safe)."""
         with self._lock:
-            self._completed += 1
-            if error:
-                self._errors += 1
-
-            if self.show_progress and self._total > 1:
-                percent = (self._completed / self._total) * 100
-                status = "ERROR" if error else "OK"
-
-                if filename:
-                    filename_display = Path(filename).name
-                    if len(filename_display) > 30:
-                        filename_display = f"...{filename_display[-27:]}"
-                    click.echo(f"  [{self._completed:3d}/{self._total}] {percent:5.1f}% - {status:5s} - {filename_display}")
-                else:
-                    click.echo(f"  [{self._completed:3d}/{self._total}] {percent:5.1f}% - {status}")
+            self.update_unlocked(filename, error)
+
+    def update_unlocked(self, filename: Optional[Union[str, Path]] = None, error: bool = False) -> None:
+        """Update progress without locking; only call from a single thread."""
+        self._completed += 1
+        if error:
+            self._errors += 1
+
+        if self.show_progress and self._total > 1:
+            percent = (self._completed / self._total) * 100
+            status = "ERROR" if error else "OK"
+
+            # Plain progress lines carry no styling, so write them directly
+            # rather than through click.echo's ANSI handling
+            if filename:
+                filename_display = os.path.basename(filename)
+                if len(filename_display) > 30:
+                    filename_display = "..." + filename_display[-27:]
+                line = self._line_format.format(self._completed, percent, status, filename_display)
+            else:
+                line = self._line_format_no_name.format(self._completed, percent, status)
+            sys.stdout.write(line)
+            sys.stdout.flush()
 
     def finish(self, operation: str = "Operation") -> None:
         """Finish progress tracking and show summary."""
@@ -98,7 +116,7 @@ class BatchProcessor:
         Returns:
             Dictionary mapping file paths to results or exceptions
         """
-        results = {}
+        results: Dict[Path, Any] = {}
 
         if not files:
             click.echo("No files to process.")
@@ -111,14 +129,15 @@ class BatchProcessor:
             for file_path in files:
                 try:
                     result = operation_func(file_path, **kwargs)
-                    results[str(file_path)] = result
-                    self.progress.update(str(file_path), error=False)
+                    results[file_path] = result
+                    self.progress.update_unlocked(file_path, error=False)
                 except Exception as e:
-                    results[str(file_path)] = e
-                    self.progress.update(str(file_path), error=True)
+                    results[file_path] = e
+                    self.progress.update_unlocked(file_path, error=True)
                     logger.error(f"Failed to process {file_path}: {e}")
         else:
-            # Multi-threaded processing
+            # Multi-threaded processing; results are collected on this thread,
+            # so progress updates still need no lock
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 # Submit all tasks
                 future_to_file = {
@@ -131,11 +150,11 @@ class BatchProcessor:
                     file_path = future_to_file[future]
                     try:
                         result = future.result()
-                        results[str(file_path)] = result
-                        self.progress.update(str(file_path), error=False)
+                        results[file_path] = result
+                        self.progress.update_unlocked(file_path, error=False)
                     except Exception as e:
-                        results[str(file_path)] = e
-                        self.progress.update(str(file_path), error=True)
+                        results[file_path] = e
+                        self.progress.update_unlocked(file_path, error=True)
                         logger.error(f"Failed to process {file_path}: {e}")
 
         self.progress.finish(operation_name)
@@ -158,13 +177,14 @@ def confirm_operation(message: str, default: bool = False) -> bool:
     return response.lower().startswith('y')
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    # Every unit step is 10 bits, so the bit length picks the unit directly
+    idx = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1) if size_bytes >= 1024 else 0
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
 
 
 def format_duration(seconds: float) -> str:
@@ -179,6 +199,39 @@ def format_duration(seconds: float) -> str:
         return f"{hours:.1f}h"
 
 
+def scan_directory(directory: Path, pattern: str = "*", recursive: bool = False) -> List[Path]:
+    """
+    List regular files in a directory whose names match a glob pattern.
+
+    Uses os.scandir so file/directory checks come from the cached DirEntry
+    type instead of a separate stat call per path.
+
+    Args:
+        directory: Directory to scan
+        pattern: Filename glob pattern (e.g., "*.jpg")
+        recursive: Whether to descend into subdirectories
+
+    Returns:
+        List of matching file paths
+    """
+    # Patterns spanning directories need full glob semantics
+    if "/" in pattern or os.sep in pattern:
+        paths = directory.rglob(pattern) if recursive else directory.glob(pattern)
+        return [path for path in paths if path.is_file()]
+
+    files = []
+    pending = [str(directory)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    if fnmatch.fnmatch(entry.name, pattern):
+                        files.append(Path(entry.path))
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+    return files
+
+
 def validate_output_path(output_path: Path, input_path: Path, force: bool = False) -> bool:
     """
     Validate output path and handle conflicts.
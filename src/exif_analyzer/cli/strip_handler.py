@@ -9,7 +9,7 @@ from typing import Optional, Tuple, List
 import click
 
 from ..core.engine import MetadataEngine
-from ..core.metadata import ImageMetadata
+from ..core.metadata import ImageMetadata, compile_key_patterns
 from ..core.config import config
 from ..core.exceptions import ExifAnalyzerError
 from .progress import StyleFormatter
@@ -55,10 +55,10 @@ class StripOperationHandler:
         """Preview GPS data stripping."""
         if metadata.has_gps_data():
             sensitive_keys = metadata.get_privacy_sensitive_keys()
-            gps_keys = [
-                key for block, key in sensitive_keys
-                if any(p in key.lower() for p in ImageMetadata.GPS_PATTERNS)
-            ]
+            gps_keys = []
+            for _, key in sensitive_keys:
+                if ImageMetadata._GPS_RE.search(key.lower()):
+                    gps_keys.append(key)
             click.echo(f"Would remove {len(gps_keys)} GPS-related keys:")
             for key in gps_keys[:10]:
                 click.echo(f"  - {StyleFormatter.warning(key)}")
@@ -72,10 +72,11 @@ class StripOperationHandler:
         total_keys = sum(len(block.keys()) for block in metadata.iter_blocks())
 
         if keep:
+            keep_re = compile_key_patterns(tuple(pattern.lower() for pattern in keep))
             keep_count = len([
-                k for block in metadata.iter_blocks()
+                key for block in metadata.iter_blocks()
                 for key in block.keys()
-                if any(pattern in key.lower() for pattern in keep)
+                if keep_re.search(key.lower())
             ])
             click.echo(f"Would remove {total_keys - keep_count} of {total_keys} metadata keys")
             click.echo(f"Would keep {keep_count} keys matching: {', '.join(keep)}")
@@ -168,10 +169,11 @@ class StripOperationHandler:
         metadata = self.engine.read_metadata(file_path)
 
         # Remove non-matching keys
+        keep_re = compile_key_patterns(tuple(pattern.lower() for pattern in keep))
         for block in metadata.iter_blocks():
             keys_to_remove = []
             for key in block.keys():
-                if not any(pattern.lower() in key.lower() for pattern in keep):
+                if not keep_re.search(key.lower()):
                     keys_to_remove.append(key)
             for key in keys_to_remove:
                 block.remove(key)
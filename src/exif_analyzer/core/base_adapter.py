@@ -2,17 +2,102 @@
 Base adapter interface for format-specific metadata handlers.
 """
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from functools import cached_property, lru_cache
+import hashlib
+import itertools
+import mmap
+import os
+import stat
+import threading
 from pathlib import Path
-from typing import Optional, List, TYPE_CHECKING
+from typing import Dict, FrozenSet, Iterable, Iterator, Optional, List, Tuple, TYPE_CHECKING
 
 from .metadata import ImageMetadata
 from .exceptions import UnsupportedFormatError, MetadataError
 from .logger import logger
 
+try:
+    import blake3
+except ImportError:  # optional speedup, see the "speedups" extra
+    blake3 = None
+
 if TYPE_CHECKING:
     from .file_safety import FileSafetyManager
 
 
+def _hash_constructor(hash_algo: str):
+    """
+    Get a constructor for the named hash algorithm.
+
+    Args:
+        hash_algo: Any hashlib algorithm name, or 'blake3' when the blake3
+                   package is installed
+
+    Returns:
+        Callable taking initial data and returning a hash object
+
+    Raises:
+        ValueError: If the algorithm is unknown or not installed
+    """
+    if hash_algo == "blake3":
+        if blake3 is None:
+            raise ValueError("hash_algo 'blake3' requires the blake3 package")
+        return blake3.blake3
+    if hash_algo not in hashlib.algorithms_available:
+        raise ValueError(f"Unsupported hash algorithm: {hash_algo}")
+    return lambda data=b"": hashlib.new(hash_algo, data)
+
+
+# Characters that end a directory name; '' (a dot at the very start) counts too
+_PATH_SEPARATORS = os.sep + (os.altsep or "")
+
+
+@lru_cache(maxsize=None)
+def _log_pillow_build() -> None:
+    """Log once per process which Pillow build is decoding images."""
+    import PIL
+
+    # Pillow-SIMD releases carry a .postN suffix on the Pillow version they track
+    build = "Pillow-SIMD" if ".post" in PIL.__version__ else "Pillow"
+    logger.debug("Using %s %s for image decoding", build, PIL.__version__)
+
+
+@lru_cache(maxsize=None)
+def _strip_hash_executor():
+    """
+    Get the process-wide thread pool that hashes fast_hash strips.
+
+    One bounded pool serves every image, so hashing many images at once
+    (e.g. from get_pixel_hashes threads) does not start a pool per image.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    return ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix='strip-hash')
+
+
+# A forked child inherits the pool without its threads, so it starts its own
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_strip_hash_executor.cache_clear)
+
+
+# One adapter per class in each worker process, so its pixel hash cache is reused
+_process_adapters: Dict[type, "BaseMetadataAdapter"] = {}
+
+
+def _pixel_hash_in_process(adapter_cls: type, file_path: Path, fast_hash: bool, hash_algo: str) -> str:
+    """
+    Calculate a pixel hash in a worker process.
+
+    Module level so ProcessPoolExecutor can pickle it; adapters themselves
+    hold locks and are not picklable, so only the class is sent over.
+    """
+    adapter = _process_adapters.get(adapter_cls)
+    if adapter is None:
+        adapter = _process_adapters[adapter_cls] = adapter_cls()
+    return adapter.get_pixel_hash(file_path, fast_hash, hash_algo)
+
+
 class BaseMetadataAdapter(ABC):
     """
     Abstract base class for format-specific metadata adapters.
@@ -21,6 +106,20 @@ class BaseMetadataAdapter(ABC):
     to provide consistent metadata operations across different formats.
     """
 
+    # Strip size for fast_hash pixel hashing (fixed so hashes are portable); also
+    # the approximate size of the row bands pixels are streamed and compared in
+    PIXEL_HASH_STRIP_SIZE = 4 * 1024 * 1024
+
+    # Number of pixel hashes remembered per adapter
+    PIXEL_HASH_CACHE_SIZE = 1024
+
+    # Bit flags returned by probe()
+    HAS_META = 1
+    HAS_GPS = 2
+
+    # Whether strip_metadata_bytes is implemented
+    SUPPORTS_BYTES_STRIP = False
+
     def __init__(self, safety_manager: Optional['FileSafetyManager'] = None):
         """
         Initialize adapter with optional safety manager.
@@ -30,6 +129,12 @@ class BaseMetadataAdapter(ABC):
                            adapter operations won't use safety features.
         """
         self.safety_manager = safety_manager
+        # Pixel hashes keyed by (path, inode, ctime_ns, mtime_ns, size, fast_hash, hash_algo).
+        # A file replaced by safe_file_operation gets a new inode, so it is hashed again
+        # even where coarse timestamps leave mtime and size unchanged
+        self._pixel_hash_cache: "OrderedDict[Tuple[str, int, int, int, int, bool, str], str]" = OrderedDict()
+        self._pixel_hash_lock = threading.Lock()
+        _log_pillow_build()
 
     @property
     @abstractmethod
@@ -53,8 +158,15 @@ class BaseMetadataAdapter(ABC):
         Returns:
             True if format is supported
         """
-        suffix = file_path.suffix.lower()
-        return suffix in [f".{fmt.lower()}" for fmt in self.supported_formats]
+        # rpartition, lower and the set lookup all run in C; a dotfile like
+        # ".jpg" has no extension, so the dot must follow part of the name
+        head, _, extension = os.fspath(file_path).rpartition('.')
+        return extension.lower() in self._format_set and head[-1:] not in _PATH_SEPARATORS
+
+    @cached_property
+    def _format_set(self) -> FrozenSet[str]:
+        """Lowercased supported extensions, built on first use."""
+        return frozenset(fmt.lower() for fmt in self.supported_formats)
 
     @abstractmethod
     def read_metadata(self, file_path: Path) -> ImageMetadata:
@@ -110,22 +222,84 @@ class BaseMetadataAdapter(ABC):
         """
         pass
 
-    def validate_file(self, file_path: Path) -> None:
+    def strip_metadata_bytes(self, data: bytes) -> bytes:
+        """
+        Remove all metadata from an in-memory image.
+
+        Works entirely on bytes, so no backup or temporary file is created.
+
+        Args:
+            data: Encoded image bytes
+
+        Returns:
+            Encoded image bytes without metadata
+
+        Adapters implementing this set SUPPORTS_BYTES_STRIP to True.
+
+        Raises:
+            NotImplementedError: If the adapter has no in-memory strip path
+            MetadataError: If metadata cannot be stripped
+        """
+        raise NotImplementedError(f"In-memory stripping is not supported for {self.format_name}")
+
+    def probe(self, file_path: Path) -> int:
+        """
+        Check whether a file has metadata and GPS data without a full read.
+
+        The default implementation falls back to read_metadata; adapters
+        override it with a scan of the metadata headers only.
+
+        Args:
+            file_path: Path to the image file
+
+        Returns:
+            Bitwise OR of HAS_META and HAS_GPS
+
+        Raises:
+            MetadataError: If the file cannot be probed
+        """
+        return self._probe_flags(self.read_metadata(file_path))
+
+    @classmethod
+    def _probe_flags(cls, metadata: ImageMetadata) -> int:
+        """Convert metadata presence checks into probe() bit flags."""
+        flags = 0
+        if metadata.has_metadata():
+            flags |= cls.HAS_META
+        if metadata.has_gps_data():
+            flags |= cls.HAS_GPS
+        return flags
+
+    def validate_file(
+        self,
+        file_path: Path,
+        *,
+        stat_result: Optional[os.stat_result] = None
+    ) -> None:
         """
         Validate that file exists and is readable.
 
+        Costs one stat (skipped when stat_result is given) and one access
+        check; existence and file type both come from the stat result.
+
         Args:
             file_path: Path to validate
+            stat_result: Optional stat result already obtained by the caller
+                        (e.g. from os.scandir), which saves a stat syscall
 
         Raises:
             FileNotFoundError: If file doesn't exist
-            FilePermissionError: If file is not readable
+            MetadataError: If the path is not a regular file
             UnsupportedFormatError: If format is not supported
+            PermissionError: If file is not readable
         """
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        if stat_result is None:
+            try:
+                stat_result = os.stat(file_path)
+            except (FileNotFoundError, NotADirectoryError):
+                raise FileNotFoundError(f"File not found: {file_path}")
 
-        if not file_path.is_file():
+        if not stat.S_ISREG(stat_result.st_mode):
             raise MetadataError(f"Path is not a file: {file_path}")
 
         if not self.supports_format(file_path):
@@ -133,35 +307,264 @@ class BaseMetadataAdapter(ABC):
                 f"Format not supported by {self.format_name}: {file_path.suffix}"
             )
 
-        try:
-            with open(file_path, 'rb') as f:
-                f.read(1)  # Try to read one byte
-        except PermissionError:
+        if not os.access(file_path, os.R_OK):
             raise PermissionError(f"No read permission for file: {file_path}")
 
-    def get_pixel_hash(self, file_path: Path) -> str:
+    def get_pixel_hash(self, file_path: Path, fast_hash: bool = False, hash_algo: str = "sha256") -> str:
         """
         Calculate hash of pixel data for integrity verification.
 
+        The image's own mode, size and (for palette images) palette are
+        hashed ahead of its raw pixel bytes, so no colour conversion is
+        done. Images that differ only in mode therefore hash differently,
+        matching the mode check in verify_pixel_integrity.
+
+        Hashes are remembered per file version (path, inode, ctime, mtime
+        and size), so hashing an unchanged file again skips the decode. An
+        in-place edit that keeps the inode, size and both timestamps (e.g.
+        within one tick of a coarse-timestamp filesystem) can still hit an
+        older entry; replacing the file never does.
+
         Args:
             file_path: Path to image file
+            fast_hash: Hash fixed-size strips in parallel and return their
+                      Merkle root. The value differs from the plain hash,
+                      so both sides of a comparison must use the same mode.
+            hash_algo: Hash algorithm. SHA-256 is the portable default stored
+                       in metadata; 'blake3' (optional package) or e.g.
+                       'blake2b' are faster for local change detection.
 
         Returns:
             Hash string of pixel data
+
+        Raises:
+            ValueError: If hash_algo is unknown or not installed
         """
-        import hashlib
         from PIL import Image
 
+        new_hash = _hash_constructor(hash_algo)
+
         try:
+            stat_result = os.stat(file_path)
+            key = (
+                os.path.abspath(file_path), stat_result.st_ino, stat_result.st_ctime_ns,
+                stat_result.st_mtime_ns, stat_result.st_size, fast_hash, hash_algo
+            )
+            with self._pixel_hash_lock:
+                pixel_hash = self._pixel_hash_cache.get(key)
+                if pixel_hash is not None:
+                    self._pixel_hash_cache.move_to_end(key)
+                    return pixel_hash
+
             with Image.open(file_path) as img:
-                # Convert to consistent format for hashing
-                img_rgb = img.convert('RGB')
-                pixel_bytes = img_rgb.tobytes()
-                return hashlib.sha256(pixel_bytes).hexdigest()
+                header = self._pixel_hash_header(img)
+                if fast_hash:
+                    pixel_hash = self._parallel_strip_hash(self._pixel_bands(img), new_hash, prefix=header)
+                else:
+                    pixel_hash = self._streamed_pixel_hash(img, new_hash, prefix=header)
         except Exception as e:
             logger.warning(f"Could not calculate pixel hash for {file_path}: {e}")
             return ""
 
+        with self._pixel_hash_lock:
+            self._pixel_hash_cache[key] = pixel_hash
+            if len(self._pixel_hash_cache) > self.PIXEL_HASH_CACHE_SIZE:
+                self._pixel_hash_cache.popitem(last=False)
+        return pixel_hash
+
+    @staticmethod
+    def _pixel_hash_header(img) -> bytes:
+        """
+        Describe how an image's raw pixel bytes are to be read.
+
+        Args:
+            img: PIL image
+
+        Returns:
+            Mode and size, followed by the palette for palette images
+        """
+        header = f"{img.mode}:{img.size[0]}x{img.size[1]}:".encode()
+        if img.mode in ('P', 'PA'):
+            header += bytes(img.getpalette() or [])
+        return header
+
+    def _streamed_pixel_hash(self, img, new_hash, prefix: bytes = b"") -> str:
+        """
+        Hash an image's raw pixel bytes a band of rows at a time.
+
+        Rows are fed in order, so the digest equals hashing
+        prefix + img.tobytes(), but only one band (about
+        PIXEL_HASH_STRIP_SIZE bytes) is copied out of the decoded image at
+        once instead of the whole pixel buffer. Bands are still large
+        enough for OpenSSL's SHA-NI/AVX code paths.
+
+        Args:
+            img: PIL image in any mode
+            new_hash: Hash constructor
+            prefix: Bytes hashed ahead of the pixel data
+
+        Returns:
+            Hex string of the hash
+        """
+        hasher = new_hash(prefix)
+        for band in self._pixel_bands(img):
+            hasher.update(band)
+        return hasher.hexdigest()
+
+    def _pixel_bands(self, img) -> Iterator[bytes]:
+        """
+        Yield an image's raw pixel bytes in bands of whole rows.
+
+        Joined, the bands equal img.tobytes(); each is about
+        PIXEL_HASH_STRIP_SIZE bytes, so the full buffer is never copied out.
+
+        Args:
+            img: PIL image in any mode
+
+        Yields:
+            Raw bytes of consecutive row bands
+        """
+        width, height = img.size
+        # Four bytes per pixel bounds the common modes; bands only need to be roughly sized
+        rows = max(1, self.PIXEL_HASH_STRIP_SIZE // max(1, width * 4))
+        for top in range(0, height, rows):
+            yield img.crop((0, top, width, min(top + rows, height))).tobytes()
+
+    def get_pixel_hashes(
+        self,
+        file_paths: Iterable[Path],
+        fast_hash: bool = False,
+        hash_algo: str = "sha256",
+        max_workers: Optional[int] = None,
+        use_processes: bool = False
+    ) -> Dict[Path, str]:
+        """
+        Calculate pixel hashes for several files concurrently.
+
+        Pillow decoding and hashlib both release the GIL on large buffers,
+        so files are decoded and hashed in parallel threads. For large
+        batches of small images, where per-image Python overhead holds the
+        GIL, use_processes spreads the work across worker processes
+        instead; their results are not added to this adapter's cache.
+
+        Files are handed out largest first, so a big image is not left
+        running alone at the end of the batch, and process chunks hold
+        files of similar size.
+
+        Args:
+            file_paths: Paths to image files
+            fast_hash: Passed to get_pixel_hash
+            hash_algo: Passed to get_pixel_hash
+            max_workers: Number of threads or processes (defaults to the CPU count)
+            use_processes: Hash in a process pool instead of threads
+
+        Returns:
+            Dictionary mapping each path, in the given order, to its hash
+            ("" if it could not be hashed)
+
+        Raises:
+            ValueError: If hash_algo is unknown or not installed
+        """
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        file_paths = list(file_paths)
+        _hash_constructor(hash_algo)  # Fail fast instead of once per file
+        if len(file_paths) <= 1:
+            return {path: self.get_pixel_hash(path, fast_hash, hash_algo) for path in file_paths}
+
+        workers = min(len(file_paths), max_workers or os.cpu_count() or 1)
+        largest_first = sorted(file_paths, key=self._file_size, reverse=True)
+        if use_processes:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                hashes = dict(zip(largest_first, executor.map(
+                    _pixel_hash_in_process,
+                    itertools.repeat(type(self)), largest_first,
+                    itertools.repeat(fast_hash), itertools.repeat(hash_algo),
+                    chunksize=4
+                )))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                hashes = dict(zip(largest_first, executor.map(
+                    lambda path: self.get_pixel_hash(path, fast_hash, hash_algo), largest_first
+                )))
+        return {path: hashes[path] for path in file_paths}
+
+    @staticmethod
+    def _file_size(file_path: Path) -> int:
+        """Size of a file in bytes, or 0 if it cannot be read."""
+        try:
+            return os.stat(file_path).st_size
+        except OSError:
+            return 0
+
+    def _parallel_strip_hash(
+        self,
+        chunks: Iterable[bytes],
+        new_hash=hashlib.sha256,
+        prefix: bytes = b""
+    ) -> str:
+        """
+        Hash data as a Merkle root over fixed-size strips.
+
+        hashlib releases the GIL for large updates, so strips are hashed
+        concurrently on the shared strip hashing pool. Strip size is fixed
+        (not derived from the CPU count or the chunking) so the result is
+        the same on every machine. Chunks are consumed as strips are hashed,
+        so at most a few strips per thread are held in memory at once.
+
+        Args:
+            chunks: Consecutive pieces of the data to hash
+            new_hash: Hash constructor used for the strips and the root
+            prefix: Bytes hashed into the root ahead of the strip digests
+
+        Returns:
+            Hex string of the root hash
+        """
+        strips = self._fixed_strips(chunks, self.PIXEL_HASH_STRIP_SIZE)
+        first = next(strips, b"")
+        second = next(strips, None)
+
+        if second is None:
+            digests = [new_hash(first).digest()]
+        else:
+            executor = _strip_hash_executor()
+            workers = os.cpu_count() or 1
+            digests = []
+            pending = deque()
+            for strip in itertools.chain((first, second), strips):
+                if len(pending) >= 2 * workers:
+                    digests.append(pending.popleft().result())
+                pending.append(executor.submit(lambda data: new_hash(data).digest(), strip))
+            digests.extend(future.result() for future in pending)
+
+        return new_hash(prefix + b"".join(digests)).hexdigest()
+
+    @staticmethod
+    def _fixed_strips(chunks: Iterable[bytes], strip_size: int) -> Iterator[bytes]:
+        """
+        Regroup a stream of byte chunks into strips of exactly strip_size bytes.
+
+        Args:
+            chunks: Consecutive pieces of the data
+            strip_size: Size of every strip but the last
+
+        Yields:
+            Strips of the data, in order
+        """
+        buffer = bytearray()
+        for chunk in chunks:
+            buffer += chunk
+            if len(buffer) >= strip_size:
+                view = memoryview(buffer)
+                start = 0
+                while len(buffer) - start >= strip_size:
+                    yield bytes(view[start:start + strip_size])
+                    start += strip_size
+                view.release()
+                del buffer[:start]
+        if buffer:
+            yield bytes(buffer)
+
     def _check_image_dimensions_and_mode(self, orig_img, mod_img) -> bool:
         """
         Check that image dimensions and mode are preserved.
@@ -183,10 +586,107 @@ class BaseMetadataAdapter(ABC):
 
         return True
 
+    def _pixels_equal_streamed(self, original_path: Path, modified_path: Path) -> bool:
+        """
+        Compare the pixel data of two images band by band.
+
+        Bands come from _pixel_bands, so they hold about
+        PIXEL_HASH_STRIP_SIZE bytes whatever the image width, keeping the
+        number of Python-level iterations low. Each pair is compared with a
+        plain bytes equality check (a memcmp, which stops at the first
+        differing byte) and the scan stops at the first mismatching band,
+        so no hashing is needed. Images of the same mode are compared in
+        that mode, which skips converting both to RGB; palette images are
+        still converted because equal indices mean nothing if the palettes
+        differ.
+
+        Args:
+            original_path: Path to original image
+            modified_path: Path to modified image
+
+        Returns:
+            True if pixel data is identical
+        """
+        from PIL import Image
+
+        with Image.open(original_path) as orig, Image.open(modified_path) as mod:
+            if orig.size != mod.size:
+                return False
+
+            if orig.mode == mod.mode and orig.mode not in ('P', 'PA'):
+                orig_cmp, mod_cmp = orig, mod
+            else:
+                orig_cmp = orig.convert('RGB')
+                mod_cmp = mod.convert('RGB')
+
+            # Same size and mode, so both images split into identical bands
+            for orig_band, mod_band in zip(self._pixel_bands(orig_cmp), self._pixel_bands(mod_cmp)):
+                if orig_band != mod_band:
+                    return False
+
+            return True
+
+    def get_structural_hash(self, file_path: Path) -> Optional[str]:
+        """
+        Hash the encoded image data of a file without decoding it.
+
+        Formats whose pixels are fully determined by a few container
+        chunks can override this to hash just those chunks. Equal
+        structural hashes mean equal pixels; different ones prove nothing,
+        since the same pixels can be encoded in many ways.
+
+        Args:
+            file_path: Path to image file
+
+        Returns:
+            Hex string of the hash, or None if the format (or this file)
+            has no structural hash
+        """
+        return None
+
+    def _structurally_equal(self, original_path: Path, modified_path: Path) -> bool:
+        """Check whether two image files carry byte-identical image data."""
+        original_hash = self.get_structural_hash(original_path)
+        return original_hash is not None and original_hash == self.get_structural_hash(modified_path)
+
+    def _files_identical(self, original_path: Path, modified_path: Path) -> bool:
+        """
+        Check whether two files have identical bytes.
+
+        Sizes are compared first, so differing files usually cost one stat
+        each. Equal-sized files are memory-mapped and compared in slices,
+        reading straight from the page cache without per-read buffers.
+
+        Args:
+            original_path: Path to first file
+            modified_path: Path to second file
+
+        Returns:
+            True if both files hold the same bytes
+        """
+        original_stat = os.stat(original_path)
+        modified_stat = os.stat(modified_path)
+        if original_stat.st_size != modified_stat.st_size:
+            return False
+        if os.path.samestat(original_stat, modified_stat) or original_stat.st_size == 0:
+            return True
+
+        step = self.PIXEL_HASH_STRIP_SIZE
+        with open(original_path, 'rb') as f1, open(modified_path, 'rb') as f2:
+            with mmap.mmap(f1.fileno(), 0, access=mmap.ACCESS_READ) as m1, \
+                    mmap.mmap(f2.fileno(), 0, access=mmap.ACCESS_READ) as m2:
+                for start in range(0, original_stat.st_size, step):
+                    if m1[start:start + step] != m2[start:start + step]:
+                        return False
+        return True
+
     def verify_pixel_integrity(self, original_path: Path, modified_path: Path) -> bool:
         """
         Verify that pixel data hasn't been corrupted.
 
+        Byte-identical files, and files whose structural hashes match, are
+        accepted without decoding; otherwise pixels are decoded and compared.
+
         Args:
             original_path: Path to original image
             modified_path: Path to modified image
@@ -195,9 +695,13 @@ class BaseMetadataAdapter(ABC):
             True if pixel data is identical
         """
         try:
-            original_hash = self.get_pixel_hash(original_path)
-            modified_hash = self.get_pixel_hash(modified_path)
-            return original_hash == modified_hash and original_hash != ""
+            # The shortcuts need real files; in-memory streams go straight to decoding
+            if isinstance(original_path, (str, os.PathLike)) and isinstance(modified_path, (str, os.PathLike)):
+                if self._files_identical(original_path, modified_path):
+                    return True
+                if self._structurally_equal(original_path, modified_path):
+                    return True
+            return self._pixels_equal_streamed(original_path, modified_path)
         except Exception as e:
             logger.error(f"Pixel integrity check failed: {e}")
             return False
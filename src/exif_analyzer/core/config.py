@@ -2,6 +2,7 @@
 Configuration management for ExifAnalyzer.
 """
 import copy
+import functools
 import json
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
@@ -11,6 +12,17 @@ from .exceptions import ValidationError
 from .logger import logger
 
 
+@functools.lru_cache(maxsize=1)
+def _get_user_config_path() -> Path:
+    """Get user-specific configuration file path (resolution only, no I/O)."""
+    if os.name == 'nt':  # Windows
+        config_dir = Path(os.environ.get('APPDATA', Path.home())) / "ExifAnalyzer"
+    else:  # macOS/Linux
+        config_dir = Path.home() / ".config" / "exifanalyzer"
+
+    return config_dir / "config.json"
+
+
 class ConfigManager:
     """
     Manages configuration settings for ExifAnalyzer.
@@ -53,31 +65,35 @@ class ConfigManager:
             "max_value_length": 100,  # Maximum characters to display for metadata values
             "truncation_suffix_length": 3,  # Length of "..." suffix
             "preview_image_size": 300,  # Size in pixels for GUI image preview
+            "preview_use_draft": True,  # Decode JPEG previews at reduced scale
+            "preview_cache_size": 256,  # Rendered previews kept in memory by the GUI
+            "preview_disk_cache": False,  # Also keep rendered previews in the user cache directory
+            "preview_disk_cache_size": 512,  # Previews kept on disk; least recently used are pruned
+            "selection_debounce_ms": 50,  # Delay before loading metadata of a newly selected file
+            "preview_debounce_ms": 150,  # Delay before decoding the preview of a newly selected file
+            "show_all_files": False,  # List every folder entry in the GUI, not just supported images
+            "prefetch_header_bytes": 65536,  # Bytes of each listed image to warm in the OS cache (0 disables)
+            "metadata_cache": False,  # Keep parsed metadata of seen files in the user cache directory
+            "metadata_cache_size": 1000,  # Files kept in the metadata cache; least recently used are evicted
             "status_bar_width": 50  # Width of status bar in GUI
         },
         "integrity": {
             "jpeg_mse_threshold": 2.0,  # Max acceptable MSE for JPEG integrity check
             "file_size_change_ratio": 0.1,  # Max acceptable file size change (10%)
-            "file_hash_chunk_size": 4096  # Chunk size in bytes for file hashing
+            "file_hash_chunk_size": 1048576  # Chunk size in bytes for file hashing (pre-3.11 fallback)
         }
     }
 
     def __init__(self):
         """Initialize configuration manager."""
-        self.user_config_path = self._get_user_config_path()
+        self.user_config_path = _get_user_config_path()
         self.project_config_path = Path.cwd() / ".exifanalyzer.json"
         self._config = copy.deepcopy(self.DEFAULT_CONFIG)
         self._load_config()
 
-    def _get_user_config_path(self) -> Path:
-        """Get user-specific configuration file path."""
-        if os.name == 'nt':  # Windows
-            config_dir = Path(os.environ.get('APPDATA', Path.home())) / "ExifAnalyzer"
-        else:  # macOS/Linux
-            config_dir = Path.home() / ".config" / "exifanalyzer"
-
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return config_dir / "config.json"
+    def _ensure_user_config_dir(self) -> None:
+        """Create the user config directory; only needed when saving."""
+        self.user_config_path.parent.mkdir(parents=True, exist_ok=True)
 
     def _load_config(self) -> None:
         """Load configuration from files."""
@@ -103,15 +119,14 @@ class ConfigManager:
 
     def _merge_config(self, new_config: Dict[str, Any]) -> None:
         """Merge new configuration with existing configuration."""
-        def deep_merge(base: Dict, update: Dict) -> Dict:
+        stack = [(self._config, new_config)]
+        while stack:
+            base, update = stack.pop()
             for key, value in update.items():
-                if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                    deep_merge(base[key], value)
+                if isinstance(value, dict) and isinstance(base.get(key), dict):
+                    stack.append((base[key], value))
                 else:
                     base[key] = value
-            return base
-
-        deep_merge(self._config, new_config)
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -156,7 +171,7 @@ class ConfigManager:
     def save_user_config(self) -> None:
         """Save current configuration to user config file."""
         try:
-            self.user_config_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_user_config_dir()
             with open(self.user_config_path, 'w') as f:
                 json.dump(self._config, f, indent=2)
             logger.info(f"Saved user configuration to {self.user_config_path}")
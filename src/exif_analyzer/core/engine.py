@@ -1,10 +1,17 @@
 """
 Core metadata engine that orchestrates format-specific adapters.
 """
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Type, Union
+from typing import Optional, List, Dict, Type, Union, Any, BinaryIO, Iterable, Tuple
+import functools
+import importlib
+import io
+import math
 import mimetypes
+import os
 import json
+import threading
 
 from .base_adapter import BaseMetadataAdapter
 from .metadata import ImageMetadata
@@ -12,12 +19,90 @@ from .exceptions import UnsupportedFormatError, MetadataError, FileError
 from .file_safety import FileSafetyManager
 from .logger import logger
 
-# Import adapters
-from ..adapters.jpeg_adapter import JPEGAdapter
-from ..adapters.png_adapter import PNGAdapter
-from ..adapters.webp_adapter import WebPAdapter
-from ..adapters.gif_adapter import GIFAdapter
-from ..adapters.tiff_adapter import TIFFAdapter
+# Built-in adapters by extension, imported on first use: (module, class name).
+# Deferring the imports keeps Pillow/piexif out of engine import and only loads
+# the formats a run actually touches.
+_BUILTIN_ADAPTERS: Dict[str, Tuple[str, str]] = {
+    'jpg': ('jpeg_adapter', 'JPEGAdapter'),
+    'jpeg': ('jpeg_adapter', 'JPEGAdapter'),
+    'jpe': ('jpeg_adapter', 'JPEGAdapter'),
+    'jfif': ('jpeg_adapter', 'JPEGAdapter'),
+    'png': ('png_adapter', 'PNGAdapter'),
+    'webp': ('webp_adapter', 'WebPAdapter'),
+    'gif': ('gif_adapter', 'GIFAdapter'),
+    'tiff': ('tiff_adapter', 'TIFFAdapter'),
+    'tif': ('tiff_adapter', 'TIFFAdapter'),
+}
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    orjson = None
+
+# Common MIME types for known format extensions
+_FORMAT_TO_MIME = {
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'png': 'image/png',
+    'tiff': 'image/tiff',
+    'tif': 'image/tiff',
+    'webp': 'image/webp',
+    'gif': 'image/gif'
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _guess_mime_by_suffix(suffix: str) -> Optional[str]:
+    """Guess a MIME type from a lowercased file suffix (e.g. '.jpg')."""
+    return mimetypes.guess_type("x" + suffix)[0]
+
+
+def _is_same_file(path: Path, other: Path) -> bool:
+    """
+    Check whether two paths name the same existing file.
+
+    Equal paths short-circuit without touching the filesystem; otherwise the
+    files are compared by device and inode, so a differently spelled path to
+    the original still counts as overwriting it.
+    """
+    if path == other:
+        return True
+    try:
+        return os.path.samefile(path, other)
+    except OSError:
+        return False
+
+
+# Write buffer for metadata exports; coalesces the stdlib encoder's small chunks
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+
+def _write_json(data: Dict[str, Any], f: BinaryIO) -> None:
+    """Write exported metadata as UTF-8 JSON to a binary file, using orjson when installed."""
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; nothing is written yet, so fall back
+        else:
+            f.write(encoded)
+            return
+
+    # Stream encoder chunks into the file's buffer instead of building one string
+    text = io.TextIOWrapper(f, encoding='utf-8', write_through=True)
+    json.dump(data, text, indent=2, default=str)
+    text.detach()
+
+
+def _load_json_bytes(raw: bytes) -> Any:
+    """Parse UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 class MetadataEngine:
@@ -28,51 +113,73 @@ class MetadataEngine:
 
     def __init__(self):
         """Initialize metadata engine with available adapters."""
+        # Adapters loaded so far; built-in adapters are added on first use
         self.adapters: Dict[str, BaseMetadataAdapter] = {}
         self.safety_manager = FileSafetyManager()
         self._mime_to_format: Dict[str, str] = {}
+        self._lazy_adapters: Dict[str, Tuple[str, str]] = {}
+        self._load_lock = threading.Lock()
 
         # Register built-in adapters
         self._register_adapters()
+        self._refresh_lookup_tables()
 
     def _register_adapters(self) -> None:
-        """Register all available format adapters with shared safety manager."""
-        adapters = [
-            JPEGAdapter(safety_manager=self.safety_manager),
-            PNGAdapter(safety_manager=self.safety_manager),
-            WebPAdapter(safety_manager=self.safety_manager),
-            GIFAdapter(safety_manager=self.safety_manager),
-            TIFFAdapter(safety_manager=self.safety_manager),
-        ]
+        """Register built-in format adapters for lazy loading."""
+        self._lazy_adapters.update(_BUILTIN_ADAPTERS)
 
-        for adapter in adapters:
-            for format_ext in adapter.supported_formats:
-                self.adapters[format_ext.lower()] = adapter
-                logger.debug(f"Registered {adapter.format_name} adapter for .{format_ext}")
+        # Build MIME type mapping from the built-in extensions
+        self._build_mime_map(_BUILTIN_ADAPTERS)
 
-            # Build MIME type mapping dynamically from registered adapters
-            self._build_mime_map(adapter)
+    def _load_builtin_adapter(self, extension: str) -> BaseMetadataAdapter:
+        """
+        Import and instantiate the built-in adapter for an extension.
+
+        Args:
+            extension: Lowercase extension without the leading dot
 
-    def _build_mime_map(self, adapter: BaseMetadataAdapter) -> None:
+        Returns:
+            The loaded adapter, now registered for all its pending extensions
+        """
+        with self._load_lock:
+            adapter = self.adapters.get(extension)
+            if adapter is not None:
+                return adapter
+
+            spec = self._lazy_adapters[extension]
+            module_name, class_name = spec
+            module = importlib.import_module(f"..adapters.{module_name}", __package__)
+            adapter = getattr(module, class_name)(safety_manager=self.safety_manager)
+
+            # Claim every extension still waiting on this adapter; extensions
+            # already taken by a custom adapter keep it
+            for format_ext in adapter.supported_formats:
+                format_ext = format_ext.lower()
+                if self._lazy_adapters.get(format_ext) == spec:
+                    del self._lazy_adapters[format_ext]
+                    self.adapters[format_ext] = adapter
+                    logger.debug("Registered %s adapter for .%s", adapter.format_name, format_ext)
+
+            self._refresh_lookup_tables()
+            return adapter
+
+    def _adapter_for_extension(self, extension: str) -> Optional[BaseMetadataAdapter]:
+        """Get the adapter for a lowercase extension, loading a built-in one if needed."""
+        adapter = self.adapters.get(extension)
+        if adapter is None and extension in self._lazy_adapters:
+            adapter = self._load_builtin_adapter(extension)
+        return adapter
+
+    def _build_mime_map(self, format_exts: Iterable[str]) -> None:
         """
-        Build MIME type to format extension mapping from adapter.
+        Build MIME type to format extension mapping.
 
         Args:
-            adapter: Adapter to build mapping from
+            format_exts: Format extensions to build mapping from
         """
         # Map common MIME types to first supported format extension
-        format_to_mime = {
-            'jpg': 'image/jpeg',
-            'jpeg': 'image/jpeg',
-            'png': 'image/png',
-            'tiff': 'image/tiff',
-            'tif': 'image/tiff',
-            'webp': 'image/webp',
-            'gif': 'image/gif'
-        }
-
-        for format_ext in adapter.supported_formats:
-            mime_type = format_to_mime.get(format_ext.lower())
+        for format_ext in format_exts:
+            mime_type = _FORMAT_TO_MIME.get(format_ext.lower())
             if mime_type and mime_type not in self._mime_to_format:
                 self._mime_to_format[mime_type] = format_ext.lower()
 
@@ -85,10 +192,22 @@ class MetadataEngine:
         """
         for format_ext in adapter.supported_formats:
             self.adapters[format_ext.lower()] = adapter
-            logger.info(f"Registered custom {adapter.format_name} adapter for .{format_ext}")
+            self._lazy_adapters.pop(format_ext.lower(), None)
+            logger.info("Registered custom %s adapter for .%s", adapter.format_name, format_ext)
 
         # Update MIME mapping for custom adapter
-        self._build_mime_map(adapter)
+        self._build_mime_map(adapter.supported_formats)
+        self._refresh_lookup_tables()
+
+    def _refresh_lookup_tables(self) -> None:
+        """Rebuild lookup tables derived from the registered adapters."""
+        self._supported_formats = tuple(sorted(set(self.adapters) | set(self._lazy_adapters)))
+        # Resolve MIME types straight to loaded adapters so the fallback is one lookup
+        self._mime_to_adapter: Dict[str, BaseMetadataAdapter] = {
+            mime_type: self.adapters[format_ext]
+            for mime_type, format_ext in self._mime_to_format.items()
+            if format_ext in self.adapters
+        }
 
     def get_adapter(self, file_path: Path) -> BaseMetadataAdapter:
         """
@@ -102,23 +221,31 @@ class MetadataEngine:
 
         Raises:
             UnsupportedFormatError: If format is not supported
-        """
-        if not file_path.exists():
-            raise FileError(f"File not found: {file_path}")
+            FileError: If the extension is unknown and the file does not exist
 
+        Note:
+            A known extension is resolved without touching the filesystem;
+            the adapter reports a missing file when it opens it.
+        """
         # Get file extension
-        extension = file_path.suffix.lower().lstrip('.')
+        extension = file_path.suffix[1:].lower()
 
         # Try direct extension lookup
-        if extension in self.adapters:
-            return self.adapters[extension]
+        adapter = self._adapter_for_extension(extension)
+        if adapter is not None:
+            return adapter
+
+        if not file_path.exists():
+            raise FileError(f"File not found: {file_path}")
 
         # Try MIME type detection as fallback
-        mime_type, _ = mimetypes.guess_type(str(file_path))
+        mime_type = _guess_mime_by_suffix(file_path.suffix.lower())
         if mime_type:
-            mapped_format = self._mime_to_format.get(mime_type)
-            if mapped_format and mapped_format in self.adapters:
-                return self.adapters[mapped_format]
+            adapter = self._mime_to_adapter.get(mime_type)
+            if adapter is None and mime_type in self._mime_to_format:
+                adapter = self._adapter_for_extension(self._mime_to_format[mime_type])
+            if adapter is not None:
+                return adapter
 
         raise UnsupportedFormatError(f"No adapter available for format: {extension}")
 
@@ -137,14 +264,15 @@ class MetadataEngine:
             MetadataError: If metadata cannot be read
             FileError: If file cannot be accessed
         """
-        file_path = Path(file_path)
+        if not isinstance(file_path, Path):
+            file_path = Path(file_path)
         adapter = self.get_adapter(file_path)
 
         try:
-            logger.info(f"Reading metadata from {file_path} using {adapter.format_name} adapter")
+            logger.info("Reading metadata from %s using %s adapter", file_path, adapter.format_name)
             return adapter.read_metadata(file_path)
         except Exception as e:
-            logger.error(f"Failed to read metadata from {file_path}: {e}")
+            logger.error("Failed to read metadata from %s: %s", file_path, e)
             raise
 
     def write_metadata(
@@ -168,22 +296,22 @@ class MetadataEngine:
             UnsupportedFormatError: If format is not supported
             MetadataError: If metadata cannot be written
         """
-        if output_path:
-            output_path = Path(output_path)
-        else:
+        if not output_path:
             output_path = metadata.file_path
+        elif not isinstance(output_path, Path):
+            output_path = Path(output_path)
 
         adapter = self.get_adapter(metadata.file_path)
 
         # Create backup if requested and output overwrites original
-        if create_backup and output_path == metadata.file_path:
+        if create_backup and _is_same_file(output_path, metadata.file_path):
             self.safety_manager.create_backup(metadata.file_path)
 
         try:
-            logger.info(f"Writing metadata to {output_path} using {adapter.format_name} adapter")
+            logger.info("Writing metadata to %s using %s adapter", output_path, adapter.format_name)
             return adapter.write_metadata(metadata, output_path)
         except Exception as e:
-            logger.error(f"Failed to write metadata to {output_path}: {e}")
+            logger.error("Failed to write metadata to %s: %s", output_path, e)
             raise
 
     def strip_metadata(
@@ -207,24 +335,58 @@ class MetadataEngine:
             UnsupportedFormatError: If format is not supported
             MetadataError: If metadata cannot be stripped
         """
-        file_path = Path(file_path)
+        if not isinstance(file_path, Path):
+            file_path = Path(file_path)
 
-        if output_path:
-            output_path = Path(output_path)
-        else:
+        if not output_path:
             output_path = file_path
+        elif not isinstance(output_path, Path):
+            output_path = Path(output_path)
 
         adapter = self.get_adapter(file_path)
 
         # Create backup if requested and output overwrites original
-        if create_backup and output_path == file_path:
+        if create_backup and _is_same_file(output_path, file_path):
             self.safety_manager.create_backup(file_path)
 
         try:
-            logger.info(f"Stripping metadata from {file_path} using {adapter.format_name} adapter")
+            logger.info("Stripping metadata from %s using %s adapter", file_path, adapter.format_name)
             return adapter.strip_metadata(file_path, output_path)
         except Exception as e:
-            logger.error(f"Failed to strip metadata from {file_path}: {e}")
+            logger.error("Failed to strip metadata from %s: %s", file_path, e)
+            raise
+
+    def strip_metadata_bytes(self, data: bytes, fmt: str) -> bytes:
+        """
+        Remove all metadata from an in-memory image.
+
+        No files are read or written and no backup is made, which suits
+        callers that already hold the image bytes (e.g. an upload handler).
+
+        Args:
+            data: Encoded image bytes
+            fmt: Format extension of the data (e.g. 'jpg' or '.png')
+
+        Returns:
+            Encoded image bytes without metadata
+
+        Raises:
+            UnsupportedFormatError: If format is not supported or cannot be
+                                    stripped in memory
+            MetadataError: If metadata cannot be stripped
+        """
+        extension = fmt[1:].lower() if fmt.startswith('.') else fmt.lower()
+        adapter = self._adapter_for_extension(extension)
+        if adapter is None:
+            raise UnsupportedFormatError(f"No adapter available for format: {extension}")
+        if not adapter.SUPPORTS_BYTES_STRIP:
+            raise UnsupportedFormatError(f"In-memory stripping not supported for {extension}")
+
+        try:
+            logger.info("Stripping metadata from %d bytes using %s adapter", len(data), adapter.format_name)
+            return adapter.strip_metadata_bytes(data)
+        except Exception as e:
+            logger.error("Failed to strip metadata from in-memory %s data: %s", adapter.format_name, e)
             raise
 
     def strip_gps_data(
@@ -244,21 +406,45 @@ class MetadataEngine:
         Returns:
             Path to output file
         """
-        # Read current metadata
-        metadata = self.read_metadata(file_path)
+        if not isinstance(file_path, Path):
+            file_path = Path(file_path)
+
+        if not output_path:
+            output_path = file_path
+        elif not isinstance(output_path, Path):
+            output_path = Path(output_path)
+
+        # Resolve the adapter once and use it for both the read and the write
+        adapter = self.get_adapter(file_path)
+
+        try:
+            logger.info("Reading metadata from %s using %s adapter", file_path, adapter.format_name)
+            metadata = adapter.read_metadata(file_path)
+        except Exception as e:
+            logger.error("Failed to read metadata from %s: %s", file_path, e)
+            raise
 
         # Strip GPS data
         removed_count = metadata.strip_gps_data()
-        logger.info(f"Removed {removed_count} GPS-related metadata entries")
+        logger.info("Removed %d GPS-related metadata entries", removed_count)
 
-        # Write back modified metadata
-        return self.write_metadata(metadata, output_path, create_backup)
+        # Create backup if requested and output overwrites original
+        if create_backup and _is_same_file(output_path, file_path):
+            self.safety_manager.create_backup(file_path)
+
+        try:
+            logger.info("Writing metadata to %s using %s adapter", output_path, adapter.format_name)
+            return adapter.write_metadata(metadata, output_path)
+        except Exception as e:
+            logger.error("Failed to write metadata to %s: %s", output_path, e)
+            raise
 
     def export_metadata(
         self,
         file_path: Union[str, Path],
         export_path: Union[str, Path],
-        format: str = "json"
+        format: str = "json",
+        metadata: Optional[ImageMetadata] = None
     ) -> Path:
         """
         Export metadata to external file.
@@ -267,23 +453,26 @@ class MetadataEngine:
             file_path: Path to image file
             export_path: Path for exported metadata
             format: Export format ('json' or 'xmp')
+            metadata: Metadata already read from file_path; read from the file if omitted
 
         Returns:
             Path to exported metadata file
         """
-        metadata = self.read_metadata(file_path)
-        export_path = Path(export_path)
+        if metadata is None:
+            metadata = self.read_metadata(file_path)
+        if not isinstance(export_path, Path):
+            export_path = Path(export_path)
 
         if format.lower() == "json":
-            with open(export_path, 'w', encoding='utf-8') as f:
-                f.write(metadata.to_json())
+            with open(export_path, 'wb', buffering=_EXPORT_BUFFER_SIZE) as f:
+                _write_json(metadata.to_dict(), f)
         elif format.lower() == "xmp":
             # TODO: Implement XMP export
             raise NotImplementedError("XMP export not yet implemented")
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
-        logger.info(f"Exported metadata to {export_path} in {format} format")
+        logger.info("Exported metadata to %s in %s format", export_path, format)
         return export_path
 
     def restore_metadata(
@@ -303,25 +492,28 @@ class MetadataEngine:
         Returns:
             Path to modified image file
         """
-        metadata_path = Path(metadata_path)
+        if not isinstance(metadata_path, Path):
+            metadata_path = Path(metadata_path)
 
         # Load and parse metadata from file
         if metadata_path.suffix.lower() == '.json':
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                metadata_dict = json.load(f)
+            with open(metadata_path, 'rb') as f:
+                metadata_dict = _load_json_bytes(f.read())
             restored_metadata = ImageMetadata.from_dict(metadata_dict)
         else:
             raise ValueError(f"Unsupported metadata format: {metadata_path.suffix}")
 
         # Update file path to target file
-        restored_metadata.file_path = Path(file_path)
+        if not isinstance(file_path, Path):
+            file_path = Path(file_path)
+        restored_metadata.file_path = file_path
 
         # Write metadata
         return self.write_metadata(restored_metadata, create_backup=create_backup)
 
     def get_supported_formats(self) -> List[str]:
         """Get list of supported image formats."""
-        return list(set(self.adapters.keys()))
+        return list(self._supported_formats)
 
     def has_metadata(self, file_path: Union[str, Path]) -> bool:
         """
@@ -334,8 +526,10 @@ class MetadataEngine:
             True if file has metadata
         """
         try:
-            metadata = self.read_metadata(file_path)
-            return metadata.has_metadata()
+            if not isinstance(file_path, Path):
+                file_path = Path(file_path)
+            adapter = self.get_adapter(file_path)
+            return adapter.probe(file_path) & adapter.HAS_META != 0
         except Exception:
             return False
 
@@ -350,8 +544,10 @@ class MetadataEngine:
             True if file has GPS data
         """
         try:
-            metadata = self.read_metadata(file_path)
-            return metadata.has_gps_data()
+            if not isinstance(file_path, Path):
+                file_path = Path(file_path)
+            adapter = self.get_adapter(file_path)
+            return adapter.probe(file_path) & adapter.HAS_GPS != 0
         except Exception:
             return False
 
@@ -360,6 +556,8 @@ class MetadataEngine:
         input_paths: List[Union[str, Path]],
         operation: str,
         output_dir: Optional[Path] = None,
+        workers: Optional[int] = None,
+        concurrency: Optional[int] = None,
         **kwargs
     ) -> Dict[str, Union[Path, Exception]]:
         """
@@ -369,43 +567,115 @@ class MetadataEngine:
             input_paths: List of input file paths
             operation: Operation to perform ('strip', 'strip_gps', 'export')
             output_dir: Optional output directory for batch operations
+            workers: Number of worker processes. None or 1 processes files
+                     serially in this process. Workers use their own engine
+                     with the built-in adapters only.
+            concurrency: Number of files processed at once on threads in this
+                         process when not using worker processes, so one
+                         file's backup copy overlaps the next file's read.
+                         None or 1 processes files one at a time.
             **kwargs: Additional arguments for the operation
 
         Returns:
             Dictionary mapping input paths to results (Path or Exception)
         """
-        results = {}
-
-        for input_path in input_paths:
-            input_path = Path(input_path)
+        paths = [
+            input_path if isinstance(input_path, Path) else Path(input_path)
+            for input_path in input_paths
+        ]
 
-            try:
-                if operation == "strip":
-                    output_path = output_dir / input_path.name if output_dir else None
-                    result = self.strip_metadata(input_path, output_path, **kwargs)
-                elif operation == "strip_gps":
-                    output_path = output_dir / input_path.name if output_dir else None
-                    result = self.strip_gps_data(input_path, output_path, **kwargs)
-                elif operation == "export":
-                    export_name = f"{input_path.stem}_metadata.json"
-                    export_path = output_dir / export_name if output_dir else input_path.parent / export_name
-                    result = self.export_metadata(input_path, export_path, **kwargs)
-                else:
-                    raise ValueError(f"Unknown batch operation: {operation}")
+        if workers is None or workers <= 1 or len(paths) <= 1:
+            if concurrency and concurrency > 1 and len(paths) > 1:
+                # A pool of exactly `concurrency` threads; no event loop is
+                # involved, so callers already running one can use it too
+                with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='batch') as executor:
+                    outcomes = executor.map(
+                        self._run_batch_operation,
+                        paths,
+                        [operation] * len(paths),
+                        [output_dir] * len(paths),
+                        [kwargs] * len(paths)
+                    )
+                    return {str(input_path): outcome for input_path, outcome in zip(paths, outcomes)}
+            return {
+                str(input_path): self._run_batch_operation(input_path, operation, output_dir, kwargs)
+                for input_path in paths
+            }
+
+        # One contiguous chunk per worker keeps inter-process traffic low
+        chunksize = math.ceil(len(paths) / workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outcomes = executor.map(
+                _batch_worker,
+                paths,
+                [operation] * len(paths),
+                [output_dir] * len(paths),
+                [kwargs] * len(paths),
+                chunksize=chunksize
+            )
+            return {str(input_path): outcome for input_path, outcome in zip(paths, outcomes)}
+
+    def _run_batch_operation(
+        self,
+        input_path: Path,
+        operation: str,
+        output_dir: Optional[Path],
+        kwargs: Dict[str, Any]
+    ) -> Union[Path, Exception]:
+        """
+        Run a single batch operation, returning the exception on failure.
 
-                results[str(input_path)] = result
+        Args:
+            input_path: Input file path
+            operation: Operation to perform ('strip', 'strip_gps', 'export')
+            output_dir: Optional output directory
+            kwargs: Additional arguments for the operation
 
-            except Exception as e:
-                logger.error(f"Batch operation failed for {input_path}: {e}")
-                results[str(input_path)] = e
+        Returns:
+            Result path, or the exception raised by the operation
+        """
+        try:
+            name = input_path.name
+            if operation == "strip":
+                output_path = output_dir / name if output_dir else None
+                return self.strip_metadata(input_path, output_path, **kwargs)
+            elif operation == "strip_gps":
+                output_path = output_dir / name if output_dir else None
+                return self.strip_gps_data(input_path, output_path, **kwargs)
+            elif operation == "export":
+                stem, _ = os.path.splitext(name)
+                export_name = f"{stem}_metadata.json"
+                export_path = output_dir / export_name if output_dir else input_path.parent / export_name
+                return self.export_metadata(input_path, export_path, **kwargs)
+            else:
+                raise ValueError(f"Unknown batch operation: {operation}")
 
-        return results
+        except Exception as e:
+            logger.error("Batch operation failed for %s: %s", input_path, e)
+            return e
 
     def __str__(self) -> str:
         """String representation."""
-        return f"MetadataEngine(adapters={len(self.adapters)})"
+        return f"MetadataEngine(adapters={len(self._supported_formats)})"
 
     def __repr__(self) -> str:
         """Detailed representation."""
         formats = ", ".join(self.get_supported_formats())
-        return f"MetadataEngine(supported_formats=[{formats}])"
\ No newline at end of file
+        return f"MetadataEngine(supported_formats=[{formats}])"
+
+
+@functools.lru_cache(maxsize=None)
+def default_engine() -> MetadataEngine:
+    """Get the shared engine with the built-in adapters, created on first use."""
+    return MetadataEngine()
+
+
+def _batch_worker(
+    input_path: Path,
+    operation: str,
+    output_dir: Optional[Path],
+    kwargs: Dict[str, Any]
+) -> Union[Path, Exception]:
+    """Process one batch file inside a worker process."""
+    # Each worker process builds its default engine once and reuses it
+    return default_engine()._run_batch_operation(input_path, operation, output_dir, kwargs)
@@ -1,17 +1,97 @@
 """
 File safety mechanisms for protecting original images and ensuring data integrity.
 """
+import fnmatch
+import os
 import shutil
+import sys
 import tempfile
+import threading
 from pathlib import Path
-from typing import Optional, Union
+from typing import Optional, Set, Union
 from contextlib import contextmanager
 import hashlib
+import itertools
 import time
 
 from .exceptions import FileError, PixelDataCorruptionError, BackupError
 from .logger import logger
 
+# Linux ioctl request for cloning a file's extents (_IOW(0x94, 9, int))
+_FICLONE = 0x40049409
+
+
+def _clone_file(src: Path, dst: Path) -> bool:
+    """
+    Copy file contents without reading them through userspace.
+
+    Tries a copy-on-write clone (clonefile on macOS, FICLONE on Linux),
+    then os.copy_file_range, then os.sendfile. Returns False if none of these apply, in
+    which case dst may exist with partial content and must be overwritten.
+    """
+    if sys.platform == "darwin":
+        try:
+            import ctypes
+            libc = ctypes.CDLL(None, use_errno=True)
+            return libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+        except (OSError, AttributeError):
+            return False
+
+    if not sys.platform.startswith("linux"):
+        return False
+
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        try:
+            import fcntl
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return True
+        except (OSError, ImportError):
+            pass
+
+        size = os.fstat(fsrc.fileno()).st_size
+
+        if hasattr(os, "copy_file_range"):
+            try:
+                remaining = size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+                else:
+                    return True
+            except OSError:
+                pass
+
+            # Start over from an empty destination for the sendfile fallback
+            fdst.seek(0)
+            fdst.truncate()
+
+        # sendfile also copies in the kernel, in as few calls as the file allows
+        try:
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                if sent == 0:
+                    return False
+                offset += sent
+            return True
+        except OSError:
+            return False
+
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """
+    Copy a file with its metadata like shutil.copy2, cloning when possible.
+
+    On copy-on-write filesystems (btrfs, XFS, APFS) the clone shares data
+    blocks, so backups cost no data I/O.
+    """
+    if _clone_file(src, dst):
+        shutil.copystat(src, dst)
+    else:
+        shutil.copy2(src, dst)
+
 
 class FileSafetyManager:
     """
@@ -27,6 +107,16 @@ class FileSafetyManager:
             backup_dir: Optional custom backup directory
         """
         self.backup_dir = backup_dir
+        # Directories this manager has already created, so repeated backups skip mkdir
+        self._created_dirs: Set[Path] = set()
+        # Sequence number that keeps names unique within the same clock tick
+        self._backup_seq = itertools.count()
+
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create a directory once per manager; later calls are a set lookup."""
+        if directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
 
     def get_backup_path(self, original_path: Path, suffix: str = "backup") -> Path:
         """
@@ -44,10 +134,11 @@ class FileSafetyManager:
         else:
             backup_dir = original_path.parent
 
-        backup_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(backup_dir)
 
-        timestamp = int(time.time())
-        backup_name = f"{original_path.stem}.{suffix}.{timestamp}{original_path.suffix}"
+        stem, extension = os.path.splitext(original_path.name)
+        unique_id = f"{time.time_ns()}_{next(self._backup_seq)}"
+        backup_name = f"{stem}.{suffix}.{unique_id}{extension}"
         return backup_dir / backup_name
 
     def create_backup(self, file_path: Path, backup_path: Optional[Path] = None) -> Path:
@@ -71,9 +162,9 @@ class FileSafetyManager:
             backup_path = self.get_backup_path(file_path)
 
         try:
-            backup_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(file_path, backup_path)
-            logger.info(f"Created backup: {backup_path}")
+            self._ensure_dir(backup_path.parent)
+            _fast_copy(file_path, backup_path)
+            logger.info("Created backup: %s", backup_path)
             return backup_path
         except Exception as e:
             raise BackupError(f"Failed to create backup: {e}")
@@ -88,17 +179,27 @@ class FileSafetyManager:
         Returns:
             Hex string of file hash
         """
-        hasher = hashlib.sha256()
         try:
-            from .config import config
-            chunk_size = config.get("integrity.file_hash_chunk_size", 4096)
-
             with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(chunk_size), b""):
-                    hasher.update(chunk)
-            return hasher.hexdigest()
+                # Python 3.11+: hash in C with its own buffer, releasing the GIL
+                if hasattr(hashlib, "file_digest"):
+                    return hashlib.file_digest(f, "sha256").hexdigest()
+
+                from .config import config
+                chunk_size = config.get("integrity.file_hash_chunk_size", 1 << 20)
+
+                # Reuse one buffer for every read instead of allocating per chunk
+                hasher = hashlib.sha256()
+                buffer = bytearray(chunk_size)
+                view = memoryview(buffer)
+                while True:
+                    size = f.readinto(buffer)
+                    if not size:
+                        break
+                    hasher.update(view[:size])
+                return hasher.hexdigest()
         except Exception as e:
-            logger.error(f"Failed to calculate hash for {file_path}: {e}")
+            logger.error("Failed to calculate hash for %s: %s", file_path, e)
             return ""
 
     def verify_file_integrity(self, original_path: Path, modified_path: Path) -> bool:
@@ -115,7 +216,7 @@ class FileSafetyManager:
         """
         try:
             if not modified_path.exists():
-                logger.error(f"Modified file does not exist: {modified_path}")
+                logger.error("Modified file does not exist: %s", modified_path)
                 return False
 
             original_size = original_path.stat().st_size
@@ -127,12 +228,12 @@ class FileSafetyManager:
             size_ratio = abs(modified_size - original_size) / original_size if original_size > 0 else 0
 
             if size_ratio > max_ratio:
-                logger.warning(f"Significant size difference: {original_size} -> {modified_size}")
+                logger.warning("Significant size difference: %s -> %s", original_size, modified_size)
 
             return True
 
         except Exception as e:
-            logger.error(f"File integrity check failed: {e}")
+            logger.error("File integrity check failed: %s", e)
             return False
 
     @contextmanager
@@ -145,7 +246,9 @@ class FileSafetyManager:
             create_backup: Whether to create backup before operation
 
         Yields:
-            Temporary file path for safe operations
+            Temporary file path for safe operations. The temporary file is
+            not pre-populated: callers must write the complete output to it.
+            If nothing is written, the original file is left untouched.
 
         Usage:
             with safety_manager.safe_file_operation(file_path) as temp_path:
@@ -160,34 +263,31 @@ class FileSafetyManager:
             if create_backup and file_path.exists():
                 backup_path = self.create_backup(file_path)
 
-            # Create temporary file for operations
-            temp_dir = file_path.parent / ".temp"
-            temp_dir.mkdir(exist_ok=True)
-            temp_path = temp_dir / f"temp_{int(time.time())}_{file_path.name}"
+            # Create temporary file next to the original so the final rename stays
+            # on one filesystem; the name is unique per process, thread and call so
+            # concurrent operations in the same directory never collide
+            unique_id = f"{os.getpid()}_{threading.get_ident()}_{next(self._backup_seq)}"
+            temp_path = file_path.parent / f".temp_{unique_id}_{file_path.name}"
 
-            # Copy original to temp location
-            if file_path.exists():
-                shutil.copy2(file_path, temp_path)
-
-            logger.debug(f"Starting safe operation: {file_path} -> {temp_path}")
+            logger.debug("Starting safe operation: %s -> %s", file_path, temp_path)
             yield temp_path
 
             # If we get here, operation succeeded
-            # Replace original with modified temp file
+            # Replace original with modified temp file (same filesystem, atomic rename)
             if temp_path.exists():
-                shutil.move(temp_path, file_path)
-                logger.info(f"Safe operation completed: {file_path}")
+                os.replace(temp_path, file_path)
+                logger.info("Safe operation completed: %s", file_path)
 
         except Exception as e:
-            logger.error(f"Safe operation failed: {e}")
+            logger.error("Safe operation failed: %s", e)
 
             # Restore from backup if available
             if backup_path and backup_path.exists() and file_path.exists():
                 try:
-                    shutil.copy2(backup_path, file_path)
-                    logger.info(f"Restored from backup: {backup_path}")
+                    _fast_copy(backup_path, file_path)
+                    logger.info("Restored from backup: %s", backup_path)
                 except Exception as restore_error:
-                    logger.error(f"Failed to restore from backup: {restore_error}")
+                    logger.error("Failed to restore from backup: %s", restore_error)
 
             raise
 
@@ -197,15 +297,7 @@ class FileSafetyManager:
                 try:
                     temp_path.unlink()
                 except Exception as cleanup_error:
-                    logger.warning(f"Failed to cleanup temp file: {cleanup_error}")
-
-            # Cleanup temp directory if empty
-            temp_dir = file_path.parent / ".temp"
-            if temp_dir.exists() and not any(temp_dir.iterdir()):
-                try:
-                    temp_dir.rmdir()
-                except Exception:
-                    pass  # Ignore cleanup errors
+                    logger.warning("Failed to cleanup temp file: %s", cleanup_error)
 
     def cleanup_backups(self, file_path: Path, keep_count: int = 5) -> int:
         """
@@ -221,26 +313,31 @@ class FileSafetyManager:
         backup_dir = self.backup_dir or file_path.parent
         pattern = f"{file_path.stem}.backup.*{file_path.suffix}"
 
-        # Find all backup files
-        backup_files = list(backup_dir.glob(pattern))
+        # Find all backup files; DirEntry caches stat data from the directory scan
+        try:
+            with os.scandir(backup_dir) as it:
+                backup_files = [entry for entry in it if fnmatch.fnmatch(entry.name, pattern)]
+        except FileNotFoundError:
+            return 0
+
         if len(backup_files) <= keep_count:
             return 0
 
         # Sort by modification time (newest first)
-        backup_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+        backup_files.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
 
         # Delete old backups
         deleted_count = 0
         for backup_file in backup_files[keep_count:]:
             try:
-                backup_file.unlink()
+                os.unlink(backup_file.path)
                 deleted_count += 1
-                logger.debug(f"Deleted old backup: {backup_file}")
+                logger.debug("Deleted old backup: %s", backup_file.path)
             except Exception as e:
-                logger.warning(f"Failed to delete backup {backup_file}: {e}")
+                logger.warning("Failed to delete backup %s: %s", backup_file.path, e)
 
         if deleted_count > 0:
-            logger.info(f"Cleaned up {deleted_count} old backups for {file_path}")
+            logger.info("Cleaned up %d old backups for %s", deleted_count, file_path)
 
         return deleted_count
 
@@ -257,8 +354,8 @@ class FileSafetyManager:
         temp_dir = Path(tempfile.gettempdir()) / "exif_analyzer"
         temp_dir.mkdir(exist_ok=True)
 
-        temp_path = temp_dir / f"temp_{int(time.time())}_{file_path.name}"
-        shutil.copy2(file_path, temp_path)
+        temp_path = temp_dir / f"temp_{time.time_ns()}_{next(self._backup_seq)}_{file_path.name}"
+        _fast_copy(file_path, temp_path)
 
-        logger.debug(f"Created temp copy: {temp_path}")
+        logger.debug("Created temp copy: %s", temp_path)
         return temp_path
\ No newline at end of file
@@ -2,9 +2,36 @@
 Logging configuration for ExifAnalyzer.
 """
 import logging
+import logging.handlers
+import multiprocessing
+import multiprocessing.util
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+# Exit priority for stopping file-log listeners. multiprocessing runs its
+# finalizers from highest priority down, and a Queue closes itself at
+# priority 10, so listeners must drain before that
+_LISTENER_EXIT_PRIORITY = 20
+
+# Running file-log listeners by logger name, with their exit finalizers
+_file_listeners: Dict[str, Tuple[logging.handlers.QueueListener, multiprocessing.util.Finalize]] = {}
+
+
+def _close_file_listener(listener: logging.handlers.QueueListener, file_handler: logging.Handler) -> None:
+    """Drain the queue into the file, then close it."""
+    listener.stop()
+    file_handler.close()
+
+
+def _stop_file_listener(name: str) -> None:
+    """Drain and close the file-log listener for a logger, if any."""
+    entry = _file_listeners.pop(name, None)
+    if entry is None:
+        return
+
+    _, finalizer = entry
+    finalizer()  # runs at most once, so the exit hook becomes a no-op
 
 
 def setup_logger(
@@ -30,6 +57,7 @@ def setup_logger(
 
     # Clear existing handlers
     logger.handlers.clear()
+    _stop_file_listener(name)
 
     # Create formatter
     formatter = logging.Formatter(
@@ -48,7 +76,23 @@ def setup_logger(
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+
+        # A single listener thread owns the file; records from this process and
+        # forked batch workers are queued to it, so callers never wait on disk
+        # I/O. Each record is written as it arrives, so nothing is lost if the
+        # process dies without running exit handlers
+        log_queue = multiprocessing.Queue(-1)
+        listener = logging.handlers.QueueListener(log_queue, file_handler)
+        listener.start()
+        # A multiprocessing finalizer rather than atexit, so the listener drains
+        # before multiprocessing closes the queue at exit
+        finalizer = multiprocessing.util.Finalize(
+            listener, _close_file_listener, args=(listener, file_handler),
+            exitpriority=_LISTENER_EXIT_PRIORITY
+        )
+        _file_listeners[name] = (listener, finalizer)
+
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     return logger
 
@@ -1,23 +1,76 @@
 """
 Core metadata handling and normalization structures.
 """
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Union, List, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+import functools
 import json
+import re
+import sys
 
 from .exceptions import ValidationError, MetadataError
 from .logger import logger
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used otherwise
+    orjson = None
 
-@dataclass
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@functools.lru_cache(maxsize=32)
+def compile_key_patterns(patterns: Tuple[str, ...]) -> "re.Pattern":
+    """
+    Compile substring patterns into one regex alternation for key matching.
+
+    A single search with the result replaces looping over the patterns with
+    `in`. Patterns are matched literally and case-sensitively, so lowercase
+    them along with the keys for case-insensitive matching.
+
+    Args:
+        patterns: Substrings to look for
+
+    Returns:
+        Compiled pattern; it never matches when patterns is empty
+    """
+    if not patterns:
+        return re.compile(r'(?!)')
+    return re.compile("|".join(map(re.escape, patterns)))
+
+
+class _EmptyData(dict):
+    """Read-only empty dict shared by every block until its first write."""
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Empty metadata block data is shared; use MetadataBlock.set()")
+
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # Pickle and copy as a reference to the shared instance
+        return "_EMPTY_DATA"
+
+
+_EMPTY_DATA = _EmptyData()
+
+
+@dataclass(**_SLOTS)
 class MetadataBlock:
     """Represents a single metadata block (EXIF, IPTC, XMP, etc.)."""
     name: str
-    data: Dict[str, Any] = field(default_factory=dict)
+    # Blocks that are never written share one read-only empty dict
+    data: Dict[str, Any] = field(default_factory=lambda: _EMPTY_DATA)
     raw_data: Optional[bytes] = None
     encoding: str = "utf-8"
+    # Bumped on every set/remove so owners can tell when cached key info is stale
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    # Lowercased form of each key, computed once per key for pattern matching
+    _lower_keys: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get metadata value by key with optional default."""
@@ -25,12 +78,50 @@ class MetadataBlock:
 
     def set(self, key: str, value: Any) -> None:
         """Set metadata value."""
+        if self.data is _EMPTY_DATA:
+            self.data = {}
         self.data[key] = value
+        self._version += 1
 
     def remove(self, key: str) -> bool:
         """Remove metadata key. Returns True if key existed."""
+        if self.data is _EMPTY_DATA:
+            return False
+        self._version += 1
+        if self._lower_keys:
+            self._lower_keys.pop(key, None)
         return self.data.pop(key, None) is not None
 
+    def clear(self) -> int:
+        """Remove all metadata keys. Returns the number of keys removed."""
+        count = len(self.data)
+        if count:
+            self.data.clear()
+        self._lower_keys = None
+        self._version += 1
+        return count
+
+    def _iter_lower_keys(self):
+        """
+        Iterate over keys with their lowercased form.
+
+        Each key is lowercased once and remembered, so repeated pattern
+        checks over the same block do not allocate new strings.
+
+        Yields:
+            tuple: (key, lowercased key) pairs
+        """
+        if not self.data:
+            return
+        lower_keys = self._lower_keys
+        if lower_keys is None:
+            lower_keys = self._lower_keys = {}
+        for key in self.data:
+            key_lower = lower_keys.get(key)
+            if key_lower is None:
+                key_lower = lower_keys[key] = key.lower()
+            yield key, key_lower
+
     def keys(self) -> List[str]:
         """Get all metadata keys."""
         return list(self.data.keys())
@@ -39,8 +130,12 @@ class MetadataBlock:
         """Check if metadata block is empty."""
         return len(self.data) == 0
 
+    def __len__(self) -> int:
+        """Get the number of metadata keys."""
+        return len(self.data)
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class ImageMetadata:
     """
     Unified metadata structure for all image formats.
@@ -62,18 +157,33 @@ class ImageMetadata:
         "artist", "author", "creator", "owner", "copyright", "contact"
     ]
 
+    # Each pattern group compiled once into a single alternation, so matching a
+    # lowercased key is one scan instead of one substring search per pattern
+    _GPS_RE = compile_key_patterns(tuple(GPS_PATTERNS))
+    _SENSITIVE_RE = compile_key_patterns(tuple(GPS_PATTERNS + DEVICE_PATTERNS + PERSONAL_PATTERNS))
+
+    # Block names in canonical order, with their display names
+    _BLOCK_NAMES = ("exif", "iptc", "xmp", "custom")
+    _BLOCK_DISPLAY_NAMES = ("EXIF", "IPTC", "XMP", "Custom")
+
     file_path: Path
     format: str
-    exif: MetadataBlock = field(default_factory=lambda: MetadataBlock("exif"))
-    iptc: MetadataBlock = field(default_factory=lambda: MetadataBlock("iptc"))
-    xmp: MetadataBlock = field(default_factory=lambda: MetadataBlock("xmp"))
-    custom: MetadataBlock = field(default_factory=lambda: MetadataBlock("custom"))
+    # Blocks are created on first access; most images only ever populate EXIF
+    _blocks: Dict[str, MetadataBlock] = field(default_factory=dict, init=False, repr=False)
 
     # File metadata
     file_size: Optional[int] = None
     last_modified: Optional[datetime] = None
     pixel_hash: Optional[str] = None  # For integrity verification
 
+    # Cached result of _classify_keys and the block state it was computed from
+    _key_classes: Optional[Dict[str, List[tuple]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _key_classes_stamp: Optional[tuple] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self):
         """Post-initialization validation and setup."""
         if not isinstance(self.file_path, Path):
@@ -82,15 +192,66 @@ class ImageMetadata:
         if not self.format:
             raise ValidationError("Image format must be specified")
 
+    def _block(self, name: str) -> MetadataBlock:
+        """Get a metadata block by canonical name, creating it on first access."""
+        block = self._blocks.get(name)
+        if block is None:
+            block = self._blocks[name] = MetadataBlock(name)
+        return block
+
+    def _existing_blocks(self):
+        """
+        Iterate over the blocks created so far, without creating the others.
+
+        Yields:
+            tuple: (block_name, MetadataBlock) pairs in canonical order
+        """
+        blocks = self._blocks
+        for name in self._BLOCK_NAMES:
+            block = blocks.get(name)
+            if block is not None:
+                yield name, block
+
+    @property
+    def exif(self) -> MetadataBlock:
+        """EXIF metadata block."""
+        return self._block("exif")
+
+    @exif.setter
+    def exif(self, block: MetadataBlock) -> None:
+        self._blocks["exif"] = block
+
+    @property
+    def iptc(self) -> MetadataBlock:
+        """IPTC metadata block."""
+        return self._block("iptc")
+
+    @iptc.setter
+    def iptc(self, block: MetadataBlock) -> None:
+        self._blocks["iptc"] = block
+
+    @property
+    def xmp(self) -> MetadataBlock:
+        """XMP metadata block."""
+        return self._block("xmp")
+
+    @xmp.setter
+    def xmp(self, block: MetadataBlock) -> None:
+        self._blocks["xmp"] = block
+
+    @property
+    def custom(self) -> MetadataBlock:
+        """Format-specific metadata block."""
+        return self._block("custom")
+
+    @custom.setter
+    def custom(self, block: MetadataBlock) -> None:
+        self._blocks["custom"] = block
+
     def get_block(self, block_name: str) -> Optional[MetadataBlock]:
         """Get metadata block by name."""
-        blocks = {
-            "exif": self.exif,
-            "iptc": self.iptc,
-            "xmp": self.xmp,
-            "custom": self.custom
-        }
-        return blocks.get(block_name.lower())
+        name = block_name.lower()
+        return self._block(name) if name in self._BLOCK_NAMES else None
 
     def iter_blocks(self):
         """
@@ -99,10 +260,8 @@ class ImageMetadata:
         Yields:
             MetadataBlock: Each metadata block in order (exif, iptc, xmp, custom)
         """
-        yield self.exif
-        yield self.iptc
-        yield self.xmp
-        yield self.custom
+        for name in self._BLOCK_NAMES:
+            yield self._block(name)
 
     def iter_named_blocks(self):
         """
@@ -111,10 +270,8 @@ class ImageMetadata:
         Yields:
             tuple: (display_name, MetadataBlock) pairs
         """
-        yield ("EXIF", self.exif)
-        yield ("IPTC", self.iptc)
-        yield ("XMP", self.xmp)
-        yield ("Custom", self.custom)
+        for display_name, name in zip(self._BLOCK_DISPLAY_NAMES, self._BLOCK_NAMES):
+            yield (display_name, self._block(name))
 
     def get_all_blocks(self) -> List[MetadataBlock]:
         """
@@ -123,20 +280,47 @@ class ImageMetadata:
         Returns:
             List of all metadata blocks
         """
-        return [self.exif, self.iptc, self.xmp, self.custom]
+        return list(self.iter_blocks())
 
     def has_metadata(self) -> bool:
         """Check if image has any metadata."""
-        return any(not block.is_empty() for block in self.iter_blocks())
+        return any(not block.is_empty() for _, block in self._existing_blocks())
+
+    def _classify_keys(self) -> Dict[str, List[tuple]]:
+        """
+        Classify every metadata key as GPS and/or privacy-sensitive.
+
+        Each key is lowercased and matched once. The result is cached until a
+        block changes, so a privacy workflow that checks, lists and strips keys
+        walks the key set a single time.
+
+        Returns:
+            Dict mapping "gps" and "sensitive" to lists of (block_name, key) tuples
+        """
+        stamp = tuple(
+            (name, id(block.data), len(block.data), block._version)
+            for name, block in self._existing_blocks()
+        )
+        if self._key_classes is None or stamp != self._key_classes_stamp:
+            gps_keys = []
+            sensitive_keys = []
+
+            for block_name, block in self._existing_blocks():
+                for key, key_lower in block._iter_lower_keys():
+                    if self._GPS_RE.search(key_lower):
+                        gps_keys.append((block_name, key))
+                        sensitive_keys.append((block_name, key))
+                    elif self._SENSITIVE_RE.search(key_lower):
+                        sensitive_keys.append((block_name, key))
+
+            self._key_classes = {"gps": gps_keys, "sensitive": sensitive_keys}
+            self._key_classes_stamp = stamp
+
+        return self._key_classes
 
     def has_gps_data(self) -> bool:
         """Check if image contains GPS/location data."""
-        for block in self.iter_blocks():
-            for key in block.keys():
-                key_lower = key.lower()
-                if any(pattern in key_lower for pattern in self.GPS_PATTERNS):
-                    return True
-        return False
+        return bool(self._classify_keys()["gps"])
 
     def get_privacy_sensitive_keys(self) -> List[tuple]:
         """
@@ -145,17 +329,7 @@ class ImageMetadata:
         Returns:
             List of (block_name, key) tuples for sensitive data
         """
-        sensitive_keys = []
-        all_patterns = self.GPS_PATTERNS + self.DEVICE_PATTERNS + self.PERSONAL_PATTERNS
-
-        for block_name, block in [("exif", self.exif), ("iptc", self.iptc),
-                                 ("xmp", self.xmp), ("custom", self.custom)]:
-            for key in block.keys():
-                key_lower = key.lower()
-                if any(pattern in key_lower for pattern in all_patterns):
-                    sensitive_keys.append((block_name, key))
-
-        return sensitive_keys
+        return list(self._classify_keys()["sensitive"])
 
     def strip_gps_data(self) -> int:
         """
@@ -166,16 +340,11 @@ class ImageMetadata:
         """
         removed_count = 0
 
-        for block in self.iter_blocks():
-            keys_to_remove = []
-            for key in block.keys():
-                if any(pattern in key.lower() for pattern in self.GPS_PATTERNS):
-                    keys_to_remove.append(key)
-
-            for key in keys_to_remove:
-                if block.remove(key):
-                    removed_count += 1
-                    logger.debug(f"Removed GPS key: {key} from {block.name}")
+        for block_name, key in self._classify_keys()["gps"]:
+            block = self.get_block(block_name)
+            if block.remove(key):
+                removed_count += 1
+                logger.debug(f"Removed GPS key: {key} from {block.name}")
 
         return removed_count
 
@@ -186,17 +355,33 @@ class ImageMetadata:
         Returns:
             Total number of keys removed
         """
-        removed_count = 0
-
-        for block in self.iter_blocks():
-            keys = list(block.keys())
-            for key in keys:
-                if block.remove(key):
-                    removed_count += 1
+        removed_count = sum(block.clear() for _, block in self._existing_blocks())
 
         logger.info(f"Removed {removed_count} metadata keys from {self.file_path}")
         return removed_count
 
+    def copy(self) -> "ImageMetadata":
+        """
+        Copy the metadata so its blocks can be changed independently.
+
+        Each block's key/value mapping is copied; the values themselves
+        (e.g. nested GPS dicts) are shared with this instance.
+
+        Returns:
+            New ImageMetadata equal to this one
+        """
+        clone = self.__class__(
+            file_path=self.file_path,
+            format=self.format,
+            file_size=self.file_size,
+            last_modified=self.last_modified,
+            pixel_hash=self.pixel_hash,
+        )
+        for name, block in self._existing_blocks():
+            data = block.data if block.data is _EMPTY_DATA else dict(block.data)
+            clone._blocks[name] = MetadataBlock(name, data, block.raw_data, block.encoding)
+        return clone
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert metadata to dictionary format."""
         return {
@@ -206,16 +391,30 @@ class ImageMetadata:
             "last_modified": self.last_modified.isoformat() if self.last_modified else None,
             "pixel_hash": self.pixel_hash,
             "metadata": {
-                "exif": self.exif.data,
-                "iptc": self.iptc.data,
-                "xmp": self.xmp.data,
-                "custom": self.custom.data
+                name: self._blocks[name].data if name in self._blocks else {}
+                for name in self._BLOCK_NAMES
             }
         }
 
     def to_json(self, indent: int = 2) -> str:
-        """Convert metadata to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent, default=str)
+        """
+        Convert metadata to JSON string.
+
+        With orjson installed, NaN and infinite floats are written as null
+        (strict JSON) where the stdlib encoder writes NaN/Infinity.
+        """
+        data = self.to_dict()
+        # orjson only indents by two spaces; other layouts use the stdlib encoder
+        if orjson is not None and indent == 2:
+            try:
+                return orjson.dumps(
+                    data,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ).decode('utf-8')
+            except orjson.JSONEncodeError:
+                pass  # e.g. integers beyond 64 bits, which the stdlib encoder handles
+        return json.dumps(data, indent=indent, default=str)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ImageMetadata":
@@ -232,22 +431,41 @@ class ImageMetadata:
 
         # Load metadata blocks
         metadata_blocks = data.get("metadata", {})
-        metadata.exif.data = metadata_blocks.get("exif", {})
-        metadata.iptc.data = metadata_blocks.get("iptc", {})
-        metadata.xmp.data = metadata_blocks.get("xmp", {})
-        metadata.custom.data = metadata_blocks.get("custom", {})
+        for name in cls._BLOCK_NAMES:
+            block_data = metadata_blocks.get(name)
+            if block_data:
+                metadata._block(name).data = block_data
 
         return metadata
 
     @classmethod
-    def from_json(cls, json_str: str) -> "ImageMetadata":
-        """Create ImageMetadata from JSON string."""
+    def from_json(cls, json_str: Union[str, bytes]) -> "ImageMetadata":
+        """Create ImageMetadata from JSON string or UTF-8 bytes."""
         try:
-            data = json.loads(json_str)
+            data = orjson.loads(json_str) if orjson is not None else json.loads(json_str)
             return cls.from_dict(data)
-        except json.JSONDecodeError as e:
+        except ValueError as e:  # JSONDecodeError and orjson's decode error both subclass it
             raise MetadataError(f"Invalid JSON format: {e}")
 
+    def __eq__(self, other: object) -> bool:
+        """Compare file fields and block contents; a missing block equals an empty one."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        fields_equal = (
+            (self.file_path, self.format, self.file_size, self.last_modified, self.pixel_hash)
+            == (other.file_path, other.format, other.file_size, other.last_modified, other.pixel_hash)
+        )
+        return fields_equal and all(
+            self._blocks.get(name, MetadataBlock(name)) == other._blocks.get(name, MetadataBlock(name))
+            for name in self._BLOCK_NAMES
+        )
+
+    def _key_count(self, name: str) -> int:
+        """Count keys in a block without creating it."""
+        block = self._blocks.get(name)
+        return len(block.data) if block is not None else 0
+
     def __str__(self) -> str:
         """String representation for debugging."""
         return f"ImageMetadata({self.file_path}, {self.format}, {self.has_metadata()})"
@@ -255,5 +473,5 @@ class ImageMetadata:
     def __repr__(self) -> str:
         """Detailed representation."""
         return (f"ImageMetadata(file_path={self.file_path}, format={self.format}, "
-                f"exif_keys={len(self.exif.keys())}, iptc_keys={len(self.iptc.keys())}, "
-                f"xmp_keys={len(self.xmp.keys())}, custom_keys={len(self.custom.keys())})")
\ No newline at end of file
+                f"exif_keys={self._key_count('exif')}, iptc_keys={self._key_count('iptc')}, "
+                f"xmp_keys={self._key_count('xmp')}, custom_keys={self._key_count('custom')})")
\ No newline at end of file
@@ -5,6 +5,7 @@ This module provides deep inspection and platform detection for AI-generated
 image metadata across multiple platforms (Stable Diffusion, Midjourney, etc.).
 """
 from .models import (
+    BatchDiscoveryResult,
     DiscoveryResult,
     DetectionResult,
     AIMetadata,
@@ -15,6 +16,7 @@ from .engine import MetadataDiscoveryEngine
 
 __all__ = [
     "MetadataDiscoveryEngine",
+    "BatchDiscoveryResult",
     "DiscoveryResult",
     "DetectionResult",
     "AIMetadata",
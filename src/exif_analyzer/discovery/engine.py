@@ -1,12 +1,17 @@
 """
 Main discovery engine - Phase 1 MVP implementation.
 """
+import ast
+import functools
+import math
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Union, Optional
+from typing import Any, Iterable, Union, Optional
 import time
 
 from .models import (
+    BatchDiscoveryResult,
     DiscoveryResult,
     DetectionResult,
     AIMetadata,
@@ -14,8 +19,53 @@ from .models import (
     ConfidenceLevel,
 )
 from .extractor import MetadataExtractor
-from ..core.engine import MetadataEngine
-
+from ..core.engine import MetadataEngine, default_engine
+
+# Civitai / A1111 generation-parameter patterns, compiled once at import
+_RE_PROMPT = re.compile(r'^(.+?)(?=\nNegative prompt:|$)', re.DOTALL)
+_RE_NEG = re.compile(r'Negative prompt:\s*(.+?)(?=\nSteps:|$)', re.DOTALL)
+_RE_MODEL = re.compile(r'"modelName":"([^"]+)"')
+_RE_VER = re.compile(r'"modelVersionName":"([^"]+)"')
+
+# Platform markers, each checked with a single scan
+_RE_CIVITAI_MARKER = re.compile(r'Civitai|Steps:')
+_RE_SD_PARAMETERS = re.compile(r'parameters:', re.IGNORECASE)
+
+# "Label: value" generation parameters on the "Steps:" line, by label:
+# (key, pattern for the leading valid part of the value, converter)
+_PARAMETER_FIELDS = {
+    'Steps': ('steps', re.compile(r'\d+'), int),
+    'Sampler': ('sampler', re.compile(r'.+'), str),
+    'CFG scale': ('cfg_scale', re.compile(r'\d+(?:\.\d+)?'), float),
+    'Seed': ('seed', re.compile(r'\d+'), int),
+    'Size': ('size', re.compile(r'\d+x\d+'), str),
+}
+_RE_PARAMETER_LABEL = re.compile('(' + '|'.join(map(re.escape, _PARAMETER_FIELDS)) + r'):\s*')
+
+
+def _decode_user_comment(value: Any) -> Optional[str]:
+    """
+    Decode an EXIF UserComment to text.
+
+    Accepts the raw bytes or their repr() form (e.g. "b'...'") as stored by
+    some readers. The repr form is parsed as a literal only, never evaluated.
+
+    Args:
+        value: UserComment value from the EXIF metadata
+
+    Returns:
+        Decoded comment text, or None if the value is not text or bytes
+    """
+    if isinstance(value, str) and value.startswith(("b'", 'b"')):
+        try:
+            value = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return value
+
+    if isinstance(value, bytes):
+        return value.decode('utf-16-le', errors='ignore')
+
+    return value if isinstance(value, str) else None
 
 class MetadataDiscoveryEngine:
     """Main engine for metadata discovery operations."""
@@ -70,22 +120,66 @@ class MetadataDiscoveryEngine:
             discovery_time=discovery_time
         )
 
+    def discover_many(
+        self,
+        file_paths: Iterable[Union[str, Path]],
+        verbose: bool = False,
+        workers: Optional[int] = None,
+    ) -> BatchDiscoveryResult:
+        """
+        Perform discovery on multiple images.
+
+        Args:
+            file_paths: Paths to image files
+            verbose: Include raw data in results
+            workers: Number of worker processes. None or 1 discovers files
+                     serially in this process. Workers use their own engine
+                     with the built-in adapters only.
+
+        Returns:
+            BatchDiscoveryResult aggregating every successful discovery;
+            files that fail are counted and listed in anomalies
+        """
+        start_time = time.time()
+        paths = [Path(file_path) for file_path in file_paths]
+
+        if workers is None or workers <= 1 or len(paths) <= 1:
+            outcomes = [_discover_one(self, file_path, verbose) for file_path in paths]
+        else:
+            # One contiguous chunk per worker keeps inter-process traffic low
+            chunksize = math.ceil(len(paths) / workers)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(
+                    _discover_worker,
+                    paths,
+                    [verbose] * len(paths),
+                    chunksize=chunksize
+                ))
+
+        results = []
+        failures = []
+        for file_path, outcome in zip(paths, outcomes):
+            if isinstance(outcome, Exception):
+                failures.append((file_path, outcome))
+            else:
+                results.append(outcome)
+
+        return BatchDiscoveryResult.from_results(
+            results, failures, total_time=time.time() - start_time
+        )
+
     def _detect_platform(self, extracted) -> DetectionResult:
         """Detect AI platform (simplified initial implementation)."""
         metadata = extracted.standard_metadata
 
         # Check for Civitai/Stable Diffusion in EXIF UserComment
-        user_comment = metadata.exif.get("PIL:UserComment") or metadata.exif.get("UserComment")
-
-        if user_comment and isinstance(user_comment, str):
-            # Decode if it's a bytes representation
-            if user_comment.startswith("b'"):
-                user_comment = eval(user_comment)  # Safe here, we control the input
-                if isinstance(user_comment, bytes):
-                    user_comment = user_comment.decode('utf-16-le', errors='ignore')
+        user_comment = _decode_user_comment(
+            metadata.exif.get("PIL:UserComment") or metadata.exif.get("UserComment")
+        )
 
+        if user_comment:
             # Check for Civitai/SD indicators
-            if "Civitai" in user_comment or "Steps:" in user_comment:
+            if _RE_CIVITAI_MARKER.search(user_comment):
                 return DetectionResult(
                     platform_id="civitai_sd",
                     platform_name="Civitai (Stable Diffusion)",
@@ -94,17 +188,19 @@ class MetadataDiscoveryEngine:
                     metadata={"source": "EXIF:UserComment"}
                 )
 
-        # Check PNG parameters chunk
-        for chunk in extracted.raw_chunks:
-            if chunk.chunk_type == "PNG:tEXt" and chunk.decoded_text:
-                if "parameters:" in chunk.decoded_text.lower():
-                    return DetectionResult(
-                        platform_id="stable_diffusion",
-                        platform_name="Stable Diffusion",
-                        confidence=ConfidenceLevel.HIGH,
-                        confidence_score=90.0,
-                        metadata={"source": "PNG:tEXt:parameters"}
-                    )
+        # Check PNG parameters chunk; all tEXt chunks are scanned in one pass
+        text_blob = "\n".join(
+            chunk.decoded_text for chunk in extracted.raw_chunks
+            if chunk.chunk_type == "PNG:tEXt" and chunk.decoded_text
+        )
+        if text_blob and _RE_SD_PARAMETERS.search(text_blob):
+            return DetectionResult(
+                platform_id="stable_diffusion",
+                platform_name="Stable Diffusion",
+                confidence=ConfidenceLevel.HIGH,
+                confidence_score=90.0,
+                metadata={"source": "PNG:tEXt:parameters"}
+            )
 
         # Default: unknown
         return DetectionResult(
@@ -123,57 +219,76 @@ class MetadataDiscoveryEngine:
         metadata = extracted.standard_metadata
 
         # Extract from EXIF UserComment (Civitai format)
-        user_comment = metadata.exif.get("PIL:UserComment") or metadata.exif.get("UserComment")
+        user_comment = _decode_user_comment(
+            metadata.exif.get("PIL:UserComment") or metadata.exif.get("UserComment")
+        )
 
+        # Parse Civitai format
         if user_comment:
-            # Decode if needed
-            if isinstance(user_comment, str) and user_comment.startswith("b'"):
-                user_comment = eval(user_comment)
-                if isinstance(user_comment, bytes):
-                    user_comment = user_comment.decode('utf-16-le', errors='ignore')
-
-            # Parse Civitai format
-            if isinstance(user_comment, str):
-                # Extract prompt (before "Negative prompt:")
-                prompt_match = re.search(r'^(.+?)(?=\nNegative prompt:|$)', user_comment, re.DOTALL)
-                if prompt_match:
-                    ai_meta.prompts['positive'] = prompt_match.group(1).strip()
-
-                # Extract negative prompt
-                neg_match = re.search(r'Negative prompt:\s*(.+?)(?=\nSteps:|$)', user_comment, re.DOTALL)
-                if neg_match:
-                    ai_meta.prompts['negative'] = neg_match.group(1).strip()
-
-                # Extract parameters
-                if 'Steps:' in user_comment:
-                    steps_match = re.search(r'Steps:\s*(\d+)', user_comment)
-                    if steps_match:
-                        ai_meta.parameters['steps'] = int(steps_match.group(1))
-
-                    sampler_match = re.search(r'Sampler:\s*([^,]+)', user_comment)
-                    if sampler_match:
-                        ai_meta.parameters['sampler'] = sampler_match.group(1).strip()
-
-                    cfg_match = re.search(r'CFG scale:\s*([\d.]+)', user_comment)
-                    if cfg_match:
-                        ai_meta.parameters['cfg_scale'] = float(cfg_match.group(1))
-
-                    seed_match = re.search(r'Seed:\s*(\d+)', user_comment)
-                    if seed_match:
-                        ai_meta.parameters['seed'] = int(seed_match.group(1))
-
-                    size_match = re.search(r'Size:\s*(\d+x\d+)', user_comment)
-                    if size_match:
-                        ai_meta.parameters['size'] = size_match.group(1)
-
-                # Extract Civitai model info
-                model_match = re.search(r'"modelName":"([^"]+)"', user_comment)
-                if model_match:
-                    version_match = re.search(r'"modelVersionName":"([^"]+)"', user_comment)
-                    ai_meta.model = ModelInfo(
-                        name=model_match.group(1),
-                        version=version_match.group(1) if version_match else None,
-                        source="Civitai"
-                    )
+            # Extract prompt (before "Negative prompt:")
+            prompt_match = _RE_PROMPT.search(user_comment)
+            if prompt_match:
+                ai_meta.prompts['positive'] = prompt_match.group(1).strip()
+
+            # Extract negative prompt
+            neg_match = _RE_NEG.search(user_comment)
+            if neg_match:
+                ai_meta.prompts['negative'] = neg_match.group(1).strip()
+
+            # Extract parameters from the "Label: value, ..." line that starts at
+            # "Steps:"; later lines (e.g. Dynamic Prompts' "Template:") are not
+            # parameters. A value runs to the next comma or known label, so a
+            # missing comma does not swallow the next field
+            steps_pos = user_comment.find('Steps:')
+            if steps_pos != -1:
+                line = user_comment[steps_pos:].split('\n', 1)[0]
+                labels = list(_RE_PARAMETER_LABEL.finditer(line))
+                pairs = {}
+                for match, next_match in zip(labels, labels[1:] + [None]):
+                    end = next_match.start() if next_match else len(line)
+                    value = line[match.end():end].split(',', 1)[0].strip()
+                    pairs.setdefault(match.group(1), value)
+
+                for label, (name, pattern, convert) in _PARAMETER_FIELDS.items():
+                    value_match = pattern.match(pairs.get(label, ''))
+                    if value_match:
+                        try:
+                            ai_meta.parameters[name] = convert(value_match.group())
+                        except ValueError:
+                            pass
+
+            # Extract Civitai model info
+            model_match = _RE_MODEL.search(user_comment)
+            if model_match:
+                version_match = _RE_VER.search(user_comment)
+                ai_meta.model = ModelInfo(
+                    name=model_match.group(1),
+                    version=version_match.group(1) if version_match else None,
+                    source="Civitai"
+                )
 
         return ai_meta if (ai_meta.prompts or ai_meta.parameters) else None
+
+
+def _discover_one(
+    engine: MetadataDiscoveryEngine,
+    file_path: Path,
+    verbose: bool
+) -> Union[DiscoveryResult, Exception]:
+    """Discover one file, returning the error instead of raising it."""
+    try:
+        return engine.discover(file_path, verbose=verbose)
+    except Exception as e:
+        return e
+
+
+@functools.lru_cache(maxsize=None)
+def _worker_discovery_engine() -> MetadataDiscoveryEngine:
+    """Get this process's discovery engine, created on first use."""
+    return MetadataDiscoveryEngine(default_engine())
+
+
+def _discover_worker(file_path: Path, verbose: bool) -> Union[DiscoveryResult, Exception]:
+    """Discover one file inside a worker process."""
+    # Each worker process builds its discovery engine once and reuses it
+    return _discover_one(_worker_discovery_engine(), file_path, verbose)
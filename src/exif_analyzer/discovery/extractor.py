@@ -1,14 +1,46 @@
 """
 Metadata extractor for deep inspection of image files.
 """
+import mmap
+import os
 import struct
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import time
 
 from ..core.metadata import ImageMetadata
 from ..core.engine import MetadataEngine
-from .models import RawChunk, ExtractedMetadata
+from .models import RAW_PREVIEW_SIZE, RawChunk, ExtractedMetadata
+
+# Chunk header fields, with formats parsed once
+_U32BE = struct.Struct('>I')
+_U32LE = struct.Struct('<I')
+_U16BE = struct.Struct('>H')
+
+# Chunks whose bodies are decoded; the raw preview of all others is loaded lazily
+_PNG_TEXT_CHUNKS = frozenset({'tEXt', 'iTXt', 'zTXt'})
+
+# Parsed standard metadata kept per extractor, keyed by file identity and version
+_METADATA_CACHE_SIZE = 1024
+
+
+@contextmanager
+def _map_file(file_path: Path):
+    """
+    Map a file read-only so chunk walks slice memory instead of issuing reads.
+
+    Yields an empty bytes object for empty files, which mmap cannot map.
+    Slices of the map are bytes copies, so nothing outlives the mapping.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
 
 
 class MetadataExtractor:
@@ -22,6 +54,41 @@ class MetadataExtractor:
             metadata_engine: Existing MetadataEngine instance (optional)
         """
         self.engine = metadata_engine or MetadataEngine()
+        self._metadata_cache: "OrderedDict[Tuple[str, int, int], ImageMetadata]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _read_metadata(self, file_path: Path, stat_result: os.stat_result) -> ImageMetadata:
+        """
+        Read standard metadata, reusing the last parse of an unchanged file.
+
+        Entries are keyed by absolute path, modification time and size, so an
+        edited file is parsed again. The cache is bounded and safe to share
+        between threads. Callers get their own copy, so changing one result
+        never affects the cache or other results.
+
+        Args:
+            file_path: Path to image file
+            stat_result: Current stat of file_path
+
+        Returns:
+            ImageMetadata for the file
+        """
+        key = (str(file_path.absolute()), stat_result.st_mtime_ns, stat_result.st_size)
+
+        with self._cache_lock:
+            metadata = self._metadata_cache.get(key)
+            if metadata is not None:
+                self._metadata_cache.move_to_end(key)
+                return metadata.copy()
+
+        metadata = self.engine.read_metadata(file_path)
+
+        with self._cache_lock:
+            self._metadata_cache[key] = metadata
+            if len(self._metadata_cache) > _METADATA_CACHE_SIZE:
+                self._metadata_cache.popitem(last=False)
+
+        return metadata.copy()
 
     def extract_all(self, file_path: Path) -> ExtractedMetadata:
         """
@@ -36,11 +103,17 @@ class MetadataExtractor:
         start_time = time.time()
         file_path = Path(file_path)
 
-        # Get standard metadata using existing system
-        standard_metadata = self.engine.read_metadata(file_path)
+        # Get standard metadata using existing system; a file that cannot be
+        # stat'ed goes straight to the engine, which reports the error
+        try:
+            stat_result = file_path.stat()
+        except OSError:
+            self.engine.read_metadata(file_path)
+            raise
+        standard_metadata = self._read_metadata(file_path, stat_result)
 
         # Get file info
-        file_size = file_path.stat().st_size
+        file_size = stat_result.st_size
         file_format = standard_metadata.format
 
         # Extract raw chunks based on format
@@ -76,32 +149,37 @@ class MetadataExtractor:
         chunks = []
         custom_fields = {}
 
-        with open(file_path, 'rb') as f:
-            # Skip PNG signature (8 bytes)
-            f.read(8)
+        with _map_file(file_path) as data:
+            size = len(data)
 
+            # Skip PNG signature (8 bytes)
             offset = 8
-            while True:
+            while offset + 4 <= size:
                 # Read chunk length and type
-                length_bytes = f.read(4)
-                if len(length_bytes) < 4:
-                    break
-
-                length = struct.unpack('>I', length_bytes)[0]
-                chunk_type = f.read(4).decode('ascii', errors='ignore')
-                chunk_data = f.read(length)
-                crc = f.read(4)  # CRC
+                length = _U32BE.unpack_from(data, offset)[0]
+                chunk_type = data[offset + 4:offset + 8].decode('ascii', errors='ignore')
+                data_start = offset + 8
+
+                # Only text chunks are read here; others load their preview on demand
+                if chunk_type in _PNG_TEXT_CHUNKS:
+                    chunk_data = data[data_start:data_start + length]
+                    preview = chunk_data[:RAW_PREVIEW_SIZE]
+                else:
+                    chunk_data = None
+                    preview = None
 
                 # Store raw chunk
                 chunk = RawChunk(
                     chunk_type=f"PNG:{chunk_type}",
                     offset=offset,
                     length=length,
-                    raw_data=chunk_data[:1000] if len(chunk_data) > 1000 else chunk_data
+                    raw_data=preview,
+                    source_path=file_path,
+                    data_offset=data_start
                 )
 
                 # Try to decode text chunks
-                if chunk_type in ('tEXt', 'iTXt', 'zTXt'):
+                if chunk_data is not None:
                     try:
                         if chunk_type == 'tEXt':
                             # Find null separator
@@ -136,38 +214,49 @@ class MetadataExtractor:
         chunks = []
         custom_fields = {}
 
-        with open(file_path, 'rb') as f:
+        with _map_file(file_path) as data:
             # Check JPEG signature
-            if f.read(2) != b'\xff\xd8':
+            if data[:2] != b'\xff\xd8':
                 return chunks, custom_fields
 
+            size = len(data)
             offset = 2
-            while True:
-                marker_start = f.read(1)
-                if not marker_start or marker_start != b'\xff':
-                    break
-
-                marker_type = f.read(1)
-                if not marker_type:
+            while offset + 2 <= size:
+                if data[offset] != 0xFF:
                     break
 
-                marker = marker_start + marker_type
+                marker = data[offset:offset + 2]
 
                 # EOI marker (end of image)
                 if marker == b'\xff\xd9':
                     break
 
                 # Read segment length
-                if marker[1:2] in (b'\xd0', b'\xd1', b'\xd2', b'\xd3', b'\xd4', b'\xd5', b'\xd6', b'\xd7', b'\xd8'):
+                if 0xD0 <= marker[1] <= 0xD8:
                     # RST markers have no length
+                    offset += 2
                     continue
 
-                length_bytes = f.read(2)
-                if len(length_bytes) < 2:
+                if offset + 4 > size:
                     break
 
-                length = struct.unpack('>H', length_bytes)[0] - 2  # Subtract length bytes
-                segment_data = f.read(length)
+                length = _U16BE.unpack_from(data, offset + 2)[0] - 2  # Subtract length bytes
+                data_start = offset + 4
+
+                # Tables, frame and scan headers (DQT, DHT, SOF, SOS) are never
+                # text; record them without copying or decoding the body
+                if not (0xE0 <= marker[1] <= 0xEF or marker[1] == 0xFE):
+                    chunks.append(RawChunk(
+                        chunk_type=f"JPEG:{marker.hex()}",
+                        offset=offset,
+                        length=length,
+                        source_path=file_path,
+                        data_offset=data_start
+                    ))
+                    offset += 4 + length
+                    continue
+
+                segment_data = data[data_start:data_start + length]
 
                 # Determine segment type
                 segment_type = f"JPEG:APP{marker[1] - 0xE0}" if 0xE0 <= marker[1] <= 0xEF else f"JPEG:{marker.hex()}"
@@ -185,7 +274,7 @@ class MetadataExtractor:
                     chunk_type=segment_type,
                     offset=offset,
                     length=length,
-                    raw_data=segment_data[:1000] if len(segment_data) > 1000 else segment_data
+                    raw_data=segment_data[:RAW_PREVIEW_SIZE]
                 )
 
                 # Try to decode as text
@@ -206,39 +295,35 @@ class MetadataExtractor:
         chunks = []
         custom_fields = {}
 
-        with open(file_path, 'rb') as f:
+        with _map_file(file_path) as data:
             # Read RIFF header
-            riff = f.read(4)
-            if riff != b'RIFF':
+            if data[:4] != b'RIFF':
                 return chunks, custom_fields
 
-            file_size = struct.unpack('<I', f.read(4))[0]
-            webp = f.read(4)
-            if webp != b'WEBP':
+            file_size = _U32LE.unpack_from(data, 4)[0]
+            if data[8:12] != b'WEBP':
                 return chunks, custom_fields
 
             offset = 12
             while offset < file_size + 8:
-                chunk_id = f.read(4)
+                chunk_id = data[offset:offset + 4]
                 if len(chunk_id) < 4:
                     break
 
-                chunk_size = struct.unpack('<I', f.read(4))[0]
-                chunk_data = f.read(chunk_size)
-
-                # Pad to even byte boundary
-                if chunk_size % 2:
-                    f.read(1)
+                chunk_size = _U32LE.unpack_from(data, offset + 4)[0]
+                data_start = offset + 8
 
                 chunk_type = f"WebP:{chunk_id.decode('ascii', errors='ignore')}"
                 chunk = RawChunk(
                     chunk_type=chunk_type,
                     offset=offset,
                     length=chunk_size,
-                    raw_data=chunk_data[:1000] if len(chunk_data) > 1000 else chunk_data
+                    source_path=file_path,
+                    data_offset=data_start
                 )
 
                 chunks.append(chunk)
+                # Chunks are padded to an even byte boundary
                 offset += 8 + chunk_size + (chunk_size % 2)
 
         return chunks, custom_fields
@@ -1,10 +1,18 @@
 """
 Data models for metadata discovery.
 """
+import sys
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Maximum number of body bytes kept as a chunk's raw data preview
+RAW_PREVIEW_SIZE = 1000
 
 
 class ConfidenceLevel(Enum):
@@ -15,19 +23,38 @@ class ConfidenceLevel(Enum):
     UNKNOWN = "Unknown"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RawChunk:
     """Raw metadata chunk from image file."""
     chunk_type: str  # e.g., "PNG:tEXt", "JPEG:APP1", "EXIF:UserComment"
     offset: int  # Byte offset in file
     length: int  # Chunk size in bytes
-    raw_data: bytes  # Raw binary data
+    raw_data: Optional[bytes] = None  # Raw binary data preview; None until loaded
     decoded_text: Optional[str] = None  # Decoded text if applicable
     encoding: Optional[str] = None  # Detected encoding
     parse_error: Optional[str] = None  # Error if parsing failed
+    source_path: Optional[Path] = None  # File raw_data is loaded from on first use
+    data_offset: int = 0  # Byte offset of the chunk body in source_path
+
+    def get_raw_data(self) -> bytes:
+        """
+        Get the raw data preview, reading it from the source file on first use.
 
+        Chunks nobody inspects never copy their bytes out of the file.
 
-@dataclass
+        Returns:
+            Up to RAW_PREVIEW_SIZE bytes of the chunk body
+        """
+        if self.raw_data is None:
+            if self.source_path is None:
+                return b''
+            with open(self.source_path, 'rb') as f:
+                f.seek(self.data_offset)
+                self.raw_data = f.read(min(self.length, RAW_PREVIEW_SIZE))
+        return self.raw_data
+
+
+@dataclass(**_SLOTS)
 class ExtractedMetadata:
     """Complete metadata extraction result."""
     file_path: Path
@@ -40,7 +67,7 @@ class ExtractedMetadata:
     extraction_time: float = 0.0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PatternIndicator:
     """Single indicator for platform detection."""
     field_path: str  # e.g., "PNG:tEXt:parameters"
@@ -50,7 +77,7 @@ class PatternIndicator:
     is_required: bool = False  # Must match for platform to be detected
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PlatformPattern:
     """Platform detection pattern definition."""
     platform_id: str  # e.g., "stable_diffusion"
@@ -62,7 +89,7 @@ class PlatformPattern:
     documentation_url: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ModelInfo:
     """AI model information."""
     name: str
@@ -72,7 +99,7 @@ class ModelInfo:
     source: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AIMetadata:
     """Structured AI-specific metadata."""
     prompts: Dict[str, str] = field(default_factory=dict)  # positive, negative, system
@@ -83,7 +110,7 @@ class AIMetadata:
     raw_data: Dict[str, Any] = field(default_factory=dict)  # Unstructured additional data
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DetectionResult:
     """Platform detection result."""
     platform_id: str
@@ -95,7 +122,7 @@ class DetectionResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DiscoveryResult:
     """Complete discovery result for single image."""
     file_path: Path
@@ -107,7 +134,7 @@ class DiscoveryResult:
     discovery_time: float = 0.0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BatchDiscoveryResult:
     """Aggregated results for multiple images."""
     results: List[DiscoveryResult] = field(default_factory=list)
@@ -118,3 +145,42 @@ class BatchDiscoveryResult:
     common_fields: Dict[str, int] = field(default_factory=dict)
     anomalies: List[str] = field(default_factory=list)
     total_time: float = 0.0
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Iterable[DiscoveryResult],
+        failures: Iterable[Tuple[Path, Exception]] = (),
+        total_time: float = 0.0,
+    ) -> "BatchDiscoveryResult":
+        """
+        Aggregate discovery results in a single pass.
+
+        Args:
+            results: Successful discovery results
+            failures: (file_path, error) pairs for files that failed
+            total_time: Wall-clock time for the whole batch
+
+        Returns:
+            BatchDiscoveryResult with platform and custom field counts
+        """
+        results = list(results)
+        anomalies = [f"{file_path}: {error}" for file_path, error in failures]
+
+        platform_distribution = Counter(result.detection.platform_id for result in results)
+        common_fields = Counter(
+            field_name
+            for result in results
+            for field_name in result.extracted_metadata.custom_fields
+        )
+
+        return cls(
+            results=results,
+            total_images=len(results) + len(anomalies),
+            successful=len(results),
+            failed=len(anomalies),
+            platform_distribution=dict(platform_distribution),
+            common_fields=dict(common_fields),
+            anomalies=anomalies,
+            total_time=total_time,
+        )
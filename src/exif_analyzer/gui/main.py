@@ -2,17 +2,43 @@
 Main GUI application for ExifAnalyzer using PySimpleGUI.
 """
 import PySimpleGUI as sg
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+import hashlib
 import io
+import json
+import os
+import sqlite3
+import time
 from PIL import Image
 import base64
 
+try:
+    from PIL import ImageTk
+except ImportError:  # Pillow built without Tk support
+    ImageTk = None
+
 from ..core.engine import MetadataEngine
-from ..core.exceptions import ExifAnalyzerError
+from ..core.exceptions import ExifAnalyzerError, MetadataError
 from ..core.config import config
+from ..core.metadata import ImageMetadata, compile_key_patterns
 from ..core.logger import setup_logger
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Schema version of the metadata cache; older databases are rebuilt
+_METADATA_CACHE_VERSION = 1
+
+
+def _get_cache_dir() -> Path:
+    """Get the per-user directory for GUI caches."""
+    if os.name == 'nt':  # Windows
+        return Path(os.environ.get('LOCALAPPDATA', Path.home())) / "ExifAnalyzer" / "cache"
+    else:  # macOS/Linux
+        return Path(os.environ.get('XDG_CACHE_HOME', Path.home() / ".cache")) / "exif_analyzer"
+
 
 class ExifAnalyzerGUI:
     """
@@ -42,6 +68,44 @@ class ExifAnalyzerGUI:
             sg.popup_error(f'Error initializing ExifAnalyzer engine: {e}')
             self.supported_formats = []
 
+        # Privacy patterns don't change while the GUI runs, so compile them once;
+        # they are lowercased to match the lowercased keys they are tested against
+        self._privacy_re = compile_key_patterns(tuple(pattern.lower() for pattern in config.get_privacy_patterns()))
+        # Rows currently shown in the metadata tree
+        self._tree_rows: Optional[List[Tuple[str, str, str, str]]] = None
+
+        # Lowercase extensions shown in the file list
+        self._ext_set = frozenset(fmt.lower() for fmt in self.supported_formats)
+        self._ext_suffixes = tuple(f'.{ext}' for ext in self._ext_set)
+
+        # Folder scans run off the GUI thread; only the newest scan's result is shown
+        self._scan_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='folder-scan')
+        self._scan_token = 0
+        # Paths of the file list entries, in listbox order
+        self._list_paths: List[Path] = []
+
+        # Warms the OS page cache with the start of each listed image, where the metadata lives
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='header-prefetch')
+        self._prefetch_bytes = config.get('display.prefetch_header_bytes', 65536)
+
+        # Rendered previews as (thumbnail, info_text), keyed by (path, mtime_ns, size)
+        self._preview_cache: "OrderedDict[Tuple[str, int, int], Tuple[Image.Image, str]]" = OrderedDict()
+        # The Tk image is deleted when its PhotoImage is collected, so keep it alive here
+        self._preview_photo = None
+        self._preview_cache_size = config.get('display.preview_cache_size', 256)
+        self._preview_disk_dir = _get_cache_dir() / "previews" if config.get('display.preview_disk_cache', False) else None
+        self._preview_disk_cache_size = config.get('display.preview_disk_cache_size', 512)
+
+        # Parsed metadata of previously seen files, keyed by (path, mtime_ns, size)
+        self._meta_db = self._open_metadata_cache() if config.get('display.metadata_cache', False) else None
+        self._meta_cache_size = config.get('display.metadata_cache_size', 1000)
+
+        # Metadata load and preview waiting for the selection to settle, as (file_path, selected_at)
+        self._pending_selection: Optional[Tuple[Path, float]] = None
+        self._selection_delay = config.get('display.selection_debounce_ms', 50) / 1000
+        self._pending_preview: Optional[Tuple[Path, float]] = None
+        self._preview_delay = config.get('display.preview_debounce_ms', 150) / 1000
+
         # GUI theme and settings
         sg.theme('DefaultNoMoreNagging')
         self.window = None
@@ -130,83 +194,345 @@ class ExifAnalyzerGUI:
                                resizable=True, size=(1200, 800),
                                icon=None, finalize=True)
 
-    def _update_file_list(self, folder_path: str) -> None:
-        """Update the file list with all files (no filtering for debugging)."""
+    def _update_file_list(self, folder_path: str, background: bool = True) -> None:
+        """
+        Update the file list with supported images, or every entry if display.show_all_files is set.
+
+        Args:
+            folder_path: Folder to list
+            background: Scan on a worker thread and deliver the result as a
+                -SCAN_DONE- event, so slow (e.g. network) folders don't block the UI
+        """
+        # A new scan makes any scan still running stale
+        self._scan_token += 1
+        token = self._scan_token
+
+        if not background:
+            self._apply_file_list(self._scan_folder(folder_path, token))
+            return
+
+        self.window['-STATUS-'].update(f'Scanning {folder_path}...')
+        self._scan_pool.submit(self._scan_folder_bg, folder_path, token)
+
+    def _scan_folder_bg(self, folder_path: str, token: int) -> None:
+        """Scan a folder on a worker thread and post the result to the event loop."""
+        try:
+            result = self._scan_folder(folder_path, token)
+            if result is not None:
+                self.window.write_event_value('-SCAN_DONE-', (token, result))
+        except Exception as e:
+            # The window may already be closed
+            self.logger.debug(f"Discarding folder scan result: {e}")
+
+    def _scan_folder(self, folder_path: str, token: int) -> Optional[Tuple[List[Tuple[str, Path]], str, List[str]]]:
+        """
+        Build the file list entries and status text for a folder.
+
+        Does not touch the window, so it is safe to call from a worker thread.
+
+        Args:
+            folder_path: Folder to list
+            token: Scan token; the scan stops early once a newer scan starts
+
+        Returns:
+            Tuple of (sorted (display name, path) list entries, status text,
+            paths of the listed images), or None if the scan went stale
+        """
         try:
             folder = Path(folder_path)
             if not folder.exists() or not folder.is_dir():
-                self.window['-STATUS-'].update(f'Path does not exist or is not a directory: {folder_path}')
-                return
+                return [], f'Path does not exist or is not a directory: {folder_path}', []
 
-            # Show ALL items for debugging
+            # Showing every entry is a debugging aid; normally only supported images are listed
+            show_all = config.get('display.show_all_files', False)
             all_items = []
+            image_paths = []
             files_count = 0
             dirs_count = 0
-
-            for item_path in folder.iterdir():
-                if item_path.is_file():
-                    files_count += 1
-                    ext = item_path.suffix.lower().lstrip('.')
-                    display_name = f"{item_path.name} ({ext}) [FILE]"
-                    all_items.append(display_name)
-                elif item_path.is_dir():
-                    dirs_count += 1
-                    display_name = f"{item_path.name} [FOLDER]"
-                    all_items.append(display_name)
-                else:
-                    display_name = f"{item_path.name} [UNKNOWN]"
-                    all_items.append(display_name)
-
-            # Update the listbox with all items
-            all_items.sort()
-            self.window['-FILE_LIST-'].update(values=all_items)
-
-            # Update status with detailed debugging info
+            hidden_count = 0
+
+            # DirEntry caches the file type from the directory scan, so this needs
+            # no stat() per entry except for symlinks
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if token != self._scan_token:
+                        return None
+
+                    if not show_all:
+                        # One C-level suffix test rejects unsupported names before
+                        # any per-entry extension parsing. A dotfile named just
+                        # ".jpg" has no extension, as in supports_format
+                        name = entry.name
+                        if (not name.lower().endswith(self._ext_suffixes) or name.rfind('.') == 0
+                                or not entry.is_file()):
+                            hidden_count += 1
+                            continue
+
+                    if entry.is_file():
+                        ext = os.path.splitext(entry.name)[1].lower().lstrip('.')
+                        files_count += 1
+                        if ext in self._ext_set:
+                            image_paths.append(entry.path)
+                        display_name = f"{entry.name} ({ext}) [FILE]"
+                        all_items.append((display_name, folder / entry.name))
+                    elif entry.is_dir():
+                        dirs_count += 1
+                        display_name = f"{entry.name} [FOLDER]"
+                        all_items.append((display_name, folder / entry.name))
+                    else:
+                        display_name = f"{entry.name} [UNKNOWN]"
+                        all_items.append((display_name, folder / entry.name))
+
+            all_items.sort(key=lambda item: item[0])
+
+            # Status with detailed debugging info
             total_items = len(all_items)
             supported_exts = ', '.join(sorted(self.supported_formats)) if self.supported_formats else "NONE!"
-            self.window['-STATUS-'].update(f'Found: {files_count} files, {dirs_count} folders, {total_items} total. Formats: {supported_exts}')
+            if show_all:
+                status = f'Found: {files_count} files, {dirs_count} folders, {total_items} total. Formats: {supported_exts}'
+            else:
+                status = f'Found: {files_count} images ({hidden_count} other entries hidden). Formats: {supported_exts}'
+            return all_items, status, image_paths
 
         except Exception as e:
             self.logger.error(f"Error updating file list: {e}")
-            self.window['-STATUS-'].update(f'Error: {e}')
+            return [], f'Error: {e}', []
+
+    def _apply_file_list(self, result: Optional[Tuple[List[Tuple[str, Path]], str, List[str]]]) -> None:
+        """Show a folder scan result in the file list and status bar."""
+        if result is None:
+            return
+
+        all_items, status, image_paths = result
+        # Selections are resolved by index, so names containing " (" need no parsing
+        self._list_paths = [path for _, path in all_items]
+        self.window['-FILE_LIST-'].update(values=[display_name for display_name, _ in all_items])
+        self.window['-STATUS-'].update(status)
+
+        if self._prefetch_bytes > 0:
+            token = self._scan_token
+            for image_path in image_paths:
+                self._prefetch_pool.submit(self._prefetch_header, image_path, token)
+
+    def _prefetch_header(self, image_path: str, token: int) -> None:
+        """
+        Pull the start of an image file into the OS page cache.
+
+        Selecting the file later then reads its metadata from memory instead
+        of disk. Runs on the prefetch pool; skipped once another folder is listed.
+
+        Args:
+            image_path: Image file to prefetch
+            token: Scan token of the listing the file came from
+        """
+        if token != self._scan_token:
+            return
+
+        try:
+            with open(image_path, 'rb') as f:
+                if hasattr(os, 'posix_fadvise'):
+                    # Queue asynchronous kernel readahead without copying into Python
+                    os.posix_fadvise(f.fileno(), 0, self._prefetch_bytes, os.POSIX_FADV_WILLNEED)
+                else:
+                    f.read(self._prefetch_bytes)
+        except OSError:
+            pass
 
     def _load_image_preview(self, file_path: Path) -> None:
         """Load and display image preview."""
         try:
-            # Load image
-            with Image.open(file_path) as img:
-                # Get image info
-                width, height = img.size
-                mode = img.mode
-
-                # Resize for preview while maintaining aspect ratio
-                preview_size = (300, 300)
-                img.thumbnail(preview_size, Image.Resampling.LANCZOS)
-
-                # Convert to bytes for PySimpleGUI
-                bio = io.BytesIO()
-                img.save(bio, format='PNG')
-                image_bytes = bio.getvalue()
-
-                # Update preview
-                self.window['-IMAGE-'].update(data=image_bytes)
-
-                # Update image info
-                file_size = file_path.stat().st_size
-                size_str = self._format_file_size(file_size)
-                info_text = f'{width}x{height} ({mode})\n{size_str}'
-                self.window['-IMAGE_INFO-'].update(info_text)
+            # The key changes whenever the file is modified, so stale entries are never hit
+            stat = file_path.stat()
+            key = (str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+            preview = self._get_cached_preview(key)
+            if preview is None:
+                preview = self._render_preview(file_path, stat.st_size)
+                self._store_cached_preview(key, preview)
+
+            thumbnail, info_text = preview
+            self._show_preview(thumbnail)
+            self.window['-IMAGE_INFO-'].update(info_text)
 
         except Exception as e:
             self.logger.error(f"Error loading image preview: {e}")
             self.window['-IMAGE-'].update(data=b'')
             self.window['-IMAGE_INFO-'].update(f'Preview error: {str(e)[:50]}')
 
+    def _show_preview(self, thumbnail: Image.Image) -> None:
+        """Display a preview thumbnail, handing pixels straight to Tk when possible."""
+        if ImageTk is not None:
+            self._preview_photo = ImageTk.PhotoImage(thumbnail)
+            self.window['-IMAGE-'].Widget.configure(image=self._preview_photo)
+        else:
+            self.window['-IMAGE-'].update(data=self._encode_png(thumbnail))
+
+    @staticmethod
+    def _encode_png(thumbnail: Image.Image) -> bytes:
+        """Encode a preview thumbnail as PNG bytes."""
+        bio = io.BytesIO()
+        thumbnail.save(bio, format='PNG')
+        return bio.getvalue()
+
+    def _render_preview(self, file_path: Path, file_size: int) -> Tuple[Image.Image, str]:
+        """
+        Decode an image and render its preview thumbnail.
+
+        Args:
+            file_path: Image file to render
+            file_size: File size in bytes, for the info text
+
+        Returns:
+            Tuple of (thumbnail image, info text)
+        """
+        with Image.open(file_path) as img:
+            # Get image info
+            width, height = img.size
+            mode = img.mode
+
+            # Let libjpeg scale down by 1/2, 1/4 or 1/8 while decoding, keeping
+            # twice the preview size so the final resample still has detail
+            preview_size = config.get('display.preview_image_size', 300)
+            if img.format == 'JPEG' and config.get('display.preview_use_draft', True):
+                img.draft('RGB', (preview_size * 2, preview_size * 2))
+
+            # Resize for preview while maintaining aspect ratio; bilinear is
+            # indistinguishable from Lanczos at thumbnail size and cheaper.
+            # reducing_gap first box-reduces by an integer factor, so the
+            # separable resample only runs over at most 2x the output size
+            img.thumbnail((preview_size, preview_size), Image.Resampling.BILINEAR, reducing_gap=2.0)
+
+            # Images already within the preview size are not loaded by thumbnail()
+            img.load()
+
+        size_str = self._format_file_size(file_size)
+        return img, f'{width}x{height} ({mode})\n{size_str}'
+
+    def _preview_disk_paths(self, key: Tuple[str, int, int]) -> Tuple[Path, Path]:
+        """Get the PNG and info sidecar paths for a preview on disk."""
+        preview_size = config.get('display.preview_image_size', 300)
+        digest = hashlib.sha1(repr((key, preview_size)).encode('utf-8')).hexdigest()
+        return self._preview_disk_dir / f"{digest}.png", self._preview_disk_dir / f"{digest}.json"
+
+    def _get_cached_preview(self, key: Tuple[str, int, int]) -> Optional[Tuple[Image.Image, str]]:
+        """
+        Look up a rendered preview in memory, then on disk.
+
+        Args:
+            key: (resolved path, mtime_ns, size) of the image file
+
+        Returns:
+            Tuple of (thumbnail image, info text), or None if not cached
+        """
+        preview = self._preview_cache.get(key)
+        if preview is not None:
+            self._preview_cache.move_to_end(key)
+            return preview
+
+        if self._preview_disk_dir is None:
+            return None
+
+        png_path, info_path = self._preview_disk_paths(key)
+        try:
+            with open(info_path, 'r', encoding='utf-8') as f:
+                info_text = json.load(f)['info_text']
+            # Decode from memory so the cached image doesn't keep the file open
+            thumbnail = Image.open(io.BytesIO(png_path.read_bytes()))
+            thumbnail.load()
+            preview = (thumbnail, info_text)
+        except (OSError, ValueError, KeyError):
+            return None
+
+        # The PNG's mtime orders previews for pruning, so mark this one as used
+        try:
+            os.utime(png_path)
+        except OSError:
+            pass
+
+        self._remember_preview(key, preview)
+        return preview
+
+    def _store_cached_preview(self, key: Tuple[str, int, int], preview: Tuple[Image.Image, str]) -> None:
+        """
+        Cache a rendered preview in memory and, if enabled, on disk.
+
+        Args:
+            key: (resolved path, mtime_ns, size) of the image file
+            preview: Tuple of (thumbnail image, info text)
+        """
+        self._remember_preview(key, preview)
+
+        if self._preview_disk_dir is None:
+            return
+
+        png_path, info_path = self._preview_disk_paths(key)
+        try:
+            self._preview_disk_dir.mkdir(parents=True, exist_ok=True)
+            png_path.write_bytes(self._encode_png(preview[0]))
+            # The sidecar is written last, so a lookup never finds it without its PNG
+            with open(info_path, 'w', encoding='utf-8') as f:
+                json.dump({'info_text': preview[1]}, f)
+        except OSError as e:
+            self.logger.debug(f"Could not write preview cache: {e}")
+            return
+
+        self._prune_preview_disk_cache()
+
+    def _prune_preview_disk_cache(self) -> None:
+        """Delete the least recently used previews beyond the disk cache size."""
+        try:
+            with os.scandir(self._preview_disk_dir) as it:
+                previews = [(entry.stat().st_mtime_ns, entry.path) for entry in it if entry.name.endswith('.png')]
+        except OSError as e:
+            self.logger.debug(f"Could not prune preview cache: {e}")
+            return
+
+        excess = len(previews) - self._preview_disk_cache_size
+        if excess <= 0:
+            return
+
+        previews.sort()
+        for _, png_path in previews[:excess]:
+            # The sidecar goes first, so a lookup never finds it without its PNG
+            for path in (png_path[:-len('.png')] + '.json', png_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _discard_cached_preview(self, key: Tuple[str, int, int]) -> None:
+        """
+        Remove a preview from memory and disk, e.g. after its file was stripped.
+
+        Args:
+            key: (resolved path, mtime_ns, size) of the image file as it was cached
+        """
+        self._preview_cache.pop(key, None)
+
+        if self._preview_disk_dir is None:
+            return
+
+        png_path, info_path = self._preview_disk_paths(key)
+        for path in (info_path, png_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.debug(f"Could not remove cached preview {path}: {e}")
+
+    def _remember_preview(self, key: Tuple[str, int, int], preview: Tuple[Image.Image, str]) -> None:
+        """Add a preview to the in-memory LRU, evicting the oldest entries."""
+        self._preview_cache[key] = preview
+        self._preview_cache.move_to_end(key)
+        while len(self._preview_cache) > self._preview_cache_size:
+            self._preview_cache.popitem(last=False)
+
     def _load_metadata(self, file_path: Path) -> None:
         """Load and display metadata for the selected file."""
         try:
             self.current_file = file_path
-            self.current_metadata = self.engine.read_metadata(file_path)
+            self.current_metadata = self._read_metadata_cached(file_path)
 
             # Update file info
             self.window['-FILE_NAME-'].update(file_path.name)
@@ -223,9 +549,8 @@ class ExifAnalyzerGUI:
             self._update_metadata_tree()
 
             # Update status
-            total_keys = sum(len(block.keys()) for block in
-                           [self.current_metadata.exif, self.current_metadata.iptc,
-                            self.current_metadata.xmp, self.current_metadata.custom])
+            metadata = self.current_metadata
+            total_keys = len(metadata.exif) + len(metadata.iptc) + len(metadata.xmp) + len(metadata.custom)
             self.window['-STATUS-'].update(f'Loaded {total_keys} metadata entries')
 
         except Exception as e:
@@ -233,12 +558,124 @@ class ExifAnalyzerGUI:
             self.window['-STATUS-'].update(f'Error loading metadata: {e}')
             self._clear_metadata_display()
 
+    def _open_metadata_cache(self) -> Optional[sqlite3.Connection]:
+        """
+        Open the on-disk metadata cache, creating it on first use.
+
+        Returns:
+            Database connection, or None if the cache cannot be opened
+        """
+        try:
+            cache_dir = _get_cache_dir()
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(cache_dir / "metadata.db"))
+            db.execute('PRAGMA journal_mode=WAL')
+            if db.execute('PRAGMA user_version').fetchone()[0] != _METADATA_CACHE_VERSION:
+                with db:
+                    db.execute('DROP TABLE IF EXISTS metadata')
+                    db.execute(f'PRAGMA user_version = {_METADATA_CACHE_VERSION}')
+            # used orders rows for least-recently-used eviction
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS metadata ('
+                'path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, json BLOB, used INTEGER)'
+            )
+            return db
+        except (OSError, sqlite3.Error) as e:
+            self.logger.debug(f"Metadata cache disabled: {e}")
+            return None
+
+    def _read_metadata_cached(self, file_path: Path) -> ImageMetadata:
+        """
+        Read metadata, reusing the cached parse if the file is unchanged.
+
+        Only metadata that survives a JSON round trip unchanged is cached, so
+        a cache hit always equals a fresh read.
+
+        Args:
+            file_path: Image file to read
+
+        Returns:
+            ImageMetadata for the file
+        """
+        if self._meta_db is None:
+            return self.engine.read_metadata(file_path)
+
+        # mtime and size are part of the lookup, so a modified file never hits
+        stat = file_path.stat()
+        key = (str(file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        try:
+            row = self._meta_db.execute(
+                'SELECT json FROM metadata WHERE path = ? AND mtime_ns = ? AND size = ?', key
+            ).fetchone()
+            if row is not None:
+                metadata = ImageMetadata.from_json(row[0])
+                with self._meta_db:
+                    self._meta_db.execute('UPDATE metadata SET used = ? WHERE path = ?', (time.time_ns(), key[0]))
+                return metadata
+        except (sqlite3.Error, MetadataError, KeyError, TypeError) as e:
+            self.logger.debug(f"Ignoring metadata cache entry for {file_path}: {e}")
+
+        metadata = self.engine.read_metadata(file_path)
+        encoded = metadata.to_json()
+        try:
+            with self._meta_db:
+                # Values JSON cannot represent exactly (e.g. the int keys and tuples
+                # of PIL:GPSInfo) would come back altered, so such files are not
+                # cached; any row left from an earlier version of the file goes too
+                if ImageMetadata.from_json(encoded) != metadata:
+                    self._meta_db.execute('DELETE FROM metadata WHERE path = ?', key[:1])
+                    return metadata
+
+                self._meta_db.execute(
+                    'INSERT OR REPLACE INTO metadata (path, mtime_ns, size, json, used) VALUES (?, ?, ?, ?, ?)',
+                    (*key, encoded, time.time_ns())
+                )
+                self._meta_db.execute(
+                    'DELETE FROM metadata WHERE path IN '
+                    '(SELECT path FROM metadata ORDER BY used DESC LIMIT -1 OFFSET ?)',
+                    (self._meta_cache_size,)
+                )
+        except (sqlite3.Error, MetadataError, KeyError, TypeError) as e:
+            self.logger.debug(f"Could not write metadata cache: {e}")
+        return metadata
+
+    def _discard_cached_metadata(self, file_path: Path) -> None:
+        """Remove a file's cached metadata, e.g. after it was stripped."""
+        if self._meta_db is None:
+            return
+
+        try:
+            with self._meta_db:
+                self._meta_db.execute('DELETE FROM metadata WHERE path = ?', (str(file_path.resolve()),))
+        except sqlite3.Error as e:
+            self.logger.debug(f"Could not remove metadata cache entry for {file_path}: {e}")
+
     def _update_metadata_tree(self) -> None:
         """Update the metadata tree view."""
         if not self.current_metadata:
             return
 
+        # Repopulating the Tk tree costs one Tcl call per row, so skip it when
+        # the rows shown already match (e.g. reselecting the same file)
+        rows = self._build_metadata_rows()
+        if rows == self._tree_rows:
+            return
+
         tree_data = sg.TreeData()
+        for parent_key, row_key, text, value in rows:
+            tree_data.Insert(parent_key, row_key, text, [value])
+
+        self.window['-METADATA_TREE-'].update(tree_data)
+        self._tree_rows = rows
+
+    def _build_metadata_rows(self) -> List[Tuple[str, str, str, str]]:
+        """
+        Build the metadata tree rows for the current file.
+
+        Returns:
+            List of (parent_key, row_key, text, value) tuples in display order
+        """
+        rows = []
 
         # Add metadata blocks
         for block_name, block in [
@@ -247,25 +684,29 @@ class ExifAnalyzerGUI:
             ('XMP', self.current_metadata.xmp),
             ('Custom', self.current_metadata.custom)
         ]:
-            if not block.is_empty():
-                # Add block header
-                block_key = f'{block_name}_BLOCK'
-                tree_data.Insert('', block_key, f'{block_name} ({len(block.keys())} keys)', [''])
+            # One sorted pass over the items gives the count, keys and values
+            items = sorted(block.data.items())
+            if not items:
+                continue
 
-                # Add metadata entries
-                for key in sorted(block.keys()):
-                    value = str(block.get(key))
-                    # Truncate long values
-                    if len(value) > 50:
-                        value = value[:47] + '...'
+            # Add block header
+            block_key = f'{block_name}_BLOCK'
+            rows.append(('', block_key, f'{block_name} ({len(items)} keys)', ''))
 
-                    # Check if key is privacy-sensitive
-                    is_sensitive = any(pattern in key.lower() for pattern in config.get_privacy_patterns())
-                    display_key = f'{key} (⚠)' if is_sensitive else key
+            # Add metadata entries
+            for key, raw_value in items:
+                value = str(raw_value)
+                # Truncate long values
+                if len(value) > 50:
+                    value = value[:47] + '...'
 
-                    tree_data.Insert(block_key, f'{block_name}_{key}', display_key, [value])
+                # Check if key is privacy-sensitive
+                is_sensitive = self._privacy_re.search(key.lower()) is not None
+                display_key = f'{key} (⚠)' if is_sensitive else key
 
-        self.window['-METADATA_TREE-'].update(tree_data)
+                rows.append((block_key, f'{block_name}_{key}', display_key, value))
+
+        return rows
 
     def _clear_metadata_display(self) -> None:
         """Clear the metadata display."""
@@ -274,16 +715,15 @@ class ExifAnalyzerGUI:
         self.window['-SIZE-'].update('')
         self.window['-GPS_STATUS-'].update('')
         self.window['-METADATA_TREE-'].update(sg.TreeData())
+        self._tree_rows = None
         self.window['-IMAGE-'].update(data=b'')
         self.window['-IMAGE_INFO-'].update('')
 
     def _format_file_size(self, size_bytes: int) -> str:
         """Format file size in human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        # Every unit step is 10 bits, so the bit length picks the unit directly
+        idx = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1) if size_bytes >= 1024 else 0
+        return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
 
     def _handle_strip_metadata(self, gps_only: bool = False) -> None:
         """Handle metadata stripping operations."""
@@ -302,6 +742,11 @@ class ExifAnalyzerGUI:
             self.window['-STATUS-'].update('Processing...')
             self.window['-PROGRESS-'].update('Working...')
 
+            # Cache key of the file's current contents, whose thumbnail must not
+            # outlive the strip
+            stat = self.current_file.stat()
+            preview_key = (str(self.current_file.resolve()), stat.st_mtime_ns, stat.st_size)
+
             # Perform operation
             if gps_only:
                 result_path = self.engine.strip_gps_data(
@@ -314,7 +759,13 @@ class ExifAnalyzerGUI:
                     create_backup=config.should_create_backup()
                 )
 
-            # Reload metadata
+            self._discard_cached_preview(preview_key)
+            self._discard_cached_metadata(self.current_file)
+
+            # Reload metadata from the written file rather than stripping the
+            # in-memory copy: adapters may drop or keep entries an in-memory
+            # strip would not (e.g. TIFF structure tags), and the view must
+            # show what is actually left in the file
             self._load_metadata(self.current_file)
 
             # Success message
@@ -348,7 +799,10 @@ class ExifAnalyzerGUI:
 
         try:
             self.window['-STATUS-'].update('Exporting metadata...')
-            export_path = self.engine.export_metadata(self.current_file, export_file)
+            # Export the metadata on display instead of parsing the file again
+            export_path = self.engine.export_metadata(
+                self.current_file, export_file, metadata=self.current_metadata
+            )
 
             sg.popup_quick_message('Metadata exported successfully!', auto_close_duration=2)
             self.window['-STATUS-'].update(f'Exported to: {Path(export_path).name}')
@@ -395,11 +849,36 @@ class ExifAnalyzerGUI:
         """Run the main GUI event loop."""
         try:
             while True:
-                event, values = self.window.read()
+                # Only poll while a selection is waiting; otherwise block until the next event
+                waiting = self._pending_selection or self._pending_preview
+                event, values = self.window.read(timeout=30 if waiting else None)
 
                 if event == sg.WIN_CLOSED or event == 'Exit':
                     break
 
+                # Any other action works on the latest selection, so load it first
+                if self._pending_selection and event not in (sg.TIMEOUT_EVENT, '-FILE_LIST-'):
+                    self._load_metadata(self._pending_selection[0])
+                    self._pending_selection = None
+
+                # Load metadata, then decode the preview, once the selection has stopped changing
+                if event == sg.TIMEOUT_EVENT:
+                    now = time.monotonic()
+                    if self._pending_selection and now - self._pending_selection[1] >= self._selection_delay:
+                        file_path, _ = self._pending_selection
+                        self._pending_selection = None
+                        self._load_metadata(file_path)
+                    if self._pending_preview and now - self._pending_preview[1] >= self._preview_delay:
+                        file_path, _ = self._pending_preview
+                        self._pending_preview = None
+                        self._load_image_preview(file_path)
+
+                # Show a finished folder scan unless a newer one has started
+                elif event == '-SCAN_DONE-':
+                    token, result = values['-SCAN_DONE-']
+                    if token == self._scan_token:
+                        self._apply_file_list(result)
+
                 # Handle folder selection
                 elif event == '-FOLDER-':
                     folder_path = values['-FOLDER-']
@@ -408,20 +887,15 @@ class ExifAnalyzerGUI:
 
                 # Handle file selection
                 elif event == '-FILE_LIST-':
-                    selected_files = values['-FILE_LIST-']
-                    if selected_files:
-                        folder_path = values['-FOLDER-']
-                        if folder_path:
-                            # Extract actual filename from display format "filename.ext (ext)"
-                            display_name = selected_files[0]
-                            if ' (' in display_name:
-                                actual_filename = display_name.split(' (')[0]
-                            else:
-                                actual_filename = display_name
-
-                            file_path = Path(folder_path) / actual_filename
-                            self._load_image_preview(file_path)
-                            self._load_metadata(file_path)
+                    selected_indexes = self.window['-FILE_LIST-'].get_indexes()
+                    if selected_indexes:
+                        file_path = self._list_paths[selected_indexes[0]]
+                        # Replace any selection still waiting, so scrolling past
+                        # files with the arrow keys only loads the one it stops on;
+                        # metadata is cheap and follows quickly, pixel decoding later
+                        selected_at = time.monotonic()
+                        self._pending_selection = (file_path, selected_at)
+                        self._pending_preview = (file_path, selected_at)
 
                 # Handle refresh
                 elif event == '-REFRESH-':
@@ -458,9 +932,11 @@ class ExifAnalyzerGUI:
                     if file_path:
                         file_path = Path(file_path)
                         self.window['-FOLDER-'].update(str(file_path.parent))
-                        self._update_file_list(str(file_path.parent))
-                        self.window['-FILE_LIST-'].update(set_to_index=[0] if file_path.name in
-                                                         self.window['-FILE_LIST-'].get_list_values() else [])
+                        self._update_file_list(str(file_path.parent), background=False)
+                        file_index = self._list_paths.index(file_path) if file_path in self._list_paths else None
+                        self.window['-FILE_LIST-'].update(set_to_index=[] if file_index is None else [file_index])
+                        self._pending_selection = None
+                        self._pending_preview = None
                         self._load_image_preview(file_path)
                         self._load_metadata(file_path)
 
@@ -478,6 +954,12 @@ class ExifAnalyzerGUI:
             sg.popup_error(f'Application error: {e}')
 
         finally:
+            # Stop any running scan at its next entry
+            self._scan_token += 1
+            self._scan_pool.shutdown(wait=False)
+            self._prefetch_pool.shutdown(wait=False)
+            if self._meta_db is not None:
+                self._meta_db.close()
             if self.window:
                 self.window.close()
 
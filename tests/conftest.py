@@ -4,9 +4,67 @@ Test configuration and fixtures for ExifAnalyzer.
 import pytest
 import tempfile
 import os
+import io
 from pathlib import Path
 
 
+def _encode_image(size, color, format="JPEG", mode='RGB') -> bytes:
+    """Encode a solid-color test image to bytes."""
+    from PIL import Image
+
+    # Tests only need valid PNG bytes, so skip the default level 6 deflate work
+    options = {"compress_level": 1} if format == "PNG" else {}
+    buffer = io.BytesIO()
+    Image.new(mode, size, color=color).save(buffer, format, **options)
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="session")
+def sample_image_bytes():
+    """Encoded test image, encoded once per session."""
+    return _encode_image((100, 100), 'red')
+
+
+@pytest.fixture(scope="session")
+def sample_batch_image_bytes():
+    """Encoded batch test images, encoded once per session."""
+    return [_encode_image((50, 50), color) for color in ('red', 'green', 'blue')]
+
+
+@pytest.fixture(scope="session")
+def blue_png_bytes():
+    """Blue 100x100 RGB PNG, encoded once per session."""
+    return _encode_image((100, 100), 'blue', "PNG")
+
+
+@pytest.fixture(scope="session")
+def red_png_bytes():
+    """Red 100x100 RGB PNG, encoded once per session."""
+    return _encode_image((100, 100), 'red', "PNG")
+
+
+@pytest.fixture(scope="session")
+def gray_png_bytes():
+    """Mid-gray 100x100 grayscale PNG, encoded once per session."""
+    return _encode_image((100, 100), 128, "PNG", mode='L')
+
+
+@pytest.fixture(scope="session")
+def shared_png_paths(tmp_path_factory, blue_png_bytes, red_png_bytes, gray_png_bytes):
+    """
+    PNG files written once and shared by every test in the session.
+
+    Tests must only read these; a test that modifies an image needs its
+    own copy in temp_dir.
+    """
+    shared_dir = tmp_path_factory.mktemp("shared_png")
+    paths = {}
+    for name, image_bytes in (("blue", blue_png_bytes), ("red", red_png_bytes), ("gray", gray_png_bytes)):
+        paths[name] = shared_dir / f"{name}.png"
+        paths[name].write_bytes(image_bytes)
+    return paths
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for test files."""
@@ -15,29 +73,23 @@ def temp_dir():
 
 
 @pytest.fixture
-def sample_image_path(temp_dir):
+def sample_image_path(temp_dir, sample_image_bytes):
     """Create a simple test image for metadata operations."""
-    from PIL import Image
-
-    # Create a simple test image
-    img = Image.new('RGB', (100, 100), color='red')
+    # Each test gets its own copy, so tests may modify it freely
     image_path = temp_dir / "test_image.jpg"
-    img.save(image_path, "JPEG")
+    image_path.write_bytes(sample_image_bytes)
     return image_path
 
 
 @pytest.fixture
-def sample_images_dir(temp_dir):
+def sample_images_dir(temp_dir, sample_batch_image_bytes):
     """Create multiple test images for batch operations."""
-    from PIL import Image
-
     images_dir = temp_dir / "images"
     images_dir.mkdir()
 
     # Create multiple test images
-    for i in range(3):
-        img = Image.new('RGB', (50, 50), color=['red', 'green', 'blue'][i])
+    for i, image_bytes in enumerate(sample_batch_image_bytes):
         image_path = images_dir / f"test_{i}.jpg"
-        img.save(image_path, "JPEG")
+        image_path.write_bytes(image_bytes)
 
-    return images_dir
\ No newline at end of file
+    return images_dir
@@ -47,10 +47,16 @@ class TestBaseMetadataAdapter:
         """Provide temporary directory for tests."""
         return tmp_path
 
-    def create_test_image(self, path: Path, format: str = "PNG") -> Path:
-        """Create a test image file."""
-        img = Image.new('RGB', (100, 100), color='blue')
-        img.save(path, format=format)
+    @pytest.fixture(autouse=True)
+    def png_bytes(self, blue_png_bytes, shared_png_paths):
+        """Make the session's pre-encoded PNGs available to every test."""
+        self.blue_png = blue_png_bytes
+        # Read-only files; tests that only decode or hash can skip writing their own
+        self.shared_png = shared_png_paths
+
+    def create_test_image(self, path: Path) -> Path:
+        """Create a test image file (blue 100x100 PNG)."""
+        path.write_bytes(self.blue_png)
         return path
 
     def test_initialization_with_safety_manager(self):
@@ -107,6 +113,14 @@ class TestBaseMetadataAdapter:
 
         assert self.adapter.supports_format(test_file) is False
 
+    def test_supports_format_without_extension(self, temp_dir):
+        """Test files without an extension, including dotfiles, are not supported."""
+        assert self.adapter.supports_format(temp_dir / "test") is False
+        assert self.adapter.supports_format(temp_dir / ".test") is False
+        assert self.adapter.supports_format(temp_dir / "file.") is False
+        assert self.adapter.supports_format(temp_dir / "dir.test" / "file") is False
+        assert self.adapter.supports_format(Path(".test")) is False
+
     def test_validate_file_exists(self, temp_dir):
         """Test validate_file with existing file."""
         test_file = temp_dir / "valid.test"
@@ -134,6 +148,24 @@ class TestBaseMetadataAdapter:
 
         assert "Path is not a file" in str(exc_info.value)
 
+    def test_validate_file_with_stat_result(self, temp_dir):
+        """Test validate_file uses a caller-provided stat result."""
+        import os
+
+        test_file = temp_dir / "valid.test"
+        test_file.write_text("test content")
+        directory = temp_dir / "testdir"
+        directory.mkdir()
+
+        # Should not raise any exception
+        self.adapter.validate_file(test_file, stat_result=os.stat(test_file))
+
+        # Directory stat result is rejected even though the path is a file
+        with pytest.raises(MetadataError) as exc_info:
+            self.adapter.validate_file(test_file, stat_result=os.stat(directory))
+
+        assert "Path is not a file" in str(exc_info.value)
+
     def test_validate_file_unsupported_format(self, temp_dir):
         """Test validate_file with unsupported format."""
         wrong_format = temp_dir / "file.jpg"
@@ -167,42 +199,233 @@ class TestBaseMetadataAdapter:
             # On Windows, permission testing is complex, skip
             pytest.skip("Permission test not applicable on Windows")
 
-    def test_get_pixel_hash(self, temp_dir):
+    def test_get_pixel_hash(self):
         """Test get_pixel_hash calculation."""
-        test_image = temp_dir / "test.png"
-        self.create_test_image(test_image)
+        test_image = self.shared_png['blue']
 
         pixel_hash = self.adapter.get_pixel_hash(test_image)
 
         assert pixel_hash != ""
         assert len(pixel_hash) == 64  # SHA256 hex digest length
 
-    def test_get_pixel_hash_consistent(self, temp_dir):
+    def test_get_pixel_hash_consistent(self):
         """Test that get_pixel_hash is consistent."""
-        test_image = temp_dir / "test.png"
-        self.create_test_image(test_image)
+        test_image = self.shared_png['blue']
 
         hash1 = self.adapter.get_pixel_hash(test_image)
         hash2 = self.adapter.get_pixel_hash(test_image)
 
         assert hash1 == hash2
 
-    def test_get_pixel_hash_different_images(self, temp_dir):
-        """Test that different images have different hashes."""
-        image1 = temp_dir / "image1.png"
-        image2 = temp_dir / "image2.png"
+    def test_get_pixel_hash_cached_per_file_version(self, temp_dir, monkeypatch):
+        """Test repeated hashes of an unchanged file skip the decode."""
+        test_image = temp_dir / "test.png"
+        self.create_test_image(test_image)
+        first = self.adapter.get_pixel_hash(test_image)
+
+        opened = []
+        original_open = Image.open
+        monkeypatch.setattr(Image, "open", lambda *args, **kwargs: opened.append(args) or original_open(*args, **kwargs))
+
+        assert self.adapter.get_pixel_hash(test_image) == first
+        assert opened == []
+
+        # Rewriting the file changes its size, so it is hashed again
+        Image.new('RGB', (120, 100), color='red').save(test_image, format='PNG', compress_level=1)
+        assert self.adapter.get_pixel_hash(test_image) != first
+        assert len(opened) == 1
+
+    def test_get_pixel_hash_replaced_file_same_size_and_mtime(self, temp_dir):
+        """Test a replaced file is hashed again even if mtime and size match."""
+        import os
+        test_image = temp_dir / "test.bmp"
+        replacement = temp_dir / "replacement.bmp"
+        Image.new('RGB', (20, 20), color='blue').save(test_image, format='BMP')
+        Image.new('RGB', (20, 20), color='red').save(replacement, format='BMP')
+        first = self.adapter.get_pixel_hash(test_image)
+
+        # Mimic safe_file_operation on a filesystem whose timestamps did not tick
+        stat_result = test_image.stat()
+        os.replace(replacement, test_image)
+        os.utime(test_image, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+        assert test_image.stat().st_size == stat_result.st_size
+
+        assert self.adapter.get_pixel_hash(test_image) != first
+
+    def test_get_pixel_hash_streamed_matches_full_buffer(self, temp_dir, monkeypatch):
+        """Test hashing in row bands gives the digest of the whole pixel buffer."""
+        import hashlib
+        test_image = temp_dir / "test.png"
+        img = Image.new('RGB', (37, 50), color='blue')
+        img.putpixel((36, 49), (1, 2, 3))
+        img.save(test_image, format='PNG', compress_level=1)
+
+        # Force bands of a few rows, with a short final band
+        monkeypatch.setattr(TestAdapter, "PIXEL_HASH_STRIP_SIZE", 37 * 4 * 7)
+
+        expected = hashlib.sha256(b"RGB:37x50:" + img.tobytes()).hexdigest()
+        assert self.adapter.get_pixel_hash(test_image) == expected
+
+    def test_get_pixel_hash_mode_and_palette_sensitive(self, temp_dir):
+        """Test hashes cover the image mode and palette, not just raw bytes."""
+        gray = temp_dir / "gray.png"
+        rgb = temp_dir / "rgb.png"
+        Image.new('L', (20, 20), color=128).save(gray, format='PNG', compress_level=1)
+        Image.new('RGB', (20, 20), color=(128, 128, 128)).save(rgb, format='PNG', compress_level=1)
+
+        assert self.adapter.get_pixel_hash(gray) != self.adapter.get_pixel_hash(rgb)
+
+        # Same palette indices, different palette colours
+        palette1 = temp_dir / "palette1.png"
+        palette2 = temp_dir / "palette2.png"
+        img = Image.new('P', (20, 20), color=0)
+        img.putpalette([255, 0, 0] * 256)
+        img.save(palette1, format='PNG', compress_level=1)
+        img.putpalette([0, 0, 255] * 256)
+        img.save(palette2, format='PNG', compress_level=1)
+
+        assert self.adapter.get_pixel_hash(palette1) != self.adapter.get_pixel_hash(palette2)
+
+    def test_get_pixel_hash_algorithm(self):
+        """Test hash_algo selects the digest and is part of the cache key."""
+        test_image = self.shared_png['blue']
+
+        sha256_hash = self.adapter.get_pixel_hash(test_image)
+        blake2s_hash = self.adapter.get_pixel_hash(test_image, hash_algo="blake2s")
+
+        assert len(blake2s_hash) == 64
+        assert blake2s_hash != sha256_hash
+        assert self.adapter.get_pixel_hash(test_image) == sha256_hash
+
+    def test_get_pixel_hash_unknown_algorithm(self):
+        """Test an unknown hash_algo is rejected rather than returning no hash."""
+        test_image = self.shared_png['blue']
+
+        with pytest.raises(ValueError):
+            self.adapter.get_pixel_hash(test_image, hash_algo="not-a-hash")
+
+    def test_get_pixel_hashes_matches_single_calls(self, temp_dir):
+        """Test batch hashing returns the same hashes keyed by input path."""
+        paths = []
+        for i, color in enumerate(['red', 'green', 'blue']):
+            path = temp_dir / f"image{i}.png"
+            Image.new('RGB', (40, 40), color=color).save(path, format='PNG', compress_level=1)
+            paths.append(path)
+        invalid = temp_dir / "invalid.png"
+        invalid.write_text("not an image")
+
+        hashes = TestAdapter().get_pixel_hashes(paths + [invalid], max_workers=2)
+
+        assert hashes == {**{path: self.adapter.get_pixel_hash(path) for path in paths}, invalid: ""}
+
+    def test_get_pixel_hashes_keeps_input_order(self, temp_dir):
+        """Test results follow the input order even though large files are hashed first."""
+        paths = []
+        for size in (10, 80, 40):
+            path = temp_dir / f"image{size}.png"
+            Image.new('RGB', (size, size), color='red').save(path, format='PNG', compress_level=1)
+            paths.append(path)
+        missing = temp_dir / "missing.png"
+
+        hashes = TestAdapter().get_pixel_hashes([missing] + paths, max_workers=2)
+
+        assert list(hashes) == [missing] + paths
+        assert hashes[missing] == ""
+
+    def test_get_pixel_hashes_in_processes(self, temp_dir):
+        """Test process-pool hashing matches single calls."""
+        paths = []
+        for index, color in enumerate(['red', 'green', 'blue', 'white', 'black']):
+            path = temp_dir / f"image{index}.png"
+            Image.new('RGB', (40, 40), color=color).save(path, format='PNG', compress_level=1)
+            paths.append(path)
+
+        hashes = TestAdapter().get_pixel_hashes(paths, max_workers=2, use_processes=True)
+
+        assert hashes == {path: self.adapter.get_pixel_hash(path) for path in paths}
+
+    def test_get_pixel_hashes_fast_hash_shares_strip_pool(self, temp_dir, monkeypatch):
+        """Test threaded fast_hash batches hash strips on one bounded pool."""
+        import os
+        import threading
+        paths = []
+        for index, color in enumerate(['red', 'green', 'blue', 'white']):
+            path = temp_dir / f"image{index}.png"
+            Image.new('RGB', (100, 100), color=color).save(path, format='PNG', compress_level=1)
+            paths.append(path)
+
+        # Several strips per image, so every image uses the strip pool
+        monkeypatch.setattr(TestAdapter, "PIXEL_HASH_STRIP_SIZE", 4096)
+        hashes = TestAdapter().get_pixel_hashes(paths, fast_hash=True, max_workers=4)
+
+        assert hashes == {path: self.adapter.get_pixel_hash(path, fast_hash=True) for path in paths}
+        strip_threads = [t for t in threading.enumerate() if t.name.startswith('strip-hash')]
+        assert 0 < len(strip_threads) <= (os.cpu_count() or 1)
+
+    def test_get_pixel_hashes_fast_hash_in_processes(self, temp_dir, monkeypatch):
+        """Test forked workers hash strips on their own pool, not the parent's."""
+        paths = []
+        for index, color in enumerate(['red', 'green', 'blue']):
+            path = temp_dir / f"image{index}.png"
+            Image.new('RGB', (100, 100), color=color).save(path, format='PNG', compress_level=1)
+            paths.append(path)
+
+        monkeypatch.setattr(TestAdapter, "PIXEL_HASH_STRIP_SIZE", 4096)
+        expected = {path: self.adapter.get_pixel_hash(path, fast_hash=True) for path in paths}
 
-        img1 = Image.new('RGB', (100, 100), color='blue')
-        img1.save(image1, format='PNG')
+        hashes = TestAdapter().get_pixel_hashes(paths, fast_hash=True, max_workers=2, use_processes=True)
 
-        img2 = Image.new('RGB', (100, 100), color='red')
-        img2.save(image2, format='PNG')
+        assert hashes == expected
+
+    def test_get_pixel_hash_different_images(self):
+        """Test that different images have different hashes."""
+        image1 = self.shared_png['blue']
+        image2 = self.shared_png['red']
 
         hash1 = self.adapter.get_pixel_hash(image1)
         hash2 = self.adapter.get_pixel_hash(image2)
 
         assert hash1 != hash2
 
+    def test_get_pixel_hash_fast_hash(self, temp_dir, monkeypatch):
+        """Test fast_hash is consistent and detects pixel changes."""
+        image1 = temp_dir / "image1.png"
+        image2 = temp_dir / "image2.png"
+
+        img = Image.new('RGB', (100, 100), color='blue')
+        img.save(image1, format='PNG', compress_level=1)
+        img.putpixel((99, 99), (0, 0, 254))
+        img.save(image2, format='PNG', compress_level=1)
+
+        # Force several strips so the threaded path is exercised
+        monkeypatch.setattr(TestAdapter, "PIXEL_HASH_STRIP_SIZE", 4096)
+
+        fast1 = self.adapter.get_pixel_hash(image1, fast_hash=True)
+        assert fast1 == self.adapter.get_pixel_hash(image1, fast_hash=True)
+        assert fast1 != self.adapter.get_pixel_hash(image2, fast_hash=True)
+        assert fast1 != self.adapter.get_pixel_hash(image1)
+        assert len(fast1) == 64
+
+    def test_get_pixel_hash_fast_hash_matches_merkle_root(self, temp_dir, monkeypatch):
+        """Test streamed fast_hash equals the Merkle root over the whole pixel buffer."""
+        import hashlib
+        test_image = temp_dir / "test.png"
+        img = Image.new('RGB', (37, 50), color='blue')
+        img.putpixel((36, 49), (1, 2, 3))
+        img.save(test_image, format='PNG', compress_level=1)
+
+        # Strips that do not line up with the row bands
+        strip_size = 1000
+        monkeypatch.setattr(TestAdapter, "PIXEL_HASH_STRIP_SIZE", strip_size)
+
+        data = img.tobytes()
+        digests = b"".join(
+            hashlib.sha256(data[start:start + strip_size]).digest()
+            for start in range(0, len(data), strip_size)
+        )
+        expected = hashlib.sha256(b"RGB:37x50:" + digests).hexdigest()
+        assert self.adapter.get_pixel_hash(test_image, fast_hash=True) == expected
+
     def test_get_pixel_hash_invalid_file(self, temp_dir):
         """Test get_pixel_hash with invalid image file."""
         invalid_file = temp_dir / "invalid.png"
@@ -213,10 +436,9 @@ class TestBaseMetadataAdapter:
         # Should return empty string on error
         assert pixel_hash == ""
 
-    def test_check_image_dimensions_and_mode_match(self, temp_dir):
+    def test_check_image_dimensions_and_mode_match(self):
         """Test _check_image_dimensions_and_mode with matching images."""
-        test_image = temp_dir / "test.png"
-        self.create_test_image(test_image)
+        test_image = self.shared_png['blue']
 
         with Image.open(test_image) as img1:
             with Image.open(test_image) as img2:
@@ -229,11 +451,10 @@ class TestBaseMetadataAdapter:
         image1 = temp_dir / "image1.png"
         image2 = temp_dir / "image2.png"
 
-        img1 = Image.new('RGB', (100, 100), color='blue')
-        img1.save(image1, format='PNG')
+        image1.write_bytes(self.blue_png)
 
         img2 = Image.new('RGB', (200, 200), color='blue')
-        img2.save(image2, format='PNG')
+        img2.save(image2, format='PNG', compress_level=1)
 
         with Image.open(image1) as orig:
             with Image.open(image2) as modified:
@@ -241,16 +462,10 @@ class TestBaseMetadataAdapter:
 
         assert result is False
 
-    def test_check_image_mode_mismatch(self, temp_dir):
+    def test_check_image_mode_mismatch(self):
         """Test _check_image_dimensions_and_mode with mode mismatch."""
-        image1 = temp_dir / "image1.png"
-        image2 = temp_dir / "image2.png"
-
-        img1 = Image.new('RGB', (100, 100), color='blue')
-        img1.save(image1, format='PNG')
-
-        img2 = Image.new('L', (100, 100), color=128)  # Grayscale mode
-        img2.save(image2, format='PNG')
+        image1 = self.shared_png['blue']
+        image2 = self.shared_png['gray']  # Grayscale mode
 
         with Image.open(image1) as orig:
             with Image.open(image2) as modified:
@@ -264,28 +479,98 @@ class TestBaseMetadataAdapter:
         copy = temp_dir / "copy.png"
 
         # Create identical images
-        img = Image.new('RGB', (100, 100), color='blue')
-        img.save(original, format='PNG')
-        img.save(copy, format='PNG')
+        original.write_bytes(self.blue_png)
+        copy.write_bytes(self.blue_png)
 
         result = self.adapter.verify_pixel_integrity(original, copy)
 
         assert result is True
 
-    def test_verify_pixel_integrity_different(self, temp_dir):
+    def test_verify_pixel_integrity_identical_files_skip_decode(self, temp_dir, monkeypatch):
+        """Test byte-identical files are accepted without decoding."""
+        copy = temp_dir / "copy.png"
+        copy.write_bytes(self.blue_png)
+
+        def fail_decode(*args):
+            raise AssertionError("pixels should not be decoded")
+
+        monkeypatch.setattr(self.adapter, "_pixels_equal_streamed", fail_decode)
+        # Compare in several slices
+        monkeypatch.setattr(TestAdapter, "PIXEL_HASH_STRIP_SIZE", 64)
+
+        assert self.adapter.verify_pixel_integrity(self.shared_png['blue'], copy) is True
+
+    def test_verify_pixel_integrity_different(self):
         """Test verify_pixel_integrity with different images."""
+        original = self.shared_png['blue']
+        modified = self.shared_png['red']
+
+        result = self.adapter.verify_pixel_integrity(original, modified)
+
+        assert result is False
+
+    def test_verify_pixel_integrity_difference_in_last_strip(self, temp_dir, monkeypatch):
+        """Test that a single changed pixel past the first strip is detected."""
         original = temp_dir / "original.png"
         modified = temp_dir / "modified.png"
 
-        img1 = Image.new('RGB', (100, 100), color='blue')
-        img1.save(original, format='PNG')
+        # Force several bands
+        monkeypatch.setattr(TestAdapter, "PIXEL_HASH_STRIP_SIZE", 40 * 4 * 64)
 
-        img2 = Image.new('RGB', (100, 100), color='red')
-        img2.save(modified, format='PNG')
+        img = Image.new('RGB', (40, 600), color='blue')
+        img.save(original, format='PNG', compress_level=1)
+        img.putpixel((39, 599), (0, 0, 254))
+        img.save(modified, format='PNG', compress_level=1)
 
-        result = self.adapter.verify_pixel_integrity(original, modified)
+        assert self.adapter.verify_pixel_integrity(original, modified) is False
 
-        assert result is False
+    def test_verify_pixel_integrity_palette_change(self, temp_dir):
+        """Test palette images with equal indices but different palettes differ."""
+        original = temp_dir / "original.png"
+        modified = temp_dir / "modified.png"
+
+        img = Image.new('P', (20, 20), color=0)
+        img.putpalette([255, 0, 0] * 256)
+        img.save(original, format='PNG', compress_level=1)
+        img.putpalette([0, 0, 255] * 256)
+        img.save(modified, format='PNG', compress_level=1)
+
+        assert self.adapter.verify_pixel_integrity(original, modified) is False
+
+    def test_verify_pixel_integrity_same_mode_without_conversion(self, temp_dir):
+        """Test grayscale images are compared in their own mode."""
+        original = temp_dir / "original.png"
+        modified = temp_dir / "modified.png"
+
+        img = Image.new('L', (30, 30), color=128)
+        img.save(original, format='PNG', compress_level=1)
+        img.putpixel((29, 29), 127)
+        img.save(modified, format='PNG', compress_level=1)
+
+        assert self.adapter.verify_pixel_integrity(original, original) is True
+        assert self.adapter.verify_pixel_integrity(original, modified) is False
+
+    def test_verify_pixel_integrity_rgba_color_change(self, temp_dir):
+        """Test a colour change under unchanged alpha is detected in RGBA images."""
+        original = temp_dir / "original.png"
+        modified = temp_dir / "modified.png"
+
+        img = Image.new('RGBA', (30, 30), color=(0, 0, 255, 255))
+        img.save(original, format='PNG', compress_level=1)
+        img.putpixel((15, 15), (0, 0, 254, 255))
+        img.save(modified, format='PNG', compress_level=1)
+
+        assert self.adapter.verify_pixel_integrity(original, modified) is False
+
+    def test_verify_pixel_integrity_size_mismatch(self, temp_dir):
+        """Test verify_pixel_integrity with different dimensions."""
+        original = temp_dir / "original.png"
+        modified = temp_dir / "modified.png"
+
+        original.write_bytes(self.blue_png)
+        Image.new('RGB', (100, 50), color='blue').save(modified, format='PNG', compress_level=1)
+
+        assert self.adapter.verify_pixel_integrity(original, modified) is False
 
     def test_verify_pixel_integrity_invalid_file(self, temp_dir):
         """Test verify_pixel_integrity with invalid file."""
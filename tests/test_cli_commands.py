@@ -3,14 +3,19 @@ Tests for CLI command functionality.
 """
 import pytest
 from pathlib import Path
+import io
 import json
 import tempfile
+import click
 from click.testing import CliRunner
 from PIL import Image
 
 from src.exif_analyzer.cli.main import cli
 from src.exif_analyzer.core.config import config
 
+# Tests that change the global config carry the "config_mutation" xdist group, so
+# "pytest -n auto --dist=loadgroup" runs them in order on one worker
+
 
 class TestCLICommands:
     """Test cases for CLI commands."""
@@ -19,15 +24,39 @@ class TestCLICommands:
         """Set up test environment."""
         self.runner = CliRunner()
 
+    @pytest.fixture(autouse=True)
+    def image_bytes(self, sample_image_bytes, red_png_bytes):
+        """Make the session's pre-encoded images available to every test."""
+        self.image_bytes = {"JPEG": sample_image_bytes, "PNG": red_png_bytes}
+
+    def invoke_fast(self, args):
+        """
+        Invoke the CLI for a test that expects success.
+
+        Exceptions propagate straight to pytest instead of being trapped
+        and formatted, and Click skips its standalone exit handling.
+        sys.exit calls still set the exit code.
+        """
+        return self.runner.invoke(cli, args, standalone_mode=False, catch_exceptions=False)
+
     def create_test_image(self, path: Path, format: str = "JPEG") -> Path:
-        """Create a test image file."""
-        img = Image.new('RGB', (100, 100), color='red')
-        img.save(path, format)
+        """Create a test image file (red 100x100)."""
+        path.write_bytes(self.image_bytes[format])
+        return path
+
+    def create_exif_image(self, path: Path, exif_dict: dict) -> Path:
+        """Create a test JPEG carrying the given piexif EXIF dictionary."""
+        import piexif
+
+        # Splice the EXIF segment into the cached JPEG instead of re-encoding pixels
+        output = io.BytesIO()
+        piexif.insert(piexif.dump(exif_dict), self.image_bytes["JPEG"], output)
+        path.write_bytes(output.getvalue())
         return path
 
     def test_formats_command(self):
         """Test formats command."""
-        result = self.runner.invoke(cli, ['formats'])
+        result = self.invoke_fast(['formats'])
 
         assert result.exit_code == 0
         assert "Supported Image Formats" in result.output
@@ -170,7 +199,7 @@ class TestCLICommands:
 
     def test_config_show_command(self):
         """Test config show command."""
-        result = self.runner.invoke(cli, ['config', 'show'])
+        result = self.invoke_fast(['config', 'show'])
 
         assert result.exit_code == 0
         assert "Configuration" in result.output
@@ -179,7 +208,7 @@ class TestCLICommands:
 
     def test_config_show_json(self):
         """Test config show with JSON output."""
-        result = self.runner.invoke(cli, ['config', 'show', '--json'])
+        result = self.invoke_fast(['config', 'show', '--json'])
 
         assert result.exit_code == 0
 
@@ -188,6 +217,7 @@ class TestCLICommands:
         assert 'backup' in config_data
         assert 'batch' in config_data
 
+    @pytest.mark.xdist_group("config_mutation")
     def test_config_set_command(self):
         """Test config set command."""
         with tempfile.TemporaryDirectory() as temp_config_dir:
@@ -211,7 +241,7 @@ class TestCLICommands:
 
     def test_config_validate_command(self):
         """Test config validate command."""
-        result = self.runner.invoke(cli, ['config', 'validate'])
+        result = self.invoke_fast(['config', 'validate'])
 
         assert result.exit_code == 0
         assert "Configuration is valid" in result.output
@@ -251,26 +281,25 @@ class TestCLICommands:
 
     def test_help_messages(self):
         """Test help message generation."""
-        # Main help
-        result = self.runner.invoke(cli, ['--help'])
-        assert result.exit_code == 0
-        assert "ExifAnalyzer" in result.output
+        # Main help, rendered without running the CLI at all
+        assert "ExifAnalyzer" in cli.get_help(click.Context(cli))
 
         # Command help
-        result = self.runner.invoke(cli, ['view', '--help'])
+        result = self.invoke_fast(['view', '--help'])
         assert result.exit_code == 0
         assert "View metadata" in result.output
 
         # Batch help
-        result = self.runner.invoke(cli, ['batch', '--help'])
+        result = self.invoke_fast(['batch', '--help'])
         assert result.exit_code == 0
         assert "Batch operations" in result.output
 
         # Config help
-        result = self.runner.invoke(cli, ['config', '--help'])
+        result = self.invoke_fast(['config', '--help'])
         assert result.exit_code == 0
         assert "Configuration management" in result.output
 
+    @pytest.mark.xdist_group("config_mutation")
     def test_configuration_file_loading(self, temp_dir):
         """Test loading configuration from file."""
         config_file = temp_dir / "custom_config.json"
@@ -288,6 +317,7 @@ class TestCLICommands:
         assert result.exit_code == 0
         assert f"Loaded configuration from {config_file}" in result.output
 
+    @pytest.mark.xdist_group("config_mutation")
     def test_invalid_configuration_file(self, temp_dir):
         """Test handling of invalid configuration file."""
         config_file = temp_dir / "invalid_config.json"
@@ -560,21 +590,15 @@ class TestCLICommands:
         """Test view command with detailed metadata display."""
         # Create image with actual metadata
         test_image = temp_dir / "test_with_metadata.jpg"
-        from PIL import Image
-        from PIL.ExifTags import TAGS
         import piexif
 
-        # Create image with EXIF data
-        img = Image.new('RGB', (100, 100), color='red')
-
         # Add some EXIF data
         exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
         exif_dict["0th"][piexif.ImageIFD.Make] = "Test Camera"
         exif_dict["0th"][piexif.ImageIFD.Model] = "Test Model"
         exif_dict["Exif"][piexif.ExifIFD.DateTimeOriginal] = "2023:01:01 12:00:00"
 
-        exif_bytes = piexif.dump(exif_dict)
-        img.save(test_image, format='JPEG', exif=exif_bytes)
+        self.create_exif_image(test_image, exif_dict)
 
         result = self.runner.invoke(cli, [
             'view', str(test_image)
@@ -588,16 +612,13 @@ class TestCLICommands:
         test_image = temp_dir / "test_detailed.jpg"
 
         # Create image with metadata using piexif
-        from PIL import Image
         import piexif
 
-        img = Image.new('RGB', (100, 100), color='blue')
         exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
         exif_dict["0th"][piexif.ImageIFD.Make] = "Test Camera Detailed"
         exif_dict["0th"][piexif.ImageIFD.Software] = "ExifAnalyzer Test"
 
-        exif_bytes = piexif.dump(exif_dict)
-        img.save(test_image, format='JPEG', exif=exif_bytes)
+        self.create_exif_image(test_image, exif_dict)
 
         result = self.runner.invoke(cli, [
             'view', str(test_image), '--show-all'
@@ -610,10 +631,8 @@ class TestCLICommands:
         test_image = temp_dir / "test_gps.jpg"
 
         # Create image with GPS data
-        from PIL import Image
         import piexif
 
-        img = Image.new('RGB', (100, 100), color='green')
         exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
 
         # Add GPS coordinates (privacy sensitive)
@@ -622,8 +641,7 @@ class TestCLICommands:
         exif_dict["GPS"][piexif.GPSIFD.GPSLatitudeRef] = 'N'
         exif_dict["GPS"][piexif.GPSIFD.GPSLongitudeRef] = 'W'
 
-        exif_bytes = piexif.dump(exif_dict)
-        img.save(test_image, format='JPEG', exif=exif_bytes)
+        self.create_exif_image(test_image, exif_dict)
 
         result = self.runner.invoke(cli, [
             'view', str(test_image), '--privacy-check'
@@ -636,16 +654,13 @@ class TestCLICommands:
         test_image = temp_dir / "test_gps_preview.jpg"
 
         # Create image with GPS data
-        from PIL import Image
         import piexif
 
-        img = Image.new('RGB', (100, 100), color='yellow')
         exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
         exif_dict["GPS"][piexif.GPSIFD.GPSLatitude] = ((40, 1), (42, 1), (46, 1))
         exif_dict["GPS"][piexif.GPSIFD.GPSLongitude] = ((74, 1), (0, 1), (21, 1))
 
-        exif_bytes = piexif.dump(exif_dict)
-        img.save(test_image, format='JPEG', exif=exif_bytes)
+        self.create_exif_image(test_image, exif_dict)
 
         result = self.runner.invoke(cli, [
             'strip', str(test_image), '--preview', '--gps-only'
@@ -658,17 +673,14 @@ class TestCLICommands:
         test_image = temp_dir / "test_preview_all.jpg"
 
         # Create image with various metadata
-        from PIL import Image
         import piexif
 
-        img = Image.new('RGB', (100, 100), color='purple')
         exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
         exif_dict["0th"][piexif.ImageIFD.Make] = "Test Camera"
         exif_dict["0th"][piexif.ImageIFD.Model] = "Test Model"
         exif_dict["Exif"][piexif.ExifIFD.DateTimeOriginal] = "2023:01:01 12:00:00"
 
-        exif_bytes = piexif.dump(exif_dict)
-        img.save(test_image, format='JPEG', exif=exif_bytes)
+        self.create_exif_image(test_image, exif_dict)
 
         result = self.runner.invoke(cli, [
             'strip', str(test_image), '--preview'
@@ -681,16 +693,13 @@ class TestCLICommands:
         test_image = temp_dir / "test_preview_keep.jpg"
 
         # Create image with metadata
-        from PIL import Image
         import piexif
 
-        img = Image.new('RGB', (100, 100), color='orange')
         exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
         exif_dict["0th"][piexif.ImageIFD.Make] = "Test Camera"
         exif_dict["0th"][piexif.ImageIFD.Software] = "Test Software"
 
-        exif_bytes = piexif.dump(exif_dict)
-        img.save(test_image, format='JPEG', exif=exif_bytes)
+        self.create_exif_image(test_image, exif_dict)
 
         result = self.runner.invoke(cli, [
             'strip', str(test_image), '--preview', '--keep', 'Make'
@@ -698,22 +707,37 @@ class TestCLICommands:
         assert result.exit_code == 0
         assert ("Would remove" in result.output or "Would keep" in result.output)
 
+    def test_strip_command_preview_keep_patterns_ignore_case(self, temp_dir):
+        """Test strip preview counts kept keys the same way the strip does."""
+        test_image = temp_dir / "test_preview_keep_case.jpg"
+
+        import piexif
+
+        exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
+        exif_dict["0th"][piexif.ImageIFD.Make] = "Test Camera"
+        exif_dict["0th"][piexif.ImageIFD.Software] = "Test Software"
+
+        self.create_exif_image(test_image, exif_dict)
+
+        result = self.runner.invoke(cli, [
+            'strip', str(test_image), '--preview', '--keep', 'MAKE'
+        ])
+        assert result.exit_code == 0
+        assert "Would keep 0 keys" not in result.output
+
     def test_strip_command_gps_only_with_confirmation(self, temp_dir):
         """Test strip command GPS-only with confirmation."""
         test_image = temp_dir / "test_gps_confirm.jpg"
         output_image = temp_dir / "output_gps.jpg"
 
         # Create image with GPS data
-        from PIL import Image
         import piexif
 
-        img = Image.new('RGB', (100, 100), color='cyan')
         exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
         exif_dict["GPS"][piexif.GPSIFD.GPSLatitude] = ((40, 1), (42, 1), (46, 1))
         exif_dict["0th"][piexif.ImageIFD.Make] = "Camera"  # Non-GPS data to keep
 
-        exif_bytes = piexif.dump(exif_dict)
-        img.save(test_image, format='JPEG', exif=exif_bytes)
+        self.create_exif_image(test_image, exif_dict)
 
         result = self.runner.invoke(cli, [
             '--force',  # Skip confirmations
@@ -731,17 +755,14 @@ class TestCLICommands:
         output_image = temp_dir / "output_selective.jpg"
 
         # Create image with multiple metadata fields
-        from PIL import Image
         import piexif
 
-        img = Image.new('RGB', (100, 100), color='pink')
         exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
         exif_dict["0th"][piexif.ImageIFD.Make] = "Test Camera"
         exif_dict["0th"][piexif.ImageIFD.Model] = "Test Model"
         exif_dict["0th"][piexif.ImageIFD.Software] = "Test Software"
 
-        exif_bytes = piexif.dump(exif_dict)
-        img.save(test_image, format='JPEG', exif=exif_bytes)
+        self.create_exif_image(test_image, exif_dict)
 
         result = self.runner.invoke(cli, [
             '--force',
@@ -759,15 +780,12 @@ class TestCLICommands:
         test_image = temp_dir / "test_cancel.jpg"
 
         # Create image with metadata
-        from PIL import Image
         import piexif
 
-        img = Image.new('RGB', (100, 100), color='brown')
         exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
         exif_dict["0th"][piexif.ImageIFD.Make] = "Test Camera"
 
-        exif_bytes = piexif.dump(exif_dict)
-        img.save(test_image, format='JPEG', exif=exif_bytes)
+        self.create_exif_image(test_image, exif_dict)
 
         # Simulate user declining confirmation by not using --force
         result = self.runner.invoke(cli, [
@@ -782,10 +800,8 @@ class TestCLICommands:
         test_image = temp_dir / "test_multi_blocks.jpg"
 
         # Create image with EXIF, GPS, and other metadata
-        from PIL import Image
         import piexif
 
-        img = Image.new('RGB', (100, 100), color='gray')
         exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
 
         # Add various metadata types
@@ -794,8 +810,7 @@ class TestCLICommands:
         exif_dict["Exif"][piexif.ExifIFD.DateTimeOriginal] = "2023:06:15 10:30:45"
         exif_dict["GPS"][piexif.GPSIFD.GPSLatitude] = ((42, 1), (30, 1), (0, 1))
 
-        exif_bytes = piexif.dump(exif_dict)
-        img.save(test_image, format='JPEG', exif=exif_bytes)
+        self.create_exif_image(test_image, exif_dict)
 
         result = self.runner.invoke(cli, [
             'view', str(test_image), '--show-all', '--privacy-check'
@@ -841,6 +856,7 @@ class TestCLICommands:
         assert result.exit_code == 0
         assert "Found 1 supported image files" in result.output
 
+    @pytest.mark.xdist_group("config_mutation")
     def test_config_reset_command(self, temp_dir):
         """Test config reset command."""
         # Use temporary config directory
@@ -880,18 +896,15 @@ class TestCLICommands:
         test_image = temp_dir / "test_long_values.jpg"
 
         # Create image with long metadata value
-        from PIL import Image
         import piexif
 
-        img = Image.new('RGB', (100, 100), color='white')
         exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
 
         # Create a very long description (>100 chars)
         long_description = "This is a very long description that exceeds one hundred characters to test truncation functionality in the CLI display"
         exif_dict["0th"][piexif.ImageIFD.ImageDescription] = long_description
 
-        exif_bytes = piexif.dump(exif_dict)
-        img.save(test_image, format='JPEG', exif=exif_bytes)
+        self.create_exif_image(test_image, exif_dict)
 
         result = self.runner.invoke(cli, [
             'view', str(test_image), '--show-all'
@@ -904,15 +917,12 @@ class TestCLICommands:
         test_image = temp_dir / "test_no_gps_preview.jpg"
 
         # Create image without GPS data
-        from PIL import Image
         import piexif
 
-        img = Image.new('RGB', (100, 100), color='silver')
         exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
         exif_dict["0th"][piexif.ImageIFD.Make] = "No GPS Camera"
 
-        exif_bytes = piexif.dump(exif_dict)
-        img.save(test_image, format='JPEG', exif=exif_bytes)
+        self.create_exif_image(test_image, exif_dict)
 
         result = self.runner.invoke(cli, [
             'strip', str(test_image), '--preview', '--gps-only'
@@ -941,15 +951,12 @@ class TestCLICommands:
         output_image = temp_dir / "output_gps_success.jpg"
 
         # Create image with GPS data
-        from PIL import Image
         import piexif
 
-        img = Image.new('RGB', (100, 100), color='gold')
         exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
         exif_dict["GPS"][piexif.GPSIFD.GPSLatitude] = ((40, 1), (42, 1), (46, 1))
 
-        exif_bytes = piexif.dump(exif_dict)
-        img.save(test_image, format='JPEG', exif=exif_bytes)
+        self.create_exif_image(test_image, exif_dict)
 
         result = self.runner.invoke(cli, [
             '--force',
@@ -966,10 +973,8 @@ class TestCLICommands:
         test_image = temp_dir / "test_many_keys.jpg"
 
         # Create image with many metadata fields
-        from PIL import Image
         import piexif
 
-        img = Image.new('RGB', (100, 100), color='maroon')
         exif_dict = {"0th": {}, "Exif": {}, "GPS": {}, "1st": {}, "thumbnail": None}
 
         # Add multiple GPS-related fields to trigger "and X more" display
@@ -984,8 +989,7 @@ class TestCLICommands:
         exif_dict["0th"][piexif.ImageIFD.Model] = "Many Keys Model"
         exif_dict["0th"][piexif.ImageIFD.Software] = "Many Keys Software"
 
-        exif_bytes = piexif.dump(exif_dict)
-        img.save(test_image, format='JPEG', exif=exif_bytes)
+        self.create_exif_image(test_image, exif_dict)
 
         result = self.runner.invoke(cli, [
             'view', str(test_image), '--privacy-check'
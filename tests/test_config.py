@@ -6,7 +6,7 @@ import json
 import tempfile
 from pathlib import Path
 
-from src.exif_analyzer.core.config import ConfigManager
+from src.exif_analyzer.core.config import ConfigManager, _get_user_config_path
 from src.exif_analyzer.core.exceptions import ValidationError
 
 
@@ -479,6 +479,21 @@ class TestConfigManager:
         # New section
         assert config.get("new_section.new_value") == 123
 
+    def test_deep_merge_config_nested_levels(self):
+        """Test that merging preserves siblings at every nesting level."""
+        config = ConfigManager()
+        config.set("level1.level2.keep", "kept")
+        config.set("level1.level2.level3.value", 1)
+
+        config._merge_config({"level1": {"level2": {"level3": {"value": 2}}}})
+
+        assert config.get("level1.level2.keep") == "kept"
+        assert config.get("level1.level2.level3.value") == 2
+
+        # A dict replaces a scalar rather than merging into it
+        config._merge_config({"level1": {"level2": {"keep": {"now": "dict"}}}})
+        assert config.get("level1.level2.keep.now") == "dict"
+
     def test_all_default_sections_present(self):
         """Test that all default config sections are present."""
         config = ConfigManager()
@@ -512,6 +527,16 @@ class TestConfigManager:
         assert isinstance(config.get("display.truncation_suffix_length"), int)
         assert isinstance(config.get("display.preview_image_size"), int)
         assert isinstance(config.get("display.status_bar_width"), int)
+        assert isinstance(config.get("display.preview_cache_size"), int)
+        assert isinstance(config.get("display.preview_disk_cache"), bool)
+        assert isinstance(config.get("display.preview_disk_cache_size"), int)
+        assert isinstance(config.get("display.preview_use_draft"), bool)
+        assert isinstance(config.get("display.preview_debounce_ms"), int)
+        assert isinstance(config.get("display.selection_debounce_ms"), int)
+        assert isinstance(config.get("display.show_all_files"), bool)
+        assert isinstance(config.get("display.prefetch_header_bytes"), int)
+        assert isinstance(config.get("display.metadata_cache"), bool)
+        assert isinstance(config.get("display.metadata_cache_size"), int)
 
         # Check reasonable values
         assert config.get("display.max_value_length") > 0
@@ -576,6 +601,20 @@ class TestConfigManager:
         path_str = str(config.user_config_path).lower()
         assert 'exifanalyzer' in path_str or '.config' in path_str
 
+    def test_init_does_not_create_user_config_dir(self, tmp_path, monkeypatch):
+        """Test that construction resolves the user path without creating it."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("APPDATA", str(tmp_path))
+        _get_user_config_path.cache_clear()
+        try:
+            config = ConfigManager()
+
+            assert str(config.user_config_path).startswith(str(tmp_path))
+            assert not config.user_config_path.parent.exists()
+            assert _get_user_config_path() is config.user_config_path
+        finally:
+            _get_user_config_path.cache_clear()
+
     @pytest.fixture
     def temp_dir(self, tmp_path):
         """Provide temporary directory for tests."""
@@ -6,7 +6,7 @@ from pathlib import Path
 import tempfile
 from PIL import Image
 
-from src.exif_analyzer.core.engine import MetadataEngine
+from src.exif_analyzer.core.engine import MetadataEngine, default_engine
 from src.exif_analyzer.core.exceptions import UnsupportedFormatError, FileError
 
 
@@ -55,12 +55,35 @@ class TestMetadataEngine:
         with pytest.raises(UnsupportedFormatError):
             self.engine.get_adapter(unsupported_file)
 
+    def test_get_adapter_mime_fallback(self, temp_dir, monkeypatch):
+        """Test unknown extensions resolve through the MIME type table."""
+        import mimetypes
+        from src.exif_analyzer.core.engine import _guess_mime_by_suffix
+        odd_file = temp_dir / "photo.pjpg"
+        odd_file.write_bytes(b"")
+        upper_file = temp_dir / "other.PJPG"
+        upper_file.write_bytes(b"")
+        monkeypatch.setattr(mimetypes, "guess_type", lambda path: ("image/jpeg", None))
+        _guess_mime_by_suffix.cache_clear()
+
+        try:
+            assert self.engine.get_adapter(odd_file) is self.engine.adapters["jpg"]
+            assert self.engine.get_adapter(upper_file) is self.engine.adapters["jpg"]
+            assert _guess_mime_by_suffix.cache_info().hits == 1
+        finally:
+            _guess_mime_by_suffix.cache_clear()
+
     def test_nonexistent_file(self, temp_dir):
         """Test error handling for non-existent file."""
         nonexistent = temp_dir / "nonexistent.jpg"
 
+        # Known extensions resolve without a stat; the adapter reports the missing file
+        assert self.engine.get_adapter(nonexistent).format_name == "JPEG"
+        with pytest.raises(FileNotFoundError):
+            self.engine.read_metadata(nonexistent)
+
         with pytest.raises(FileError):
-            self.engine.get_adapter(nonexistent)
+            self.engine.get_adapter(temp_dir / "nonexistent.unknown")
 
     def test_read_metadata_basic(self, sample_image_path):
         """Test basic metadata reading."""
@@ -71,6 +94,13 @@ class TestMetadataEngine:
         assert metadata.format in ["JPEG", "PNG"]
         assert metadata.file_size > 0
 
+    def test_read_metadata_accepts_string_path(self, sample_image_path):
+        """Test that string paths are converted to Path objects."""
+        metadata = self.engine.read_metadata(str(sample_image_path))
+
+        assert isinstance(metadata.file_path, Path)
+        assert metadata.file_path == sample_image_path
+
     def test_has_metadata_detection(self, sample_image_path):
         """Test metadata detection."""
         # For a simple test image, may or may not have metadata
@@ -97,6 +127,40 @@ class TestMetadataEngine:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
 
+    @pytest.mark.parametrize("fmt", ["jpg", ".png"])
+    def test_strip_metadata_bytes(self, fmt):
+        """Test in-memory stripping returns clean image bytes."""
+        import io
+        import piexif
+        from PIL.PngImagePlugin import PngInfo
+
+        img = Image.new('RGB', (40, 30), color='red')
+        buffer = io.BytesIO()
+        if fmt == "jpg":
+            exif_bytes = piexif.dump({"0th": {piexif.ImageIFD.Artist: b"secret"}})
+            img.save(buffer, "JPEG", exif=exif_bytes)
+        else:
+            info = PngInfo()
+            info.add_text("Author", "secret")
+            img.save(buffer, "PNG", pnginfo=info)
+
+        stripped = self.engine.strip_metadata_bytes(buffer.getvalue(), fmt)
+
+        assert b"secret" not in stripped
+        with Image.open(io.BytesIO(stripped)) as result:
+            assert result.size == (40, 30)
+
+    def test_strip_metadata_bytes_unsupported_format(self):
+        """Test in-memory stripping rejects unknown formats."""
+        with pytest.raises(UnsupportedFormatError):
+            self.engine.strip_metadata_bytes(b"data", "bmp")
+
+    @pytest.mark.parametrize("fmt", ["webp", "gif", "tiff"])
+    def test_strip_metadata_bytes_not_implemented_for_format(self, fmt):
+        """Test in-memory stripping rejects formats whose adapter lacks it."""
+        with pytest.raises(UnsupportedFormatError, match="In-memory stripping not supported"):
+            self.engine.strip_metadata_bytes(b"data", fmt)
+
     def test_export_metadata_json(self, sample_image_path, temp_dir):
         """Test metadata export to JSON."""
         export_path = temp_dir / "metadata.json"
@@ -115,6 +179,52 @@ class TestMetadataEngine:
         assert "file_path" in content
         assert "format" in content
 
+    def test_export_metadata_json_matches_to_json(self, sample_image_path, temp_dir):
+        """Test streamed JSON export parses to the same data as to_json."""
+        import json
+        export_path = temp_dir / "metadata.json"
+
+        self.engine.export_metadata(sample_image_path, export_path)
+
+        metadata = self.engine.read_metadata(sample_image_path)
+        assert json.loads(export_path.read_bytes()) == json.loads(metadata.to_json())
+
+    def test_export_metadata_uses_given_metadata(self, sample_image_path, temp_dir, monkeypatch):
+        """Test export writes pre-read metadata without reading the file again."""
+        import json
+        export_path = temp_dir / "metadata.json"
+        metadata = self.engine.read_metadata(sample_image_path)
+        metadata.custom.set("Note", "already read")
+
+        monkeypatch.setattr(self.engine, "read_metadata", lambda *args: pytest.fail("file re-read"))
+        self.engine.export_metadata(sample_image_path, export_path, metadata=metadata)
+
+        assert json.loads(export_path.read_bytes())["metadata"]["custom"] == {"Note": "already read"}
+
+    def test_export_metadata_integer_beyond_64_bits(self, sample_image_path, temp_dir):
+        """Test export falls back to the stdlib encoder for values orjson rejects."""
+        import json
+        export_path = temp_dir / "metadata.json"
+        metadata = self.engine.read_metadata(sample_image_path)
+        metadata.exif.set("MakerNoteValue", 2 ** 70)
+
+        self.engine.export_metadata(sample_image_path, export_path, metadata=metadata)
+
+        assert json.loads(export_path.read_bytes())["metadata"]["exif"]["MakerNoteValue"] == 2 ** 70
+
+    def test_export_restore_round_trip(self, sample_image_path, temp_dir):
+        """Test exported JSON restores back onto an image."""
+        import shutil
+        target = temp_dir / "target.jpg"
+        shutil.copy2(sample_image_path, target)
+        export_path = temp_dir / "metadata.json"
+
+        self.engine.export_metadata(sample_image_path, export_path)
+        result = self.engine.restore_metadata(target, export_path, create_backup=False)
+
+        assert result == target
+        assert target.exists()
+
     def test_batch_process_export(self, sample_images_dir, temp_dir):
         """Test batch processing for export."""
         image_files = list(sample_images_dir.glob("*.jpg"))
@@ -133,6 +243,65 @@ class TestMetadataEngine:
             assert isinstance(result, Path)
             assert result.exists()
 
+    def test_batch_process_export_with_workers(self, sample_images_dir, temp_dir):
+        """Test batch processing across worker processes."""
+        image_files = sorted(sample_images_dir.glob("*.jpg"))
+
+        results = self.engine.batch_process(
+            image_files,
+            operation="export",
+            output_dir=temp_dir,
+            workers=2
+        )
+
+        assert list(results) == [str(path) for path in image_files]
+        for result in results.values():
+            assert isinstance(result, Path)
+            assert result.exists()
+
+    def test_batch_process_strip_with_concurrency(self, sample_images_dir, temp_dir):
+        """Test concurrent in-place stripping of files sharing a directory."""
+        import shutil
+        work_dir = temp_dir / "work"
+        shutil.copytree(sample_images_dir, work_dir)
+        image_files = sorted(work_dir.glob("*.jpg"))
+
+        results = self.engine.batch_process(image_files, operation="strip", concurrency=3)
+
+        assert list(results) == [str(path) for path in image_files]
+        for path, result in zip(image_files, results.values()):
+            assert result == path
+        # Only the stripped files and their backups remain; no temp files leak
+        leftovers = [p.name for p in work_dir.iterdir() if p.name.startswith(".temp")]
+        assert leftovers == []
+
+    def test_batch_process_concurrency_inside_event_loop(self, sample_images_dir, temp_dir):
+        """Test concurrent batches work when called from a running event loop."""
+        import asyncio
+        image_files = sorted(sample_images_dir.glob("*.jpg"))
+
+        async def run_batch():
+            return self.engine.batch_process(
+                image_files, operation="export", output_dir=temp_dir, concurrency=2
+            )
+
+        results = asyncio.run(run_batch())
+
+        assert list(results) == [str(path) for path in image_files]
+        for result in results.values():
+            assert isinstance(result, Path)
+            assert result.exists()
+
+    def test_batch_process_unknown_operation_with_workers(self, sample_images_dir):
+        """Test that worker failures are returned as exceptions."""
+        image_files = sorted(sample_images_dir.glob("*.jpg"))
+
+        results = self.engine.batch_process(image_files, operation="bogus", workers=2)
+
+        assert len(results) == len(image_files)
+        for result in results.values():
+            assert isinstance(result, ValueError)
+
     def test_supported_formats_list(self):
         """Test getting supported formats."""
         formats = self.engine.get_supported_formats()
@@ -196,6 +365,26 @@ class TestMetadataEngine:
         backups = list(temp_dir.glob(f"{test_image.stem}.backup.*{test_image.suffix}"))
         assert len(backups) > 0
 
+    def test_strip_metadata_backup_only_when_overwriting(self, sample_image_path, temp_dir, monkeypatch):
+        """Test engine backups follow the file identity, not the path spelling."""
+        import shutil
+        work_dir = temp_dir / "work"
+        (work_dir / "sub").mkdir(parents=True)
+        target = work_dir / "photo.jpg"
+        shutil.copy2(sample_image_path, target)
+
+        backed_up = []
+        monkeypatch.setattr(self.engine.safety_manager, "create_backup", backed_up.append)
+
+        # A distinct output file never needs a backup
+        self.engine.strip_metadata(target, work_dir / "clean.jpg")
+        assert target not in backed_up
+
+        # A different spelling of the original path still overwrites it
+        alias = work_dir / "sub" / ".." / "photo.jpg"
+        self.engine.strip_metadata(target, alias)
+        assert target in backed_up
+
     def test_register_custom_adapter(self):
         """Test registering a custom adapter."""
         from src.exif_analyzer.core.base_adapter import BaseMetadataAdapter
@@ -226,6 +415,49 @@ class TestMetadataEngine:
         # Verify registration
         formats = engine.get_supported_formats()
         assert "custom" in formats
+        assert formats == sorted(formats)
+
+    def test_builtin_adapters_load_on_first_use(self, temp_dir):
+        """Test built-in adapters are instantiated only when a format is used."""
+        engine = MetadataEngine()
+        assert engine.adapters == {}
+        assert 'jpg' in engine.get_supported_formats()
+
+        adapter = engine.get_adapter(temp_dir / "photo.jpeg")
+
+        assert adapter.format_name == "JPEG"
+        # Every extension of the loaded adapter shares the one instance
+        assert engine.get_adapter(temp_dir / "photo.jpg") is adapter
+        assert 'png' not in engine.adapters
+
+    def test_custom_adapter_overrides_lazy_builtin(self, temp_dir):
+        """Test a custom adapter keeps its extension after built-ins load."""
+        from src.exif_analyzer.core.base_adapter import BaseMetadataAdapter
+
+        class JfifAdapter(BaseMetadataAdapter):
+            supported_formats = ["jfif"]
+            format_name = "JFIF"
+
+            def read_metadata(self, file_path):
+                raise NotImplementedError
+
+            def write_metadata(self, metadata, output_path=None):
+                raise NotImplementedError
+
+            def strip_metadata(self, file_path, output_path=None):
+                raise NotImplementedError
+
+        engine = MetadataEngine()
+        custom = JfifAdapter()
+        engine.register_adapter(custom)
+
+        assert engine.get_adapter(temp_dir / "photo.jpg").format_name == "JPEG"
+        assert engine.get_adapter(temp_dir / "photo.jfif") is custom
+
+    def test_default_engine_is_shared(self):
+        """Test default_engine returns one cached engine instance."""
+        assert default_engine() is default_engine()
+        assert isinstance(default_engine(), MetadataEngine)
 
     def test_strip_metadata_gps_only(self, sample_image_path, temp_dir):
         """Test stripping GPS data only (not all adapters support gps_only)."""
@@ -252,6 +484,25 @@ class TestMetadataEngine:
             assert result == output_path
             assert output_path.exists()
 
+    def test_strip_gps_data_resolves_adapter_once(self, sample_image_path, temp_dir, monkeypatch):
+        """Test strip_gps_data reads and writes through a single adapter lookup."""
+        output_path = temp_dir / f"no_gps_{sample_image_path.name}"
+        calls = []
+        original_get_adapter = self.engine.get_adapter
+
+        def counting_get_adapter(file_path):
+            calls.append(file_path)
+            return original_get_adapter(file_path)
+
+        monkeypatch.setattr(self.engine, "get_adapter", counting_get_adapter)
+
+        result = self.engine.strip_gps_data(sample_image_path, output_path, create_backup=False)
+
+        assert result == output_path
+        assert output_path.exists()
+        assert len(calls) == 1
+        assert not self.engine.has_gps_data(output_path)
+
     def test_export_metadata_unsupported_format(self, sample_image_path, temp_dir):
         """Test error on unsupported export format."""
         export_path = temp_dir / "metadata.txt"
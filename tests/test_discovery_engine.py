@@ -0,0 +1,231 @@
+"""
+Tests for the metadata discovery engine.
+"""
+import pytest
+
+from src.exif_analyzer.discovery.engine import MetadataDiscoveryEngine, _decode_user_comment
+
+
+class TestDecodeUserComment:
+    """Test cases for UserComment decoding."""
+
+    def test_decodes_raw_bytes(self):
+        """Test raw UTF-16 bytes are decoded directly."""
+        comment = "Steps: 20, Seed: 42".encode('utf-16-le')
+
+        assert _decode_user_comment(comment) == "Steps: 20, Seed: 42"
+
+    def test_decodes_bytes_repr_without_eval(self):
+        """Test the repr() form is parsed as a literal, never executed."""
+        comment = repr("Steps: 20".encode('utf-16-le'))
+
+        assert _decode_user_comment(comment) == "Steps: 20"
+        assert _decode_user_comment("b'' + __import__('os').getcwd()") == "b'' + __import__('os').getcwd()"
+
+    def test_passes_text_through(self):
+        """Test plain strings are returned and other types are ignored."""
+        assert _decode_user_comment("Civitai") == "Civitai"
+        assert _decode_user_comment(None) is None
+        assert _decode_user_comment(42) is None
+
+
+class TestDiscoverMany:
+    """Test cases for batch discovery."""
+
+    def _create_images(self, temp_dir):
+        """Create one Stable Diffusion PNG, one plain PNG and a missing path."""
+        from PIL import Image, PngImagePlugin
+
+        info = PngImagePlugin.PngInfo()
+        info.add_text("parameters", "a cat\nSteps: 20, Seed: 42")
+        Image.new("RGB", (16, 16), "red").save(temp_dir / "sd.png", pnginfo=info)
+        Image.new("RGB", (16, 16), "blue").save(temp_dir / "plain.png")
+
+        return [temp_dir / "sd.png", temp_dir / "plain.png", temp_dir / "missing.png"]
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_discover_many_aggregates_results(self, temp_dir, workers):
+        """Test batch discovery counts platforms, fields and failures."""
+        paths = self._create_images(temp_dir)
+
+        batch = MetadataDiscoveryEngine().discover_many(paths, workers=workers)
+
+        assert batch.total_images == 3
+        assert batch.successful == 2
+        assert batch.failed == 1
+        assert [result.file_path for result in batch.results] == paths[:2]
+        assert batch.platform_distribution == {"stable_diffusion": 1, "unknown": 1}
+        assert batch.common_fields["PNG:tEXt:parameters"] == 1
+        assert batch.anomalies[0].startswith(str(paths[2]))
+
+
+class TestMetadataExtractorCache:
+    """Test cases for the extractor's parsed metadata cache."""
+
+    def test_unchanged_file_parsed_once(self, temp_dir, monkeypatch):
+        """Test repeat extraction reuses metadata until the file changes."""
+        import os
+        from PIL import Image
+        from src.exif_analyzer.discovery.extractor import MetadataExtractor
+
+        image_path = temp_dir / "image.png"
+        Image.new("RGB", (16, 16), "red").save(image_path)
+
+        extractor = MetadataExtractor()
+        calls = []
+        read_metadata = extractor.engine.read_metadata
+        monkeypatch.setattr(
+            extractor.engine, "read_metadata",
+            lambda path: calls.append(path) or read_metadata(path)
+        )
+
+        first = extractor.extract_all(image_path)
+        second = extractor.extract_all(image_path)
+        assert len(calls) == 1
+        assert second.standard_metadata == first.standard_metadata
+        assert second.standard_metadata is not first.standard_metadata
+
+        stat_result = image_path.stat()
+        os.utime(image_path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+        extractor.extract_all(image_path)
+        assert len(calls) == 2
+
+    def test_results_do_not_share_metadata(self, temp_dir):
+        """Test changing one discovery result leaves later results intact."""
+        from PIL import Image
+
+        image_path = temp_dir / "image.png"
+        Image.new("RGB", (16, 16), "red").save(image_path)
+
+        engine = MetadataDiscoveryEngine()
+        first = engine.discover(image_path).extracted_metadata.standard_metadata
+        first.custom.set("GPSLatitude", "40.0")
+
+        second = engine.discover(image_path).extracted_metadata.standard_metadata
+        assert "GPSLatitude" not in second.custom.data
+        assert not second.has_gps_data()
+
+
+class TestRawChunkPreview:
+    """Test cases for lazily loaded raw chunk previews."""
+
+    def test_image_chunks_load_preview_on_demand(self, temp_dir):
+        """Test non-text chunks read their preview only when asked for it."""
+        from PIL import Image, PngImagePlugin
+        from src.exif_analyzer.discovery.extractor import MetadataExtractor
+
+        info = PngImagePlugin.PngInfo()
+        info.add_text("parameters", "Steps: 20")
+        image_path = temp_dir / "image.png"
+        Image.new("RGB", (64, 64), "red").save(image_path, pnginfo=info)
+        file_bytes = image_path.read_bytes()
+
+        chunks = {
+            chunk.chunk_type: chunk
+            for chunk in MetadataExtractor().extract_all(image_path).raw_chunks
+        }
+
+        text_chunk = chunks["PNG:tEXt"]
+        assert text_chunk.raw_data == b"parameters\x00Steps: 20"
+
+        idat = chunks["PNG:IDAT"]
+        assert idat.raw_data is None
+        expected = file_bytes[idat.data_offset:idat.data_offset + min(idat.length, 1000)]
+        assert idat.get_raw_data() == expected
+        assert idat.raw_data == expected
+
+
+class TestExtractAIMetadata:
+    """Test cases for Civitai UserComment parsing."""
+
+    def test_parses_prompts_parameters_and_model(self):
+        """Test the A1111 parameter list and Civitai resources are extracted."""
+        from types import SimpleNamespace
+        from src.exif_analyzer.core.metadata import ImageMetadata
+
+        metadata = ImageMetadata(file_path="image.jpg", format="JPEG")
+        metadata.exif.set("UserComment", (
+            "a cat, masterpiece\nNegative prompt: ugly\n"
+            "Steps: 20, Sampler: Euler a, CFG scale: 7.5, Seed: 42, Size: 512x768, "
+            "Model hash: abc, Seed: 7, Civitai resources: "
+            '[{"type":"checkpoint","modelName":"Model","modelVersionName":"v1"}]'
+        ))
+        extracted = SimpleNamespace(standard_metadata=metadata, raw_chunks=[])
+        engine = MetadataDiscoveryEngine()
+
+        detection = engine._detect_platform(extracted)
+        ai_meta = engine._extract_ai_metadata(extracted, detection)
+
+        assert detection.platform_id == "civitai_sd"
+        assert ai_meta.prompts == {"positive": "a cat, masterpiece", "negative": "ugly"}
+        assert ai_meta.parameters == {
+            "steps": 20, "sampler": "Euler a", "cfg_scale": 7.5, "seed": 42, "size": "512x768"
+        }
+        assert (ai_meta.model.name, ai_meta.model.version) == ("Model", "v1")
+
+    def test_skips_malformed_parameter_values(self):
+        """Test values that do not convert are left out instead of raising."""
+        from types import SimpleNamespace
+        from src.exif_analyzer.core.metadata import ImageMetadata
+
+        metadata = ImageMetadata(file_path="image.jpg", format="JPEG")
+        metadata.exif.set("UserComment", "a cat\nSteps: twenty, Seed: 42")
+        extracted = SimpleNamespace(standard_metadata=metadata, raw_chunks=[])
+        engine = MetadataDiscoveryEngine()
+
+        ai_meta = engine._extract_ai_metadata(extracted, engine._detect_platform(extracted))
+
+        assert ai_meta.parameters == {"seed": 42}
+
+    def test_stops_at_end_of_parameter_line(self):
+        """Test lines after the parameter line (e.g. Dynamic Prompts) are not parsed as values."""
+        from types import SimpleNamespace
+        from src.exif_analyzer.core.metadata import ImageMetadata
+
+        metadata = ImageMetadata(file_path="image.jpg", format="JPEG")
+        metadata.exif.set("UserComment", "a cat\nSteps: 20, Seed: 42, Size: 512x768\nTemplate: x")
+        extracted = SimpleNamespace(standard_metadata=metadata, raw_chunks=[])
+        engine = MetadataDiscoveryEngine()
+
+        ai_meta = engine._extract_ai_metadata(extracted, engine._detect_platform(extracted))
+
+        assert ai_meta.parameters == {"steps": 20, "seed": 42, "size": "512x768"}
+
+    def test_parses_fields_without_separating_comma(self):
+        """Test a missing comma between fields does not lose either field."""
+        from types import SimpleNamespace
+        from src.exif_analyzer.core.metadata import ImageMetadata
+
+        metadata = ImageMetadata(file_path="image.jpg", format="JPEG")
+        metadata.exif.set("UserComment", "a cat\nSteps: 20 Sampler: Euler")
+        extracted = SimpleNamespace(standard_metadata=metadata, raw_chunks=[])
+        engine = MetadataDiscoveryEngine()
+
+        ai_meta = engine._extract_ai_metadata(extracted, engine._detect_platform(extracted))
+
+        assert ai_meta.parameters == {"steps": 20, "sampler": "Euler"}
+
+
+class TestBatchDiscoveryResult:
+    """Test cases for BatchDiscoveryResult aggregation."""
+
+    def test_from_results_counts_platforms_and_fields(self, temp_dir):
+        """Test results and failures are aggregated in one pass."""
+        from pathlib import Path
+        from src.exif_analyzer.discovery.models import BatchDiscoveryResult
+        from src.exif_analyzer.discovery.engine import MetadataDiscoveryEngine as Engine
+
+        paths = TestDiscoverMany()._create_images(temp_dir)
+        engine = Engine()
+        results = [engine.discover(path) for path in paths[:2]] * 2
+
+        batch = BatchDiscoveryResult.from_results(
+            iter(results), [(Path("missing.png"), OSError("gone"))], total_time=1.5
+        )
+
+        assert (batch.total_images, batch.successful, batch.failed) == (5, 4, 1)
+        assert batch.platform_distribution == {"stable_diffusion": 2, "unknown": 2}
+        assert batch.common_fields == {"PNG:tEXt:parameters": 2}
+        assert batch.anomalies == ["missing.png: gone"]
+        assert batch.total_time == 1.5
+        assert type(batch.platform_distribution) is dict
@@ -2,13 +2,14 @@
 Tests for file safety mechanisms and integrity checks.
 """
 import pytest
+import sys
 import tempfile
 import shutil
 import hashlib
 from pathlib import Path
 from PIL import Image
 
-from src.exif_analyzer.core.file_safety import FileSafetyManager
+from src.exif_analyzer.core.file_safety import FileSafetyManager, _fast_copy
 from src.exif_analyzer.core.exceptions import FileError, PixelDataCorruptionError, BackupError
 
 
@@ -19,10 +20,14 @@ class TestFileSafetyManager:
         """Set up test environment."""
         self.safety_manager = FileSafetyManager()
 
+    @pytest.fixture(autouse=True)
+    def image_bytes(self, sample_image_bytes):
+        """Make the session's pre-encoded JPEG available to every test."""
+        self.image_bytes = sample_image_bytes
+
     def create_test_image(self, path: Path) -> Path:
         """Create a test image file."""
-        img = Image.new('RGB', (100, 100), color='red')
-        img.save(path, format='JPEG')
+        path.write_bytes(self.image_bytes)
         return path
 
     def get_file_hash(self, file_path: Path) -> str:
@@ -77,6 +82,33 @@ class TestFileSafetyManager:
         assert backup_path.parent == backup_dir
         assert backup_dir.exists()  # Should be created
 
+    def test_create_backup_same_second_unique(self, temp_dir):
+        """Test back-to-back backups of one file never overwrite each other."""
+        test_file = temp_dir / "test.jpg"
+        self.create_test_image(test_file)
+
+        backups = [self.safety_manager.create_backup(test_file) for _ in range(5)]
+
+        assert len(set(backups)) == 5
+        assert all(backup.exists() for backup in backups)
+
+    def test_backup_dir_created_once(self, temp_dir, monkeypatch):
+        """Test repeated backups do not re-create the backup directory."""
+        backup_dir = temp_dir / "backups"
+        manager = FileSafetyManager(backup_dir=backup_dir)
+        test_file = temp_dir / "test.jpg"
+        self.create_test_image(test_file)
+
+        manager.create_backup(test_file)
+        assert backup_dir.exists()
+
+        mkdir_calls = []
+        monkeypatch.setattr(Path, "mkdir", lambda self, *args, **kwargs: mkdir_calls.append(self))
+        manager.create_backup(test_file, backup_dir / "second.jpg")
+
+        assert mkdir_calls == []
+        assert (backup_dir / "second.jpg").exists()
+
     def test_create_backup_basic(self, temp_dir):
         """Test basic backup creation."""
         test_file = temp_dir / "test.jpg"
@@ -153,9 +185,9 @@ class TestFileSafetyManager:
         # Test successful operation
         with self.safety_manager.safe_file_operation(test_file, create_backup=True) as temp_path:
             assert temp_path != test_file
-            assert temp_path.exists()
+            assert temp_path.parent == test_file.parent
 
-            # Modify the temporary file
+            # Write the full output to the temporary file
             img = Image.new('RGB', (100, 100), color='blue')
             img.save(temp_path, format='JPEG')
 
@@ -191,9 +223,15 @@ class TestFileSafetyManager:
         test_file = temp_dir / "test.jpg"
         self.create_test_image(test_file)
 
+        original_hash = self.get_file_hash(test_file)
+
         with self.safety_manager.safe_file_operation(test_file, create_backup=False) as temp_path:
             assert temp_path != test_file
-            assert temp_path.exists()
+            # Nothing is copied up front; callers write the complete output
+            assert not temp_path.exists()
+
+        # Nothing was written, so the original is untouched
+        assert self.get_file_hash(test_file) == original_hash
 
     def test_cleanup_backups(self, temp_dir):
         """Test cleanup of old backup files."""
@@ -279,6 +317,58 @@ class TestFileSafetyManager:
         assert hash1 == hash2
         assert len(hash1) == 64  # SHA-256 hex digest length
 
+    @pytest.mark.parametrize("clone_available", [True, False])
+    def test_fast_copy_preserves_content_and_mtime(self, temp_dir, monkeypatch, clone_available):
+        """Test _fast_copy matches copy2 with and without filesystem cloning."""
+        import os
+        from src.exif_analyzer.core import file_safety
+
+        if not clone_available:
+            monkeypatch.setattr(file_safety, "_clone_file", lambda src, dst: False)
+
+        source = temp_dir / "source.jpg"
+        self.create_test_image(source)
+        os.utime(source, (1_000_000_000, 1_000_000_000))
+        destination = temp_dir / "copy.jpg"
+
+        _fast_copy(source, destination)
+
+        assert destination.read_bytes() == source.read_bytes()
+        assert destination.stat().st_mtime == source.stat().st_mtime
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux copy fallbacks")
+    def test_clone_file_sendfile_fallback(self, temp_dir, monkeypatch):
+        """Test _clone_file copies with sendfile when clone and copy_file_range fail."""
+        import fcntl
+        import os
+        from src.exif_analyzer.core import file_safety
+
+        def unsupported(*args, **kwargs):
+            raise OSError("unsupported")
+
+        monkeypatch.setattr(fcntl, "ioctl", unsupported)
+        monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+
+        source = temp_dir / "source.bin"
+        source.write_bytes(bytes(range(256)) * 8192)
+        destination = temp_dir / "copy.bin"
+
+        assert file_safety._clone_file(source, destination)
+        assert destination.read_bytes() == source.read_bytes()
+
+    def test_calculate_file_hash_chunked_fallback(self, temp_dir, monkeypatch):
+        """Test the readinto fallback matches hashlib across chunk boundaries."""
+        from src.exif_analyzer.core.config import config
+
+        test_file = temp_dir / "data.bin"
+        data = bytes(range(256)) * 100
+        test_file.write_bytes(data)
+
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        monkeypatch.setitem(config._config["integrity"], "file_hash_chunk_size", 1000)
+
+        assert self.safety_manager.calculate_file_hash(test_file) == hashlib.sha256(data).hexdigest()
+
     def test_file_safety_with_permissions(self, temp_dir):
         """Test file safety with permission issues."""
         test_file = temp_dir / "test.jpg"
@@ -318,8 +408,8 @@ class TestFileSafetyManager:
         # Test that context manager handles errors properly
         try:
             with self.safety_manager.safe_file_operation(test_file) as temp_path:
-                # Simulate error during operation
-                temp_path.unlink()  # Delete the temp file
+                # Simulate error after a partial write
+                temp_path.write_bytes(b"partial")
                 raise RuntimeError("Simulated error")
         except RuntimeError:
             pass
@@ -386,13 +476,12 @@ class TestFileSafetyManager:
 
         # Test successful operation that modifies temp file content
         with self.safety_manager.safe_file_operation(test_file, create_backup=True) as temp_path:
-            assert temp_path.exists()
-
             # Modify the temp file in a way that would be detectable
             temp_path.write_bytes(b"modified content")
 
         # Test that original file was updated
         assert test_file.exists()
+        assert test_file.read_bytes() == b"modified content"
 
     def test_cleanup_backups_edge_cases(self, temp_dir):
         """Test cleanup backups with edge cases."""
@@ -410,6 +499,35 @@ class TestFileSafetyManager:
         removed_count = self.safety_manager.cleanup_backups(test_file, keep_count=0)
         assert removed_count >= 0
 
+    def test_cleanup_backups_keeps_newest(self, temp_dir):
+        """Test cleanup removes the oldest backups by modification time."""
+        import os
+
+        test_file = temp_dir / "photo.jpg"
+        self.create_test_image(test_file)
+
+        backups = []
+        for i in range(4):
+            backup = temp_dir / f"photo.backup.{1000 + i}.jpg"
+            backup.write_bytes(b"backup")
+            os.utime(backup, (1_000_000 + i, 1_000_000 + i))
+            backups.append(backup)
+        unrelated = temp_dir / "other.backup.1000.jpg"
+        unrelated.write_bytes(b"other")
+
+        removed_count = self.safety_manager.cleanup_backups(test_file, keep_count=2)
+
+        assert removed_count == 2
+        assert [b.exists() for b in backups] == [False, False, True, True]
+        assert unrelated.exists()
+
+    def test_cleanup_backups_missing_backup_dir(self, temp_dir):
+        """Test cleanup with a backup directory that does not exist."""
+        manager = FileSafetyManager(backup_dir=temp_dir / "missing")
+        test_file = temp_dir / "photo.jpg"
+
+        assert manager.cleanup_backups(test_file) == 0
+
     def test_get_temp_copy_with_permissions(self, temp_dir):
         """Test get_temp_copy with permission scenarios."""
         test_file = temp_dir / "test_temp_perms.jpg"
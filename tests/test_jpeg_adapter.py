@@ -101,6 +101,27 @@ class TestJPEGAdapter:
         # Should detect GPS data
         assert metadata.has_gps_data()
 
+    def test_probe_matches_read_metadata(self, temp_dir):
+        """Test header-only probe agrees with a full metadata read."""
+        with_exif = self.create_test_jpeg_with_exif(temp_dir / "with_exif.jpg")
+        plain = temp_dir / "plain.jpg"
+        Image.new('RGB', (100, 100), color='red').save(plain, "JPEG")
+
+        assert self.adapter.probe(with_exif) == self.adapter.HAS_META | self.adapter.HAS_GPS
+        assert self.adapter.probe(plain) == 0
+
+        for path in (with_exif, plain):
+            metadata = self.adapter.read_metadata(path)
+            assert self.adapter.probe(path) == self.adapter._probe_flags(metadata)
+
+    def test_probe_invalid_file(self, temp_dir):
+        """Test probe rejects files that are not JPEGs."""
+        fake_jpeg = temp_dir / "fake.jpg"
+        fake_jpeg.write_bytes(b"not a jpeg")
+
+        with pytest.raises(MetadataError):
+            self.adapter.probe(fake_jpeg)
+
     def test_strip_metadata(self, temp_dir):
         """Test metadata stripping."""
         jpeg_file = temp_dir / "test_with_exif.jpg"
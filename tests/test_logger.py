@@ -0,0 +1,59 @@
+"""
+Tests for logger configuration.
+"""
+import logging
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+from src.exif_analyzer.core.logger import setup_logger
+
+
+class TestSetupLogger:
+    """Test cases for setup_logger."""
+
+    def test_file_logging_through_queue(self, temp_dir):
+        """Test file records are queued, then flushed when the logger is reset."""
+        log_file = temp_dir / "logs" / "run.log"
+        logger = setup_logger("exif_analyzer_test_file", log_file=log_file, console=False)
+
+        assert [type(h) for h in logger.handlers] == [logging.handlers.QueueHandler]
+
+        logger.info("first record")
+        logger.info("second record")
+
+        # Reconfiguring stops the listener, which drains and flushes the file
+        setup_logger("exif_analyzer_test_file", console=False)
+
+        content = log_file.read_text()
+        assert "INFO - first record" in content
+        assert "INFO - second record" in content
+
+    def test_file_logging_complete_at_exit(self, temp_dir):
+        """Test every record reaches the file when the interpreter exits normally."""
+        log_file = temp_dir / "exit.log"
+        script = textwrap.dedent(f"""
+            import sys
+            from pathlib import Path
+            sys.path.insert(0, {str(Path(__file__).resolve().parent.parent)!r})
+            from src.exif_analyzer.core.logger import setup_logger
+
+            logger = setup_logger("exif_analyzer", log_file=Path({str(log_file)!r}), console=False)
+            for i in range(500):
+                logger.info("record %d", i)
+        """)
+
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=60)
+
+        assert result.returncode == 0
+        assert result.stderr == ""
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 500
+        assert lines[-1].endswith("INFO - record 499")
+
+    def test_console_only_has_no_queue(self):
+        """Test loggers without a log file write to the console directly."""
+        logger = setup_logger("exif_analyzer_test_console")
+
+        assert [type(h) for h in logger.handlers] == [logging.StreamHandler]
@@ -3,7 +3,7 @@ Tests for ImageMetadata and MetadataBlock classes.
 """
 import pytest
 from pathlib import Path
-from src.exif_analyzer.core.metadata import ImageMetadata, MetadataBlock
+from src.exif_analyzer.core.metadata import ImageMetadata, MetadataBlock, compile_key_patterns
 from src.exif_analyzer.core.exceptions import ValidationError
 
 
@@ -70,6 +70,14 @@ class TestMetadataBlock:
         self.block.remove("key1")
         assert self.block.is_empty() is True
 
+    def test_len(self):
+        """Test len() counts the keys without building a key list."""
+        assert len(self.block) == 0
+
+        self.block.set("key1", "value1")
+        self.block.set("key2", "value2")
+        assert len(self.block) == 2
+
     def test_clear(self):
         """Test clearing all data."""
         self.block.set("key1", "value1")
@@ -79,6 +87,51 @@ class TestMetadataBlock:
         assert self.block.is_empty()
         assert len(self.block.data) == 0
 
+    def test_empty_blocks_share_data_until_first_write(self):
+        """Test unwritten blocks share one read-only dict that still serializes."""
+        import copy
+        import json
+        import pickle
+
+        other = MetadataBlock("other")
+        assert self.block.data is other.data
+        assert self.block.remove("missing") is False
+        assert self.block.clear() == 0
+        assert json.dumps(self.block.data) == "{}"
+        assert pickle.loads(pickle.dumps(self.block)).data is other.data
+        assert copy.deepcopy(self.block).data is other.data
+
+        with pytest.raises(TypeError):
+            self.block.data["key"] = "value"
+
+        self.block.set("key", "value")
+        assert self.block.data == {"key": "value"}
+        assert other.is_empty()
+
+    def test_iter_lower_keys(self):
+        """Test lowercased keys are computed once and dropped with their key."""
+        self.block.set("GPSLatitude", "37.7749 N")
+        self.block.data["Make"] = "Canon"  # Direct dict writes are picked up too
+
+        assert list(self.block._iter_lower_keys()) == [
+            ("GPSLatitude", "gpslatitude"),
+            ("Make", "make"),
+        ]
+        cached = self.block._lower_keys["GPSLatitude"]
+        assert next(self.block._iter_lower_keys())[1] is cached
+
+        self.block.remove("GPSLatitude")
+        assert "GPSLatitude" not in self.block._lower_keys
+
+    def test_clear_method(self):
+        """Test clear removes all keys and returns how many there were."""
+        self.block.set("key1", "value1")
+        self.block.set("key2", None)
+
+        assert self.block.clear() == 2
+        assert self.block.is_empty()
+        assert self.block.clear() == 0
+
 
 class TestImageMetadata:
     """Test cases for ImageMetadata."""
@@ -123,6 +176,44 @@ class TestImageMetadata:
         assert metadata.get_block("custom") == metadata.custom
         assert metadata.get_block("nonexistent") is None
 
+    def test_blocks_created_on_first_access(self):
+        """Test blocks are only allocated when used."""
+        metadata = ImageMetadata(file_path=self.test_file, format="JPEG")
+        metadata.exif.set("Make", "Canon")
+
+        assert metadata.has_metadata() is True
+        assert metadata.get_privacy_sensitive_keys() == [("exif", "Make")]
+        assert list(metadata._blocks) == ["exif"]
+
+        data = metadata.to_dict()["metadata"]
+        assert data == {"exif": {"Make": "Canon"}, "iptc": {}, "xmp": {}, "custom": {}}
+        assert list(metadata._blocks) == ["exif"]
+
+    def test_equality_ignores_unused_blocks(self):
+        """Test a block that was only accessed equals one never created."""
+        metadata1 = ImageMetadata(file_path=self.test_file, format="JPEG")
+        metadata2 = ImageMetadata(file_path=self.test_file, format="JPEG")
+        metadata1.exif.set("Make", "Canon")
+        metadata2.exif.set("Make", "Canon")
+        metadata2.xmp.is_empty()
+
+        assert metadata1 == metadata2
+        metadata2.iptc.set("Artist", "John Doe")
+        assert metadata1 != metadata2
+
+    def test_copy_is_independent(self):
+        """Test changing a copy leaves the original unchanged."""
+        metadata = ImageMetadata(file_path=self.test_file, format="JPEG", file_size=10)
+        metadata.exif.set("GPSLatitude", "40.0")
+
+        clone = metadata.copy()
+        assert clone == metadata
+
+        clone.strip_gps_data()
+        clone.iptc.set("Artist", "John Doe")
+        assert metadata.exif.get("GPSLatitude") == "40.0"
+        assert metadata.iptc.is_empty()
+
     def test_iter_blocks(self):
         """Test iter_blocks method."""
         metadata = ImageMetadata(file_path=self.test_file, format="JPEG")
@@ -249,6 +340,24 @@ class TestImageMetadata:
         assert removed_count == 0
         assert "Make" in metadata.exif.data
 
+    def test_key_classification_follows_block_changes(self):
+        """Test cached key classification is refreshed after blocks change."""
+        metadata = ImageMetadata(file_path=self.test_file, format="JPEG")
+        metadata.exif.set("Make", "Canon")
+
+        assert metadata.has_gps_data() is False
+        assert metadata._classify_keys() is metadata._classify_keys()
+
+        metadata.exif.set("GPSLatitude", "37.7749 N")
+        assert metadata.has_gps_data() is True
+
+        assert metadata.strip_gps_data() == 1
+        assert metadata.has_gps_data() is False
+        assert metadata.get_privacy_sensitive_keys() == [("exif", "Make")]
+
+        metadata.exif.data = {"GPSAltitude": 10}
+        assert metadata.has_gps_data() is True
+
     def test_strip_all_metadata(self):
         """Test strip_all_metadata removes all metadata."""
         metadata = ImageMetadata(file_path=self.test_file, format="JPEG")
@@ -317,6 +426,42 @@ class TestImageMetadata:
         assert "\n" in json_str
         assert "  " in json_str  # Indentation spaces
 
+    def test_to_json_integer_beyond_64_bits(self):
+        """Test values orjson cannot encode fall back to the stdlib encoder."""
+        import json
+
+        metadata = ImageMetadata(file_path=self.test_file, format="JPEG")
+        metadata.exif.set("MakerNoteValue", 2 ** 70)
+
+        assert json.loads(metadata.to_json())["metadata"]["exif"]["MakerNoteValue"] == 2 ** 70
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_round_trip(self, monkeypatch, use_orjson):
+        """Test to_json/from_json agree with and without orjson installed."""
+        import json
+        from src.exif_analyzer.core import metadata as metadata_module
+        from src.exif_analyzer.core.exceptions import MetadataError
+
+        if not use_orjson:
+            monkeypatch.setattr(metadata_module, "orjson", None)
+        elif metadata_module.orjson is None:
+            pytest.skip("orjson not installed")
+
+        metadata = ImageMetadata(file_path=self.test_file, format="JPEG", file_size=10)
+        metadata.exif.set("Make", "Canon")
+        metadata.exif.set(271, b"raw")
+
+        json_str = metadata.to_json()
+        assert json.loads(json_str) == json.loads(json.dumps(metadata.to_dict(), default=str))
+
+        restored = ImageMetadata.from_json(json_str.encode("utf-8"))
+        assert restored.exif.get("Make") == "Canon"
+        assert restored.exif.get("271") == "b'raw'"
+        assert restored.file_size == 10
+
+        with pytest.raises(MetadataError):
+            ImageMetadata.from_json("{not json")
+
     def test_str_representation(self):
         """Test string representation."""
         metadata = ImageMetadata(file_path=self.test_file, format="JPEG")
@@ -334,3 +479,23 @@ class TestImageMetadata:
 
         assert "ImageMetadata" in repr_str
         assert "JPEG" in repr_str
+
+
+class TestCompileKeyPatterns:
+    """Test cases for compile_key_patterns."""
+
+    def test_matches_any_literal_pattern(self):
+        """Test the alternation matches each pattern literally."""
+        pattern = compile_key_patterns(("gps", "f.number"))
+
+        assert pattern.search("exif:gpslatitude")
+        assert pattern.search("f.number")
+        assert not pattern.search("fxnumber")
+
+    def test_empty_patterns_never_match(self):
+        """Test an empty pattern tuple matches no key."""
+        assert compile_key_patterns(()).search("anything") is None
+
+    def test_compiled_once_per_pattern_set(self):
+        """Test repeated calls reuse the compiled pattern."""
+        assert compile_key_patterns(("make", "model")) is compile_key_patterns(("make", "model"))
@@ -181,6 +181,43 @@ class TestPNGAdapter:
         assert original_pixels == processed_pixels
         assert original_img.size == processed_img.size
 
+    def test_structural_hash_ignores_metadata_chunks(self, temp_dir):
+        """Test the structural hash covers image data but not text chunks."""
+        plain = self.create_test_png(temp_dir / "plain.png")
+        tagged = self.create_test_png(temp_dir / "tagged.png", with_metadata=True)
+        other = temp_dir / "other.png"
+        Image.new('RGB', (100, 100), color='red').save(other, format="PNG")
+
+        plain_hash = self.adapter.get_structural_hash(plain)
+
+        assert plain_hash is not None
+        assert self.adapter.get_structural_hash(tagged) == plain_hash
+        assert self.adapter.get_structural_hash(other) != plain_hash
+
+    def test_structural_hash_invalid_file(self, temp_dir):
+        """Test files that are not PNGs have no structural hash."""
+        invalid = temp_dir / "invalid.png"
+        invalid.write_bytes(b"not a png at all")
+
+        assert self.adapter.get_structural_hash(invalid) is None
+        assert self.adapter.get_structural_hash(temp_dir / "missing.png") is None
+
+        empty = temp_dir / "empty.png"
+        empty.touch()
+        assert self.adapter.get_structural_hash(empty) is None
+
+    def test_verify_pixel_integrity_skips_decode_for_equal_image_data(self, temp_dir, monkeypatch):
+        """Test files with identical image chunks are accepted without decoding."""
+        plain = self.create_test_png(temp_dir / "plain.png")
+        tagged = self.create_test_png(temp_dir / "tagged.png", with_metadata=True)
+
+        def fail_decode(*args):
+            raise AssertionError("pixels should not be decoded")
+
+        monkeypatch.setattr(self.adapter, "_pixels_equal_streamed", fail_decode)
+
+        assert self.adapter.verify_pixel_integrity(plain, tagged) is True
+
     def test_has_gps_data_detection(self, temp_dir):
         """Test GPS data detection in PNG metadata."""
         test_image = temp_dir / "test_gps_detect.png"
@@ -206,6 +243,25 @@ class TestPNGAdapter:
         metadata_no_gps = self.adapter.read_metadata(test_image_no_gps)
         assert not metadata_no_gps.has_gps_data()
 
+    def test_probe_matches_read_metadata(self, temp_dir):
+        """Test text-chunk probe agrees with a full metadata read."""
+        gps_image = temp_dir / "probe_gps.png"
+        img = Image.new('RGB', (100, 100), color='yellow')
+        pnginfo = PngImagePlugin.PngInfo()
+        pnginfo.add_text("GPS_Latitude", "40.7128")
+        img.save(gps_image, format="PNG", pnginfo=pnginfo)
+
+        titled_image = self.create_test_png(temp_dir / "probe_title.png", with_metadata=True)
+        plain_image = self.create_test_png(temp_dir / "probe_plain.png")
+
+        assert self.adapter.probe(gps_image) == self.adapter.HAS_META | self.adapter.HAS_GPS
+        assert self.adapter.probe(titled_image) == self.adapter.HAS_META
+        assert self.adapter.probe(plain_image) == 0
+
+        for path in (gps_image, titled_image, plain_image):
+            metadata = self.adapter.read_metadata(path)
+            assert self.adapter.probe(path) == self.adapter._probe_flags(metadata)
+
     def test_xmp_metadata_handling(self, temp_dir):
         """Test XMP metadata handling in PNG."""
         test_image = temp_dir / "test_xmp.png"
@@ -0,0 +1,87 @@
+"""
+Tests for CLI progress reporting and batch processing utilities.
+"""
+import pytest
+from pathlib import Path
+
+from src.exif_analyzer.cli.progress import BatchProcessor, ProgressReporter, format_file_size
+
+
+class TestProgressReporter:
+    """Test cases for ProgressReporter."""
+
+    def test_update_counts_completed_and_errors(self):
+        """Test that update tracks completed and failed items."""
+        reporter = ProgressReporter(show_progress=False)
+        reporter.start(3)
+
+        reporter.update("a.jpg")
+        reporter.update("b.jpg", error=True)
+        reporter.update_unlocked("c.jpg")
+
+        assert reporter._completed == 3
+        assert reporter._errors == 1
+
+    def test_update_unlocked_does_not_take_lock(self):
+        """Test that update_unlocked works while the lock is held elsewhere."""
+        reporter = ProgressReporter(show_progress=False)
+        reporter.start(2)
+
+        with reporter._lock:
+            reporter.update_unlocked("a.jpg")
+
+        assert reporter._completed == 1
+
+    def test_update_output_format(self, capsys):
+        """Test progress line layout, including long-name truncation."""
+        reporter = ProgressReporter(show_progress=True)
+        reporter.start(2, "Stripping")
+
+        reporter.update(Path("/some/dir/photo.jpg"))
+        reporter.update("x" * 40 + ".jpg", error=True)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == "Stripping 2 files..."
+        assert lines[1] == "  [  1/2]  50.0% - OK    - photo.jpg"
+        assert lines[2] == "  [  2/2] 100.0% - ERROR - ..." + "x" * 23 + ".jpg"
+
+
+class TestBatchProcessor:
+    """Test cases for BatchProcessor."""
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_process_files_keys_results_by_path(self, tmp_path, max_workers):
+        """Test that results are keyed by the input Path objects."""
+        files = [tmp_path / f"file_{i}.jpg" for i in range(3)]
+        processor = BatchProcessor(max_workers=max_workers, show_progress=False)
+
+        def operation(file_path: Path) -> str:
+            if file_path.name == "file_1.jpg":
+                raise ValueError("boom")
+            return file_path.stem
+
+        results = processor.process_files(files, operation)
+
+        assert set(results) == set(files)
+        assert results[files[0]] == "file_0"
+        assert isinstance(results[files[1]], ValueError)
+        assert processor.progress._completed == 3
+        assert processor.progress._errors == 1
+
+
+class TestFormatFileSize:
+    """Test cases for format_file_size."""
+
+    @pytest.mark.parametrize("size_bytes, expected", [
+        (0, "0.0 B"),
+        (1023, "1023.0 B"),
+        (1024, "1.0 KB"),
+        (1536, "1.5 KB"),
+        ((1 << 20) - 1, "1024.0 KB"),
+        (5 * (1 << 30), "5.0 GB"),
+        (1 << 40, "1.0 TB"),
+        (1 << 50, "1024.0 TB"),
+    ])
+    def test_picks_unit_by_magnitude(self, size_bytes, expected):
+        """Test sizes are scaled to the largest unit below them, capped at TB."""
+        assert format_file_size(size_bytes) == expected